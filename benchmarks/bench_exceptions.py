@@ -0,0 +1,77 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Compare the costful and zero-cost exception models on call-heavy code.
+All calls in a recursive fib are checked for a bad return value, lowered
+with either model and interpreted. Usage:
+
+    python benchmarks/bench_exceptions.py [-n repeat]
+"""
+
+from __future__ import print_function, division, absolute_import
+
+import sys
+import time
+import argparse
+from os.path import dirname, abspath
+
+sys.path.insert(0, dirname(dirname(abspath(__file__))))
+
+from pykit import types
+from pykit.parsing import from_c
+from pykit.ir import Const, interp
+from pykit.lower import lower_calls, lower_errcheck
+
+source = """
+#include <pykit_ir.h>
+
+Int32 fib(Int32 n) {
+    if (n < 2) {
+        return n;
+    }
+    Int32 a = n - 1;
+    Int32 b = n - 2;
+    Int32 x = call(fib, list(a));
+    Int32 y = call(fib, list(b));
+    return x + y;
+}
+"""
+
+def lowered(model):
+    func = from_c(source).get_function("fib")
+    for op in func.ops:
+        if op.opcode == 'call':
+            op.add_metadata({"exc.badval": Const(-1, types.Int32)})
+    lower_calls.run(func, {})
+    lower_errcheck.run(func, {"exceptions.model": model})
+    return func
+
+def count_ops(func, args):
+    profile = interp.Profile()
+    interp.run(func, args=args, profile=profile)
+    return sum(profile.counts.values())
+
+def best_of(repeat, func, args):
+    times = []
+    for i in range(repeat):
+        t = time.time()
+        interp.run(func, args=args)
+        times.append(time.time() - t)
+    return min(times)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("-n", "--repeat", type=int, default=5)
+    parser.add_argument("-a", "--arg", type=int, default=16)
+    args = parser.parse_args()
+
+    funcargs = [args.arg]
+    for model in sorted(lower_errcheck.exception_models):
+        func = lowered(model)
+        nops = count_ops(func, funcargs)
+        t = best_of(args.repeat, func, funcargs)
+        print("%-10s %8d ops %10.2f ms" % (model, nops, t * 1000))
+
+if __name__ == "__main__":
+    main()
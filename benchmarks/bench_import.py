@@ -0,0 +1,62 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Measure the time it takes to import pykit (or a pykit submodule) in a fresh
+interpreter, and report which heavy dependencies got pulled in. Usage:
+
+    python benchmarks/bench_import.py [module ...] [-n repeat]
+"""
+
+from __future__ import print_function, division, absolute_import
+
+import sys
+import time
+import argparse
+import subprocess
+from os.path import dirname, abspath
+
+root = dirname(dirname(abspath(__file__)))
+
+heavy_modules = ['numpy', 'networkx', 'llvm', 'llvmmath', 'ply',
+                 'pykit.deps.pycparser']
+
+script = """
+import sys, time
+t = time.time()
+import %(module)s
+t = time.time() - t
+heavy = [m for m in %(heavy)r if sys.modules.get(m)]
+print("%%f %%s" %% (t, ",".join(heavy)))
+"""
+
+def time_import(module):
+    """Import `module` in a subprocess, return (seconds, [heavy modules])"""
+    code = script % dict(module=module, heavy=heavy_modules)
+    out = subprocess.check_output([sys.executable, "-c", code], cwd=root)
+    t, _, heavy = out.decode('ascii').strip().partition(" ")
+    return float(t), heavy.split(",") if heavy else []
+
+def bench(module, repeat):
+    times = []
+    for i in range(repeat):
+        t, heavy = time_import(module)
+        times.append(t)
+    times.sort()
+    print("%-24s best %7.2f ms   median %7.2f ms   heavy: %s" % (
+        module, times[0] * 1000, times[len(times) // 2] * 1000,
+        ", ".join(heavy) or "-"))
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("modules", nargs="*",
+                        default=["pykit", "pykit.ir", "pykit.environment",
+                                 "pykit.parsing"])
+    parser.add_argument("-n", "--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    for module in args.modules:
+        bench(module, args.repeat)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Measure the speed of the IR interpreter on a call-heavy function (recursive
+fib) and a loop, in interpreted operations per second. Usage:
+
+    python benchmarks/bench_interp.py [-n repeat]
+"""
+
+from __future__ import print_function, division, absolute_import
+
+import sys
+import time
+import argparse
+from os.path import dirname, abspath
+
+sys.path.insert(0, dirname(dirname(abspath(__file__))))
+
+from pykit.parsing import from_c
+from pykit.ir import interp
+
+source = """
+#include <pykit_ir.h>
+
+Int32 fib(Int32 n) {
+    if (n < 2) {
+        return n;
+    }
+    Int32 a = n - 1;
+    Int32 b = n - 2;
+    Int32 x = call(fib, list(a));
+    Int32 y = call(fib, list(b));
+    return x + y;
+}
+
+Int32 loop(Int32 n) {
+    Int32 i, sum = 0;
+    for (i = 0; i < n; i = i + 1) {
+        sum = sum + i;
+    }
+    return sum;
+}
+"""
+
+benchmarks = [("fib", [16]), ("loop", [10000])]
+
+def count_ops(func, args):
+    profile = interp.Profile()
+    interp.run(func, args=args, profile=profile)
+    return sum(profile.counts.values())
+
+def best_of(repeat, func, args):
+    times = []
+    for i in range(repeat):
+        t = time.time()
+        interp.run(func, args=args)
+        times.append(time.time() - t)
+    return min(times)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("-n", "--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    mod = from_c(source)
+    for name, funcargs in benchmarks:
+        func = mod.get_function(name)
+        nops = count_ops(func, funcargs)
+        t = best_of(args.repeat, func, funcargs)
+        print("%-8s %8d ops %10.2f ms %12.0f ops/sec" % (
+            name, nops, t * 1000, nops / t))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Measure the throughput of the pretty-printed IR parser (and, for reference,
+the pretty printer and the C-IR parser) in operations per second. Usage:
+
+    python benchmarks/bench_ir_parser.py [-f functions] [-n repeat]
+"""
+
+from __future__ import print_function, division, absolute_import
+
+import sys
+import time
+import argparse
+from os.path import dirname, abspath
+
+sys.path.insert(0, dirname(dirname(abspath(__file__))))
+
+from pykit.ir.pretty import pretty
+from pykit.parsing import from_c, irparser
+
+template = """
+int f%(n)d(int n, float x) {
+    int i, sum = 0;
+    float y = x * x;
+    for (i = 0; i < n; i = i + 1) {
+        if (i < 10) {
+            sum = sum + i;
+        } else {
+            sum = sum * 2;
+        }
+    }
+    return sum;
+}
+"""
+
+def make_source(nfuncs):
+    return "#include <pykit_ir.h>\n" + "".join(template % dict(n=n)
+                                                for n in range(nfuncs))
+
+def best_of(repeat, f, *args):
+    times = []
+    for i in range(repeat):
+        t = time.time()
+        f(*args)
+        times.append(time.time() - t)
+    return min(times)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("-f", "--functions", type=int, default=100)
+    parser.add_argument("-n", "--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    source = make_source(args.functions)
+    mod = from_c(source)
+    text = pretty(mod)
+    nops = sum(len(list(f.ops)) for f in mod.functions.values())
+
+    print("%d functions, %d ops, %d bytes of IR" % (
+        args.functions, nops, len(text)))
+    for name, f, arg in [("irparser.parse", irparser.parse, text),
+                         ("pretty", pretty, mod),
+                         ("from_c", from_c, source)]:
+        t = best_of(args.repeat, f, arg)
+        print("%-16s %8.2f ms   %10.0f ops/sec" % (name, t * 1000, nops / t))
+
+if __name__ == "__main__":
+    main()
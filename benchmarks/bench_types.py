@@ -0,0 +1,92 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Measure type construction, hashing and comparison, directly and through
+type-heavy passes (typedef resolution and verification). Usage:
+
+    python benchmarks/bench_types.py [-f functions] [-n repeat]
+"""
+
+from __future__ import print_function, division, absolute_import
+
+import sys
+import time
+import argparse
+from os.path import dirname, abspath
+
+sys.path.insert(0, dirname(dirname(abspath(__file__))))
+
+from pykit import types
+from pykit.parsing import from_c
+from pykit.ir import verify
+from pykit.codegen import resolve_typedefs
+
+template = """
+int f%(n)d(int n, float x) {
+    int i, sum = 0;
+    float y = x * x;
+    for (i = 0; i < n; i = i + 1) {
+        if (i < 10) {
+            sum = sum + i;
+        } else {
+            sum = sum * 2;
+        }
+    }
+    return sum;
+}
+"""
+
+def make_module(nfuncs):
+    source = "#include <pykit_ir.h>\n" + "".join(template % dict(n=n)
+                                                  for n in range(nfuncs))
+    return from_c(source)
+
+signature = lambda: types.Function(
+    types.Pointer(types.Struct(['x', 'y'], [types.Int32, types.Float64])),
+    [types.Int32, types.Pointer(types.Int8), types.Float64])
+
+def construct(n=10000):
+    for i in range(n):
+        signature()
+
+def hash_and_compare(n=10000):
+    a, b = signature(), signature()
+    table = { a: 0 }
+    for i in range(n):
+        table[b]
+        a == b
+
+def resolve(mod):
+    env = { 'types.typedefmap': resolve_typedefs.typedef_map }
+    for func in mod.functions.values():
+        resolve_typedefs.run(func, env)
+
+def verify_module(mod):
+    for func in mod.functions.values():
+        verify(func)
+
+def best_of(repeat, f, *args):
+    times = []
+    for i in range(repeat):
+        t = time.time()
+        f(*args)
+        times.append(time.time() - t)
+    return min(times)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("-f", "--functions", type=int, default=100)
+    parser.add_argument("-n", "--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    mod = make_module(args.functions)
+    for name, f, fargs in [("construct", construct, ()),
+                           ("hash/compare", hash_and_compare, ()),
+                           ("resolve_typedefs", resolve, (mod,)),
+                           ("verify", verify_module, (mod,))]:
+        t = best_of(args.repeat, f, *fargs)
+        print("%-18s %8.2f ms" % (name, t * 1000))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Measure the per-operation overhead of visitor dispatch in visit(),
+transform() and vvisit(), for a plain visitor and a Combinator. Usage:
+
+    python benchmarks/bench_visit.py [-o ops] [-n repeat]
+"""
+
+from __future__ import print_function, division, absolute_import
+
+import sys
+import time
+import argparse
+from os.path import dirname, abspath
+
+sys.path.insert(0, dirname(dirname(abspath(__file__))))
+
+from pykit import types
+from pykit.ir import Function, Builder, visit, transform, vvisit, combine
+
+def make_function(nops):
+    f = Function("f", ["a"], types.Function(types.Int32, [types.Int32]))
+    b = Builder(f)
+    b.position_at_end(f.new_block("entry"))
+    value = f.get_arg("a")
+    for i in range(nops // 2):
+        value = b.add(types.Int32, [value, value])
+        value = b.mul(types.Int32, [value, value])
+    b.ret(value)
+    return f
+
+class Visitor(object):
+
+    def op_arg(self, arg):
+        return 1
+
+    def blockswitch(self, block):
+        pass
+
+    def op_add(self, op, *args):
+        pass
+
+    def op_mul(self, op, *args):
+        pass
+
+    def op_ret(self, op, *args):
+        pass
+
+def best_of(repeat, f, *args):
+    times = []
+    for i in range(repeat):
+        t = time.time()
+        f(*args)
+        times.append(time.time() - t)
+    return min(times)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("-o", "--ops", type=int, default=100000)
+    parser.add_argument("-n", "--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    func = make_function(args.ops)
+    nops = len(list(func.ops))
+    baseline = best_of(args.repeat, lambda: [op for op in func.ops])
+    combinator = combine(Visitor(), {'op_sub': lambda op: None})
+
+    for name, f, fargs in [("visit", visit, (Visitor(), func)),
+                           ("visit/combinator", visit, (combinator, func)),
+                           ("transform", transform, (Visitor(), func)),
+                           ("vvisit", vvisit, (Visitor(), func))]:
+        t = best_of(args.repeat, f, *fargs) - baseline
+        print("%-18s %8.1f ns/op" % (name, t / nops * 1e9))
+
+if __name__ == "__main__":
+    main()
@@ -2,13 +2,20 @@
 from __future__ import print_function, division, absolute_import
 
 from os.path import dirname, abspath
-import unittest
 
 from pykit.configuration import config
-from pykit.parsing import from_c
 
 __version__ = '0.1'
 
+# ______________________________________________________________________
+# Lazily loaded entry points. Importing pykit should be cheap: parsers,
+# networkx, NumPy and code generators are imported on first use.
+
+def from_c(source, filename="<string>", system_cpp=False):
+    """Parse pykit IR in the form of C, see pykit.parsing.from_c"""
+    from pykit import parsing
+    return parsing.from_c(source, filename, system_cpp)
+
 # ______________________________________________________________________
 # pykit.test()
 
@@ -17,6 +24,7 @@ pattern = "test_*.py"
 
 def test(root=root, pattern=pattern):
     """Run tests and return exit status"""
+    import unittest
     tests =  unittest.TestLoader().discover(root, pattern=pattern)
     runner = unittest.TextTestRunner()
     result = runner.run(tests)
@@ -30,4 +38,4 @@ def run_tests(dirs, pattern=pattern, failfast=True):
         if failfast and status != 0:
             break
 
-    return status
\ No newline at end of file
+    return status
@@ -72,6 +72,44 @@ class LinkedList(object):
         for op in items:
             self.append(op)
 
+    def splice(self, other, first=None, last=None, after=None, count=None):
+        """
+        Move the items `first` through `last` (inclusive, by default all
+        items) from list `other` into this list after item `after` (by
+        default at the end). Runs in constant time if all items are moved
+        or `count` gives the number of moved items.
+        """
+        if first is None:
+            first = other._head._next
+        if last is None:
+            last = other._tail._prev
+        if first is other._tail:
+            return # Nothing to move
+
+        if count is None:
+            if first is other._head._next and last is other._tail._prev:
+                count = other.size
+            else:
+                count = 1
+                cur = first
+                while cur is not last:
+                    cur = cur._next
+                    count += 1
+
+        # Unlink from other
+        first._prev._next = last._next
+        last._next._prev = first._prev
+        other.size -= count
+
+        # Link after 'after'
+        if after is None:
+            after = self._tail._prev
+        first._prev = after
+        last._next = after._next
+        after._next._prev = last
+        after._next = first
+        self.size += count
+
     @property
     def head(self):
         return self._head._next if self._head._next is not self._tail else None
@@ -89,15 +127,49 @@ class LinkedList(object):
             cur = cur._next or cur_next
 
     def __iter__(self, from_op=None):
-        return iter(list(self.iter_inplace(from_op)))
+        """
+        Iterate lazily over the items, starting at `from_op` if given.
+
+        The loop body may remove the current item and insert new items
+        anywhere. Iteration continues with the item that followed the
+        current item when it was produced, so items inserted after the
+        current item are not visited, as when iterating over a copy. If the
+        remaining items are moved to another list (e.g. when splitting a
+        block), iteration continues until the end of that list.
+
+        Removing items that have not been visited yet raises a RuntimeError,
+        such loops must iterate over a copy (list(linkedlist)) instead.
+        """
+        cur = self._head._next if from_op is None else from_op
+        while cur._next is not None: # Stop at the tail sentinel
+            following = cur._next
+            yield cur
+            if following._prev is None:
+                raise RuntimeError("Next item removed during iteration, "
+                                   "iterate over a copy instead")
+            cur = following
 
     iter_from = __iter__
 
     def __len__(self):
         return self.size
 
-    def __reversed__(self):
-        return reversed(iter(self))
+    def __reversed__(self, from_op=None):
+        """
+        Iterate lazily over the items in reverse, starting at `from_op` if
+        given. Mutation is supported as for forward iteration: items
+        inserted before the current item are not visited.
+        """
+        cur = self._tail._prev if from_op is None else from_op
+        while cur._prev is not None: # Stop at the head sentinel
+            preceding = cur._prev
+            yield cur
+            if preceding._next is None:
+                raise RuntimeError("Next item removed during iteration, "
+                                   "iterate over a copy instead")
+            cur = preceding
+
+    iter_reversed = __reversed__
 
     def __repr__(self):
         return "LinkedList([%s])" % ", ".join(map(repr, self))
\ No newline at end of file
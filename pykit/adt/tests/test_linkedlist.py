@@ -21,4 +21,67 @@ class TestADT(unittest.TestCase):
         expected = ["head", 0, 1, "foo", 2, "bar", 3, 5, "tail"]
         expected = [LinkableItem(x) for x in expected]
         got = list(l)
-        self.assertEqual(got, expected)
\ No newline at end of file
+        self.assertEqual(got, expected)
+
+    def test_splice(self):
+        items = lambda xs: [LinkableItem(x) for x in xs]
+        a = LinkedList(items([0, 1]))
+        b = LinkedList(items([2, 3, 4]))
+        a.splice(b)
+        self.assertEqual(list(a), items([0, 1, 2, 3, 4]))
+        self.assertEqual((len(a), len(b)), (5, 0))
+        self.assertEqual(list(b), [])
+
+        # Move a sublist to the front
+        c = LinkedList(items(["x"]))
+        first, last = list(a)[1], list(a)[3]
+        c.splice(a, first, last, after=c._head)
+        self.assertEqual(list(c), items([1, 2, 3, "x"]))
+        self.assertEqual(list(a), items([0, 4]))
+        self.assertEqual((len(a), len(c)), (2, 4))
+
+        # Empty list
+        c.splice(LinkedList())
+        self.assertEqual(len(c), 4)
+
+    def test_iteration(self):
+        items = [LinkableItem(i) for i in range(4)]
+        l = LinkedList(items)
+        self.assertEqual(list(reversed(l)), items[::-1])
+        self.assertEqual(list(l.iter_from(items[2])), items[2:])
+
+        # Remove the current item and insert after it
+        seen = []
+        for item in l:
+            seen.append(item.data)
+            if item.data == 1:
+                l.insert_after(LinkableItem("new"), item)
+                l.remove(item)
+        self.assertEqual(seen, [0, 1, 2, 3])
+        self.assertEqual([item.data for item in l], [0, "new", 2, 3])
+
+        seen = []
+        for item in reversed(l):
+            seen.append(item.data)
+            l.remove(item)
+        self.assertEqual(seen, [3, 2, "new", 0])
+        self.assertEqual(len(l), 0)
+
+    def test_iteration_errors(self):
+        items = [LinkableItem(i) for i in range(3)]
+        l = LinkedList(items)
+        def remove_next():
+            for item in l:
+                l.remove(items[1])
+        self.assertRaises(RuntimeError, remove_next)
+
+    def test_iteration_moved(self):
+        items = [LinkableItem(i) for i in range(4)]
+        l, other = LinkedList(items), LinkedList()
+        seen = []
+        for item in l:
+            seen.append(item.data)
+            if item.data == 1:
+                other.splice(l, items[2])
+        self.assertEqual(seen, [0, 1, 2, 3])
+        self.assertEqual(list(other), items[2:])
@@ -6,8 +6,6 @@ Build a call graph.
 
 from pykit import ir
 
-import networkx as nx
-
 def callgraph(func, graph=None, seen=None):
     """
     Eliminate dead code.
@@ -15,6 +13,7 @@ def callgraph(func, graph=None, seen=None):
     TODO: Prune branches, dead loops
     """
     if seen is None:
+        import networkx as nx
         seen = set()
         graph = nx.DiGraph()
 
@@ -29,6 +28,6 @@ def callgraph(func, graph=None, seen=None):
             callee, args = op.args
             if isinstance(callee, ir.Function):
                 graph.add_edge(func, callee)
-                callgraph(func, graph, seen)
+                callgraph(callee, graph, seen)
 
     return graph
\ No newline at end of file
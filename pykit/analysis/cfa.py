@@ -12,8 +12,6 @@ from pykit.ir import ops, Builder, Undef
 from pykit.analysis import defuse
 from pykit.utils import mergedicts
 
-import networkx as nx
-
 def run(func, env=None):
     CFG = cfg(func)
     ssa(func, CFG)
@@ -32,6 +30,7 @@ def cfg(func):
     """
     Compute the control flow graph for `func`
     """
+    import networkx as nx
     cfg = nx.DiGraph()
 
     for block in func.blocks:
@@ -202,15 +201,14 @@ def merge_blocks(func, pred, succ):
     assert pred.terminator.opcode == 'jump', pred.terminator.opcode
     assert pred.terminator.args[0] == succ
     pred.terminator.delete()
-    pred.extend(succ)
-    func.del_block(succ)
+    func.merge_blocks(pred, succ)
 
 def simplify(func, cfg):
     """
     Simplify control flow. Merge consecutive blocks where the parent has one
     child, the child one parent, and both have compatible instruction leaders.
     """
-    for block in reversed(list(func.blocks)):
+    for block in reversed(func.blocks):
         if len(cfg.predecessors(block)) == 1 and not list(block.leaders):
             [pred] = cfg.predecessors(block)
             exc_block = any(op.opcode in ('exc_setup',) for op in pred.leaders)
@@ -7,8 +7,7 @@ Link definitions to uses.
 from __future__ import print_function, division, absolute_import
 from collections import defaultdict
 
-from pykit.ir import Op, FuncArg, Block
-from pykit.utils import flatten
+from pykit.ir import ops, Op, FuncArg, Block
 
 def defuse(func):
     """
@@ -22,7 +21,7 @@ def defuse(func):
     defuse = defaultdict(set) # { def : { use } }
     for block in func.blocks:
         for op in block:
-            for arg in flatten(op.args):
+            for arg in ops.flat_args(op.opcode, op.args):
                 if isinstance(arg, (Op, FuncArg, Block)):
                     defuse[arg].add(op)
 
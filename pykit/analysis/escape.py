@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+
+"""
+Escape analysis for aggregate allocations (new_tuple, new_list, new_struct
+and new_data). An allocation escapes if it may outlive the function or be
+reached through another value, e.g. when it is returned, stored, merged
+through a phi or passed to an unknown function:
+
+    %t = new_tuple([%x, %y])    # escape = { %t: [] }
+    %a = getindex(%t, [0])
+
+    %u = new_tuple([%x, %y])    # escape = { %u: [%r] }
+    %r = ret(%u)
+
+Calls to known pykit functions don't let an allocation escape if the
+callee's parameter does not escape, which is determined recursively.
+"""
+
+from __future__ import print_function, division, absolute_import
+
+from pykit.ir import ops, Function
+from pykit.analysis import defuse
+
+allocations = frozenset([
+    ops.new_tuple, ops.new_list, ops.new_struct, ops.new_data,
+])
+
+# Operations that access their first argument without letting it escape.
+# Any other argument is used as a value (and escapes).
+accessors = frozenset([
+    ops.getfield, ops.setfield, ops.getindex, ops.setindex, ops.getslice,
+    ops.setslice, ops.ptrload, ops.ptrstore, ops.list_append, ops.list_pop,
+    ops.length,
+])
+
+refcounting = frozenset([
+    ops.gc_gotref, ops.gc_giveref, ops.gc_incref, ops.gc_decref,
+])
+
+def escaping_uses(value, uses, interprocedural=True, cache=None):
+    """Return the uses through which `value` escapes"""
+    result = []
+    for use in uses[value]:
+        if use.opcode in refcounting:
+            continue
+        elif use.opcode in accessors:
+            if use.args[0] is value and not _used_in(value, use.args[1:]):
+                continue
+        elif use.opcode == 'call' and interprocedural:
+            callee, args = use.args
+            if isinstance(callee, Function) and callee is not value:
+                escapes = param_escapes(callee, cache)
+                if not any(escapes[i] for i, arg in enumerate(args)
+                                          if arg is value):
+                    continue
+        result.append(use)
+
+    return result
+
+def _used_in(value, args):
+    for arg in args:
+        if arg is value or (isinstance(arg, list) and _used_in(value, arg)):
+            return True
+    return False
+
+def param_escapes(func, cache=None):
+    """Return a list of bools indicating which parameters of `func` escape"""
+    if cache is None:
+        cache = {}
+    if func not in cache:
+        # Assume the worst for recursive calls
+        cache[func] = [True] * len(func.args)
+        uses = defuse.defuse(func)
+        cache[func] = [bool(escaping_uses(arg, uses, True, cache))
+                           for arg in func.args]
+    return cache[func]
+
+def escape_analysis(func, interprocedural=True, cache=None):
+    """
+    Return { allocation : [escaping uses] }. An empty list indicates the
+    allocation does not escape.
+    """
+    if cache is None:
+        cache = {}
+    uses = defuse.defuse(func)
+    return dict((op, escaping_uses(op, uses, interprocedural, cache))
+                    for op in func.ops if op.opcode in allocations)
+
+def nonescaping(func, interprocedural=True, cache=None):
+    """Return the list of allocations in `func` that do not escape"""
+    escapes = escape_analysis(func, interprocedural, cache)
+    return [op for op in func.ops if op in escapes and not escapes[op]]
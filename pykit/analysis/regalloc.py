@@ -0,0 +1,148 @@
+# -*- coding: utf-8 -*-
+
+"""
+Assign dense integer slots to the values of a function, reusing slots of
+values that are no longer live. This is a linear scan over the linearized
+function, where each value is live over a single interval (covering any
+lifetime holes).
+
+    slots, nslots = allocate(func)
+
+All phis of a block are evaluated in parallel when the block is entered
+(see Interp.blockswitch): the incoming values of all phis are read before
+any phi is assigned. An incoming value is live until the end of its
+predecessor and up to the phi that reads it. A later phi of the block may
+therefore get the slot of an incoming value that dies at an earlier phi,
+which is safe since that value has been read before the phi is assigned.
+Phis that read each other (e.g. a swap, a, b = b, a) are live across the
+block entry and get distinct slots.
+"""
+
+from __future__ import print_function, division, absolute_import
+
+import heapq
+from collections import defaultdict
+
+from pykit.ir import ops, Op, FuncArg, Block
+
+def is_local(value):
+    return isinstance(value, (Op, FuncArg))
+
+def successors(block):
+    """Successors of a block, including exception handlers"""
+    result = []
+    for op in block:
+        if op.opcode != 'phi':
+            for arg in ops.flat_args(op.opcode, op.args):
+                if isinstance(arg, Block) and arg not in result:
+                    result.append(arg)
+    return result
+
+def liveness(func):
+    """
+    Compute live-in and live-out sets of values for all blocks:
+
+        ({ Block : set(live_in) }, { Block : set(live_out) })
+    """
+    uses, defs = {}, {}
+    phi_uses = defaultdict(set) # { pred : { value } } used by phis in succs
+    for block in func.blocks:
+        uses[block], defs[block] = set(), set()
+        for op in block:
+            if op.opcode == 'phi':
+                for pred, value in zip(*op.args):
+                    if is_local(value):
+                        phi_uses[pred].add(value)
+            else:
+                uses[block].update(
+                    arg for arg in ops.flat_args(op.opcode, op.args)
+                            if is_local(arg) and arg not in defs[block])
+            defs[block].add(op)
+
+    succs = dict((block, successors(block)) for block in func.blocks)
+    live_in = dict((block, set()) for block in func.blocks)
+    live_out = dict((block, set()) for block in func.blocks)
+
+    blocks = list(func.blocks)
+    changed = True
+    while changed:
+        changed = False
+        for block in reversed(blocks):
+            out = set(phi_uses[block])
+            for succ in succs[block]:
+                out |= live_in[succ]
+            in_ = uses[block] | (out - defs[block])
+            if out != live_out[block] or in_ != live_in[block]:
+                live_in[block], live_out[block] = in_, out
+                changed = True
+
+    return live_in, live_out
+
+def live_intervals(func):
+    """
+    Compute { value : [start, end] } live intervals over the linearized
+    function. Function arguments start at -1.
+    """
+    live_in, live_out = liveness(func)
+    intervals = {}
+
+    def extend(value, pos):
+        if value in intervals:
+            interval = intervals[value]
+            interval[0] = min(interval[0], pos)
+            interval[1] = max(interval[1], pos)
+        else:
+            intervals[value] = [pos, pos]
+
+    for arg in func.args:
+        extend(arg, -1)
+
+    pos = 0
+    for block in func.blocks:
+        start = pos
+        for op in block:
+            extend(op, pos)
+            if op.opcode == 'phi':
+                args = op.args[1]
+            else:
+                args = ops.flat_args(op.opcode, op.args)
+            for arg in args:
+                if is_local(arg):
+                    extend(arg, pos)
+            pos += 1
+
+        for value in live_in[block]:
+            extend(value, start)
+        for value in live_out[block]:
+            extend(value, pos - 1)
+
+    return intervals
+
+def allocate(func):
+    """
+    Assign slots to the arguments and operations of `func`. Returns
+    ({ value : slot }, nslots)
+    """
+    intervals = live_intervals(func)
+    values = list(func.args) + list(func.ops)
+    order = sorted(values, key=lambda value: intervals[value][0])
+
+    slots = {}
+    free = []   # heap of free slots
+    active = [] # heap of (end, slot)
+    nslots = 0
+    for value in order:
+        start, end = intervals[value]
+        while active and active[0][0] < start:
+            heapq.heappush(free, heapq.heappop(active)[1])
+
+        if free:
+            slot = heapq.heappop(free)
+        else:
+            slot = nslots
+            nslots += 1
+
+        slots[value] = slot
+        heapq.heappush(active, (end, slot))
+
+    return slots, nslots
@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+from __future__ import print_function, division, absolute_import
+
+import unittest
+
+from pykit import types
+from pykit.ir import Const
+from pykit.analysis import escape
+from pykit.tests import make_function
+
+Pair = types.Tuple([types.Int32, types.Int32])
+
+def first(b, value):
+    return b.getindex(types.Int32, [value, [Const(0, types.Int32)]])
+
+class TestEscapeAnalysis(unittest.TestCase):
+
+    def setUp(self):
+        # Int32 read(Pair p) { return p[0]; }
+        self.read, b = make_function([Pair], name="read")
+        b.ret(first(b, self.read.args[0]))
+
+        # Pair identity(Pair p) { return p; }
+        self.identity, b = make_function([Pair], Pair, name="identity")
+        b.ret(self.identity.args[0])
+
+    def make_caller(self, callee):
+        f, b = make_function([types.Int32, types.Int32])
+        t = b.new_tuple(Pair, [list(f.args)])
+        r = b.call(callee.type.restype, [callee, [t]])
+        b.ret(first(b, r) if r.type == Pair else r)
+        return f, t
+
+    def test_local(self):
+        f, b = make_function([types.Int32, types.Int32])
+        t = b.new_tuple(Pair, [list(f.args)])
+        b.ret(first(b, t))
+        self.assertEqual(escape.escape_analysis(f), { t: [] })
+        self.assertEqual(escape.nonescaping(f), [t])
+
+    def test_return(self):
+        f, b = make_function([types.Int32, types.Int32], Pair)
+        t = b.new_tuple(Pair, [list(f.args)])
+        ret = b.ret(t)
+        self.assertEqual(escape.escape_analysis(f), { t: [ret] })
+
+    def test_stored(self):
+        f, b = make_function([types.Int32, types.Int32])
+        t = b.new_tuple(Pair, [list(f.args)])
+        lst = b.new_list(types.List(Pair, -1), [[]])
+        b.list_append(types.Void, [lst, t])
+        b.ret(Const(0, types.Int32))
+        self.assertEqual(escape.nonescaping(f), [lst])
+
+    def test_call(self):
+        f, t = self.make_caller(self.read)
+        self.assertEqual(escape.nonescaping(f), [t])
+        self.assertEqual(escape.nonescaping(f, interprocedural=False), [])
+
+        f, t = self.make_caller(self.identity)
+        self.assertEqual(escape.nonescaping(f), [])
+        self.assertEqual(escape.param_escapes(self.identity), [True])
+        self.assertEqual(escape.param_escapes(self.read), [False])
@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+from __future__ import print_function, division, absolute_import
+
+import unittest
+from itertools import combinations
+
+from pykit.parsing import from_c
+from pykit.analysis import cfa, regalloc
+from pykit.ir import interp
+
+source = """
+#include <pykit_ir.h>
+
+Int32 func(Int32 n) {
+    Int32 i = 0;
+    Int32 a = 0;
+    Int32 b = 1;
+    while (i < n) {
+        Int32 t = a + b;
+        a = b;
+        b = t;
+        i = i + 1;
+    }
+    return a;
+}
+
+Int32 swap(Int32 n) {
+    Int32 i = 0;
+    Int32 a = 1;
+    Int32 b = 2;
+    while (i < n) {
+        Int32 t = a;
+        a = b;
+        b = t;
+        i = i + 1;
+    }
+    return a * 10 + b;
+}
+"""
+
+class TestRegalloc(unittest.TestCase):
+
+    def setUp(self):
+        self.f = from_c(source).get_function('func')
+        cfa.run(self.f)
+
+    def test_allocate(self):
+        values = list(self.f.args) + list(self.f.ops)
+        slots, nslots = regalloc.allocate(self.f)
+        intervals = regalloc.live_intervals(self.f)
+
+        self.assertEqual(set(slots), set(values))
+        self.assertLess(nslots, len(values))
+        self.assertEqual(set(slots.values()), set(range(nslots)))
+        for x, y in combinations(values, 2):
+            (a, b), (c, d) = intervals[x], intervals[y]
+            if slots[x] == slots[y]:
+                self.assertTrue(b < c or d < a, (x, y))
+
+    def test_liveness(self):
+        live_in, live_out = regalloc.liveness(self.f)
+        self.assertEqual(live_in[self.f.startblock], set(self.f.args))
+        self.assertFalse(live_out[self.f.exitblock])
+
+    def test_interp(self):
+        self.assertEqual(interp.run(self.f, args=[10]), 55)
+
+    def test_swap(self):
+        # The loop header phis swap a and b, which needs parallel evaluation
+        f = from_c(source).get_function('swap')
+        cfa.run(f)
+        phis = [op for op in f.ops if op.opcode == 'phi']
+        swapping = [(x, y) for x, y in combinations(phis, 2)
+                        if x in y.args[1] and y in x.args[1]]
+        self.assertEqual(len(swapping), 1)
+
+        slots, nslots = regalloc.allocate(f)
+        [(x, y)] = swapping
+        self.assertNotEqual(slots[x], slots[y])
+        self.assertEqual(interp.run(f, args=[3]), 21)
+        self.assertEqual(interp.run(f, args=[4]), 12)
+
+
+if __name__ == '__main__':
+    unittest.main()
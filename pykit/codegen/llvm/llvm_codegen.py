@@ -1,5 +1,6 @@
 from functools import partial
 
+from pykit import error
 from pykit.ir import vvisit, ArgLoader, verify_lowlevel
 from pykit.ir import defs, opgrouper
 from pykit.types import Boolean, Integral, Real, Pointer, Function, Int64
@@ -371,7 +372,24 @@ class LLVMArgLoader(ArgLoader):
         return lc.Constant.undef(llvm_type(arg.type))
 
 
+def verify_exceptions(func):
+    """
+    Raise a CompileError for exception handling that is not supported: only
+    exception checks lowered with the costful model without handlers are.
+    """
+    for op in func.ops:
+        if op.metadata and "exc.unwind" in op.metadata:
+            raise error.CompileError(
+                "%s: zero-cost exceptions are not supported by the LLVM "
+                "backend, use exceptions.model 'costful'" % (op,))
+        elif op.opcode in ('exc_setup', 'exc_catch', 'exc_throw',
+                           'load_tl_exc', 'store_tl_exc'):
+            raise error.CompileError(
+                "%s: exception handling is not supported by the LLVM "
+                "backend" % (op,))
+
 def initialize(func, env):
+    verify_exceptions(func)
     verify_lowlevel(func)
     llvm_module = env["codegen.llvm.module"]
     return llvm_module.add_function(llvm_type(func.type), func.name)
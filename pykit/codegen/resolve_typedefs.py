@@ -5,7 +5,6 @@ Resolve typedefs. This turns portable into unportable IR for code generator.
 """
 
 import struct
-from functools import partial
 
 from pykit import types as t
 from pykit.utils import hashable
@@ -25,23 +24,50 @@ for code, typedef in zip(codes, types):
 
     typedef_map[typedef] = concrete_type
 
-def reconstruct_type(ty, typemap):
-    reconstruct = partial(reconstruct_type, typemap=typemap)
+def reconstruct_type(ty, typemap, cache=None):
+    """
+    Replace the typedefs in `ty` according to `typemap`. Returns the
+    original instance if nothing changes. Results are memoized in `cache`,
+    which must only be used with the same typemap.
+    """
+    if cache is None:
+        cache = {}
     if isinstance(ty, list):
-        return list(map(reconstruct, ty))
+        result = [reconstruct_type(x, typemap, cache) for x in ty]
+        if all(new is old for new, old in zip(result, ty)):
+            return ty
+        return result
     if not isinstance(ty, t.Type):
         return ty
-    elif ty in typemap:
-        return typemap[ty]
-    else:
-        ctor = type(ty)
-        return ctor(*map(reconstruct, ty))
+
+    result = cache.get(ty)
+    if result is None:
+        if ty in typemap:
+            result = typemap[ty]
+        else:
+            fields = [reconstruct_type(field, typemap, cache) for field in ty]
+            if all(new is old for new, old in zip(fields, ty)):
+                result = ty
+            else:
+                result = type(ty)(*fields, managed=ty.managed)
+        cache[ty] = result
+
+    return result
+
+def typedef_cache(env, typemap):
+    """
+    Get the cache for resolving `typemap` from env['types.typedefcache'],
+    shared by all functions compiled in the environment
+    """
+    caches = env.setdefault('types.typedefcache', {})
+    return caches.setdefault(frozenset(typemap.items()), {})
 
 def run(func, env):
     """env['types.typedefmap'] should be installed"""
     typemap = env['types.typedefmap']
-    func.type = reconstruct_type(func.type, typemap)
+    cache = typedef_cache(env, typemap)
+    func.type = reconstruct_type(func.type, typemap, cache)
     for arg in func.args:
-        arg.type = reconstruct_type(arg.type, typemap)
+        arg.type = reconstruct_type(arg.type, typemap, cache)
     for op in func.ops:
-        op.type = reconstruct_type(op.type, typemap)
\ No newline at end of file
+        op.type = reconstruct_type(op.type, typemap, cache)
@@ -0,0 +1,35 @@
+# -*- coding: utf-8 -*-
+from __future__ import print_function, division, absolute_import
+
+import unittest
+
+from pykit import types
+from pykit.codegen import resolve_typedefs
+
+typemap = { types.Long: types.Int64 }
+
+class TestResolveTypedefs(unittest.TestCase):
+
+    def test_resolve(self):
+        ty = types.Function(types.Pointer(types.Long), [types.Long, types.Int8])
+        self.assertEqual(
+            resolve_typedefs.reconstruct_type(ty, typemap),
+            types.Function(types.Pointer(types.Int64),
+                           [types.Int64, types.Int8]))
+
+    def test_unchanged(self):
+        argtypes = [types.Int32, types.Pointer(types.Int8)]
+        ty = types.Function(types.Int32, argtypes)
+        self.assertIs(resolve_typedefs.reconstruct_type(ty, typemap), ty)
+        self.assertIs(resolve_typedefs.reconstruct_type(argtypes, typemap),
+                      argtypes)
+
+    def test_cache(self):
+        env = {}
+        cache = resolve_typedefs.typedef_cache(env, typemap)
+        self.assertIs(resolve_typedefs.typedef_cache(env, dict(typemap)),
+                      cache)
+        ty = types.Pointer(types.Long)
+        resolve_typedefs.reconstruct_type(ty, typemap, cache)
+        self.assertEqual(cache[ty], types.Pointer(types.Int64))
+        self.assertEqual(cache[types.Long], types.Int64)
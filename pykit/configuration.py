@@ -6,10 +6,18 @@ class Config(object):
     # Enable debug output
     debug = False
 
-    # Verify result of each pass
-    verify = True
+    # Verification level:
+    #   "off":   no verification
+    #   "cheap": structural checks (op syntax, unique names, return types)
+    #   "full":  also block order, def-use chains and semantics
+    # Functions are verified incrementally: only blocks that changed since
+    # the last successful verification are checked again.
+    verify_level = "full"
 
-    # Verify operations as they are built
+    # Verify the syntax of operations as they are built, unless verify_level
+    # is "off". Read when pykit.ir.builder is imported, so it must be set
+    # before that to take effect. Disabling it avoids the per-op overhead
+    # in builders while keeping function verification.
     op_verify = True
 
 
@@ -0,0 +1,292 @@
+
+# yacctab.py
+# This file is automatically generated. Do not edit.
+_tabversion = '3.2'
+
+_lr_method = 'LALR'
+
+_lr_signature = ' \x8d\x1d\x1d}\x18os/|\xb5\xb4\xf2\xbb\x9cM'
+    
+_lr_action_items = {'VOID':([0,1,2,3,5,6,9,10,11,12,13,14,15,17,18,19,22,23,24,25,26,28,30,32,33,34,36,37,38,39,40,41,43,44,45,46,47,49,50,55,56,57,58,60,61,62,64,65,66,75,77,82,84,85,86,87,88,89,90,91,98,127,155,156,157,158,159,160,161,162,178,183,196,205,206,209,211,212,238,239,240,245,249,255,256,257,260,262,269,271,272,273,275,278,282,283,287,296,334,335,347,348,350,351,356,358,360,387,388,391,396,410,419,420,422,430,431,433,434,],[6,6,-61,-82,-71,-58,-54,-55,-33,-29,-59,6,-34,-53,-68,-63,-52,6,-56,-180,-116,-66,-69,-32,-83,-118,-64,-31,-60,-35,-62,-65,6,-67,6,-70,-84,6,-57,-92,-261,-91,6,6,-117,-30,6,-107,-106,6,-45,-46,6,-119,6,6,6,6,-98,6,6,6,-36,6,-47,6,6,-93,-99,-262,6,6,6,-120,6,6,-121,6,-123,-122,6,6,-108,-37,-39,-42,-38,-40,6,-158,-157,-43,-159,-41,-95,-94,-100,6,-110,-109,-177,-176,6,-174,-160,-173,-161,-172,-175,-164,-162,-163,-168,-167,-165,-169,-166,-171,-170,]),'LBRACKET':([1,2,3,5,6,9,10,13,14,17,18,19,21,22,24,25,26,28,29,30,33,34,36,38,40,41,43,44,45,46,47,50,51,52,53,55,56,57,59,61,65,66,68,69,70,71,78,79,85,89,91,95,96,97,98,102,103,104,105,106,108,109,113,114,117,118,126,129,135,140,149,150,160,162,163,164,165,166,173,174,178,179,180,182,200,204,205,211,212,238,239,240,243,249,253,280,282,283,297,301,302,305,309,334,335,339,345,365,366,367,368,373,374,378,380,383,385,398,399,400,404,414,415,423,],[-263,-61,-82,-71,-58,-54,-55,-59,-263,-53,-68,-63,-80,-52,-56,-180,63,-66,-263,-69,-83,-118,-64,-60,-62,-65,-263,-67,-263,-70,-84,-57,-50,-9,-10,-92,-261,-91,-49,63,-107,-106,-26,-124,-126,-25,-48,-51,-119,-263,-263,-255,-256,-253,-263,-259,-252,-250,-257,-254,-251,175,-245,-243,-244,202,-232,-249,-242,175,-127,-125,-93,-262,-21,-90,-22,-89,-260,-258,175,295,175,-81,-238,-239,-120,-121,-263,-123,-122,175,175,-108,341,-249,-95,-94,295,-237,-236,-235,-246,-110,-109,-142,341,-152,-154,-156,-150,-233,-234,341,-145,341,-143,-151,-153,-155,-144,341,-240,-241,]),'WCHAR_CONST':([56,60,63,77,111,115,116,121,122,124,125,127,128,130,134,152,156,162,167,175,183,184,185,186,187,188,189,190,191,192,193,194,195,196,198,202,203,206,209,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,250,253,256,257,260,261,262,268,269,271,272,273,275,277,278,288,290,295,308,310,338,341,342,343,347,348,350,351,352,353,356,357,358,360,361,362,370,375,378,379,383,386,387,388,390,391,393,396,405,407,409,410,411,412,413,414,418,419,420,422,424,427,429,430,431,432,433,434,],[-261,96,96,-45,-231,96,-229,96,-228,96,-227,96,96,-226,-230,96,96,-262,96,96,96,-186,-189,-187,-183,-184,-188,-190,96,-192,-193,-185,-191,96,-227,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,-263,-39,-42,-38,96,-40,96,96,-158,-157,-43,-159,96,-41,96,-227,96,96,96,-12,96,96,-11,-177,-176,96,-174,96,96,-160,96,-173,-161,96,96,-227,96,-263,96,-263,-141,-172,-175,96,-164,96,-162,96,96,96,-163,96,96,96,-263,96,-168,-167,-165,96,96,96,-169,-166,96,-171,-170,]),'FLOAT_CONST':([56,60,63,77,111,115,116,121,122,124,125,127,128,130,134,152,156,162,167,175,183,184,185,186,187,188,189,190,191,192,193,194,195,196,198,202,203,206,209,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,250,253,256,257,260,261,262,268,269,271,272,273,275,277,278,288,290,295,308,310,338,341,342,343,347,348,350,351,352,353,356,357,358,360,361,362,370,375,378,379,383,386,387,388,390,391,393,396,405,407,409,410,411,412,413,414,418,419,420,422,424,427,429,430,431,432,433,434,],[-261,97,97,-45,-231,97,-229,97,-228,97,-227,97,97,-226,-230,97,97,-262,97,97,97,-186,-189,-187,-183,-184,-188,-190,97,-192,-193,-185,-191,97,-227,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,-263,-39,-42,-38,97,-40,97,97,-158,-157,-43,-159,97,-41,97,-227,97,97,97,-12,97,97,-11,-177,-176,97,-174,97,97,-160,97,-173,-161,97,97,-227,97,-263,97,-263,-141,-172,-175,97,-164,97,-162,97,97,97,-163,97,97,97,-263,97,-168,-167,-165,97,97,97,-169,-166,97,-171,-170,]),'MINUS':([56,63,77,95,96,97,102,103,104,105,106,108,111,112,113,114,115,116,117,118,120,121,122,124,125,126,127,128,129,130,131,134,135,152,156,162,167,173,174,175,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,200,202,203,204,206,207,208,209,210,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,250,253,256,257,260,261,262,268,269,271,272,273,275,277,278,280,288,290,295,301,302,305,308,309,310,312,313,314,315,316,317,318,319,320,321,322,323,324,325,326,327,329,330,338,341,342,343,347,348,350,351,352,353,356,357,358,360,361,362,370,372,373,374,375,376,378,379,383,386,387,388,390,391,393,396,405,407,409,410,411,412,413,414,415,418,419,420,422,423,424,427,429,430,431,432,433,434,],[-261,116,-45,-255,-256,-253,-259,-252,-250,-257,-254,-251,-231,-218,-245,-243,116,-229,-244,-220,-197,116,-228,116,-227,-232,116,116,-249,-226,222,-230,-242,116,116,-262,116,-260,-258,116,-186,-189,-187,-183,-184,-188,-190,116,-192,-193,-185,-191,116,-224,-227,-238,116,116,-239,116,-218,-223,116,-221,-222,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,-263,-39,-42,-38,116,-40,116,116,-158,-157,-43,-159,116,-41,-249,116,-227,116,-237,-236,-235,116,-246,116,222,222,222,-202,222,222,222,-201,222,222,-199,-198,222,222,222,222,222,-200,-12,116,116,-11,-177,-176,116,-174,116,116,-160,116,-173,-161,116,116,-227,-225,-233,-234,116,-219,-263,116,-263,-141,-172,-175,116,-164,116,-162,116,116,116,-163,116,116,116,-263,-240,116,-168,-167,-165,-241,116,116,116,-169,-166,116,-171,-170,]),'RPAREN':([1,2,3,5,6,9,10,13,14,17,18,19,21,22,24,25,26,28,29,30,33,34,36,38,40,41,43,44,45,46,47,50,51,52,53,54,55,57,59,61,64,65,66,68,69,70,71,78,79,85,89,91,95,96,97,98,102,103,104,105,106,108,109,112,113,114,117,118,120,126,129,131,133,135,136,137,138,139,140,141,142,143,149,150,160,162,163,164,165,166,173,174,176,177,178,179,180,181,182,197,200,203,204,205,207,208,210,211,212,213,214,215,216,217,218,238,239,240,241,242,243,249,265,282,283,291,292,293,294,296,297,299,300,301,302,304,305,306,307,309,312,313,314,315,316,317,318,319,320,321,322,323,324,325,326,327,329,330,331,332,333,334,335,355,365,366,367,368,371,372,373,374,376,377,392,394,397,398,399,400,401,403,415,418,421,423,424,425,428,],[-263,-61,-82,-71,-58,-54,-55,-59,-263,-53,-68,-63,-80,-52,-56,-180,-116,-66,-263,-69,-83,-118,-64,-60,-62,-65,-263,-67,-263,-70,-84,-57,-50,-9,-10,85,-92,-91,-49,-117,-263,-107,-106,-26,-124,-126,-25,-48,-51,-119,-263,-263,-255,-256,-253,-263,-259,-252,-250,-257,-254,-251,-263,-218,-245,-243,-244,-220,-197,-232,-249,-195,-181,-242,238,-15,239,-130,-263,-16,-128,-134,-127,-125,-93,-262,-21,-90,-22,-89,-260,-258,-146,-2,-263,-149,-147,-1,-81,-224,-238,305,-239,-120,-218,-223,-221,-121,-263,-217,308,309,311,-178,-222,-123,-122,-263,-133,-132,-147,-108,-14,-95,-94,-19,-20,367,368,-263,-148,-182,372,-237,-236,-247,-235,374,311,-246,-203,-215,-204,-202,-206,-210,-205,-201,-208,-213,-199,-198,-207,-214,-209,-211,-212,-200,-135,-129,-131,-110,-109,-13,-152,-154,-156,-150,400,-225,-233,-234,-219,-179,409,411,413,-151,-153,-155,-248,-196,-240,-263,426,-241,-263,429,432,]),'LONG':([0,1,2,3,5,6,9,10,11,12,13,14,15,17,18,19,22,23,24,25,26,28,30,32,33,34,36,37,38,39,40,41,43,44,45,46,47,49,50,55,56,57,58,60,61,62,64,65,66,75,77,82,84,85,86,87,88,89,90,91,98,127,155,156,157,158,159,160,161,162,178,183,196,205,206,209,211,212,238,239,240,245,249,255,256,257,260,262,269,271,272,273,275,278,282,283,287,296,334,335,347,348,350,351,356,358,360,387,388,391,396,410,419,420,422,430,431,433,434,],[19,19,-61,-82,-71,-58,-54,-55,-33,-29,-59,19,-34,-53,-68,-63,-52,19,-56,-180,-116,-66,-69,-32,-83,-118,-64,-31,-60,-35,-62,-65,19,-67,19,-70,-84,19,-57,-92,-261,-91,19,19,-117,-30,19,-107,-106,19,-45,-46,19,-119,19,19,19,19,-98,19,19,19,-36,19,-47,19,19,-93,-99,-262,19,19,19,-120,19,19,-121,19,-123,-122,19,19,-108,-37,-39,-42,-38,-40,19,-158,-157,-43,-159,-41,-95,-94,-100,19,-110,-109,-177,-176,19,-174,-160,-173,-161,-172,-175,-164,-162,-163,-168,-167,-165,-169,-166,-171,-170,]),'PLUS':([56,63,77,95,96,97,102,103,104,105,106,108,111,112,113,114,115,116,117,118,120,121,122,124,125,126,127,128,129,130,131,134,135,152,156,162,167,173,174,175,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,200,202,203,204,206,207,208,209,210,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,250,253,256,257,260,261,262,268,269,271,272,273,275,277,278,280,288,290,295,301,302,305,308,309,310,312,313,314,315,316,317,318,319,320,321,322,323,324,325,326,327,329,330,338,341,342,343,347,348,350,351,352,353,356,357,358,360,361,362,370,372,373,374,375,376,378,379,383,386,387,388,390,391,393,396,405,407,409,410,411,412,413,414,415,418,419,420,422,423,424,427,429,430,431,432,433,434,],[-261,122,-45,-255,-256,-253,-259,-252,-250,-257,-254,-251,-231,-218,-245,-243,122,-229,-244,-220,-197,122,-228,122,-227,-232,122,122,-249,-226,226,-230,-242,122,122,-262,122,-260,-258,122,-186,-189,-187,-183,-184,-188,-190,122,-192,-193,-185,-191,122,-224,-227,-238,122,122,-239,122,-218,-223,122,-221,-222,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,-263,-39,-42,-38,122,-40,122,122,-158,-157,-43,-159,122,-41,-249,122,-227,122,-237,-236,-235,122,-246,122,226,226,226,-202,226,226,226,-201,226,226,-199,-198,226,226,226,226,226,-200,-12,122,122,-11,-177,-176,122,-174,122,122,-160,122,-173,-161,122,122,-227,-225,-233,-234,122,-219,-263,122,-263,-141,-172,-175,122,-164,122,-162,122,122,122,-163,122,122,122,-263,-240,122,-168,-167,-165,-241,122,122,122,-169,-166,122,-171,-170,]),'ELLIPSIS':([245,],[332,]),'GT':([2,3,5,6,13,18,19,25,28,29,30,33,36,38,40,41,44,46,47,55,57,65,66,68,69,70,71,89,91,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,112,113,114,117,118,120,126,129,131,135,149,150,160,162,163,164,165,166,173,174,176,177,179,180,181,182,183,197,200,204,207,208,210,218,249,280,282,283,297,298,301,302,305,309,312,313,314,315,316,317,318,319,320,321,322,323,324,325,326,327,329,330,334,335,365,366,367,368,372,373,374,376,398,399,400,415,423,],[-61,-82,-71,-58,-59,-68,-63,-180,-66,-263,-69,-83,-64,-60,-62,-65,-67,-70,-84,-92,-91,-107,-106,-26,-124,-126,-25,-263,-263,-72,-74,-255,-256,-253,-263,-75,-73,-76,-259,-252,-250,-257,-254,-77,-251,-263,182,-218,-245,-243,-244,-220,-197,-232,-249,227,-242,-127,-125,-93,-262,-21,-90,-22,-89,-260,-258,-146,-2,-149,-147,-1,-81,-78,-224,-238,-239,-218,-223,-221,-222,-108,-249,-95,-94,-148,-79,-237,-236,-235,-246,-203,227,-204,-202,-206,227,-205,-201,-208,227,-199,-198,-207,227,227,227,227,-200,-110,-109,-152,-154,-156,-150,-225,-233,-234,-219,-151,-153,-155,-240,-241,]),'GOTO':([56,77,156,162,256,257,260,262,269,271,272,273,275,277,278,347,348,351,352,356,358,360,361,387,388,391,393,396,409,410,411,413,419,420,422,427,429,430,431,432,433,434,],[-261,-45,258,-262,-39,-42,-38,-40,258,-158,-157,-43,-159,258,-41,-177,-176,-174,258,-160,-173,-161,258,-172,-175,-164,258,-162,258,-163,258,258,-168,-167,-165,258,258,-169,-166,258,-171,-170,]),'ENUM':([0,1,2,3,5,6,9,10,11,12,13,14,15,17,18,19,22,23,24,25,26,28,30,32,33,34,36,37,38,39,40,41,43,44,45,46,47,49,50,55,56,57,58,60,61,62,64,65,66,75,77,82,84,85,86,87,88,89,90,91,98,127,155,156,157,158,159,160,161,162,178,183,196,205,206,209,211,212,238,239,240,245,249,255,256,257,260,262,269,271,272,273,275,278,282,283,287,296,334,335,347,348,350,351,356,358,360,387,388,391,396,410,419,420,422,430,431,433,434,],[27,27,-61,-82,-71,-58,-54,-55,-33,-29,-59,27,-34,-53,-68,-63,-52,27,-56,-180,-116,-66,-69,-32,-83,-118,-64,-31,-60,-35,-62,-65,27,-67,27,-70,-84,27,-57,-92,-261,-91,27,27,-117,-30,27,-107,-106,27,-45,-46,27,-119,27,27,27,27,-98,27,27,27,-36,27,-47,27,27,-93,-99,-262,27,27,27,-120,27,27,-121,27,-123,-122,27,27,-108,-37,-39,-42,-38,-40,27,-158,-157,-43,-159,-41,-95,-94,-100,27,-110,-109,-177,-176,27,-174,-160,-173,-161,-172,-175,-164,-162,-163,-168,-167,-165,-169,-166,-171,-170,]),'PERIOD':([56,95,96,97,102,103,104,105,106,108,113,114,117,118,126,129,135,162,173,174,200,204,253,280,301,302,305,309,339,345,373,374,378,380,383,385,404,414,415,423,],[-261,-255,-256,-253,-259,-252,-250,-257,-254,-251,-245,-243,-244,201,-232,-249,-242,-262,-260,-258,-238,-239,340,-249,-237,-236,-235,-246,-142,340,-233,-234,340,-145,340,-143,-144,340,-240,-241,]),'GE':([95,96,97,102,103,104,105,106,108,112,113,114,117,118,120,126,129,131,135,162,173,174,197,200,204,207,208,210,218,280,301,302,305,309,312,313,314,315,316,317,318,319,320,321,322,323,324,325,326,327,329,330,372,373,374,376,415,423,],[-255,-256,-253,-259,-252,-250,-257,-254,-251,-218,-245,-243,-244,-220,-197,-232,-249,231,-242,-262,-260,-258,-224,-238,-239,-218,-223,-221,-222,-249,-237,-236,-235,-246,-203,231,-204,-202,-206,231,-205,-201,-208,231,-199,-198,-207,231,231,231,231,-200,-225,-233,-234,-219,-240,-241,]),'INT_CONST_DEC':([56,60,63,77,111,115,116,121,122,124,125,127,128,130,134,152,156,162,167,175,183,184,185,186,187,188,189,190,191,192,193,194,195,196,198,202,203,206,209,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,250,253,256,257,260,261,262,268,269,271,272,273,275,277,278,288,290,295,308,310,338,341,342,343,347,348,350,351,352,353,356,357,358,360,361,362,370,375,378,379,383,386,387,388,390,391,393,396,405,407,409,410,411,412,413,414,418,419,420,422,424,427,429,430,431,432,433,434,],[-261,104,104,-45,-231,104,-229,104,-228,104,-227,104,104,-226,-230,104,104,-262,104,104,104,-186,-189,-187,-183,-184,-188,-190,104,-192,-193,-185,-191,104,-227,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,-263,-39,-42,-38,104,-40,104,104,-158,-157,-43,-159,104,-41,104,-227,104,104,104,-12,104,104,-11,-177,-176,104,-174,104,104,-160,104,-173,-161,104,104,-227,104,-263,104,-263,-141,-172,-175,104,-164,104,-162,104,104,104,-163,104,104,104,-263,104,-168,-167,-165,104,104,104,-169,-166,104,-171,-170,]),'ARROW':([95,96,97,102,103,104,105,106,108,113,114,117,118,126,129,135,162,173,174,200,204,280,301,302,305,309,373,374,415,423,],[-255,-256,-253,-259,-252,-250,-257,-254,-251,-245,-243,-244,199,-232,-249,-242,-262,-260,-258,-238,-239,-249,-237,-236,-235,-246,-233,-234,-240,-241,]),'HEX_FLOAT_CONST':([56,60,63,77,111,115,116,121,122,124,125,127,128,130,134,152,156,162,167,175,183,184,185,186,187,188,189,190,191,192,193,194,195,196,198,202,203,206,209,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,250,253,256,257,260,261,262,268,269,271,272,273,275,277,278,288,290,295,308,310,338,341,342,343,347,348,350,351,352,353,356,357,358,360,361,362,370,375,378,379,383,386,387,388,390,391,393,396,405,407,409,410,411,412,413,414,418,419,420,422,424,427,429,430,431,432,433,434,],[-261,106,106,-45,-231,106,-229,106,-228,106,-227,106,106,-226,-230,106,106,-262,106,106,106,-186,-189,-187,-183,-184,-188,-190,106,-192,-193,-185,-191,106,-227,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,-263,-39,-42,-38,106,-40,106,106,-158,-157,-43,-159,106,-41,106,-227,106,106,106,-12,106,106,-11,-177,-176,106,-174,106,106,-160,106,-173,-161,106,106,-227,106,-263,106,-263,-141,-172,-175,106,-164,106,-162,106,106,106,-163,106,106,106,-263,106,-168,-167,-165,106,106,106,-169,-166,106,-171,-170,]),'DOUBLE':([0,1,2,3,5,6,9,10,11,12,13,14,15,17,18,19,22,23,24,25,26,28,30,32,33,34,36,37,38,39,40,41,43,44,45,46,47,49,50,55,56,57,58,60,61,62,64,65,66,75,77,82,84,85,86,87,88,89,90,91,98,127,155,156,157,158,159,160,161,162,178,183,196,205,206,209,211,212,238,239,240,245,249,255,256,257,260,262,269,271,272,273,275,278,282,283,287,296,334,335,347,348,350,351,356,358,360,387,388,391,396,410,419,420,422,430,431,433,434,],[41,41,-61,-82,-71,-58,-54,-55,-33,-29,-59,41,-34,-53,-68,-63,-52,41,-56,-180,-116,-66,-69,-32,-83,-118,-64,-31,-60,-35,-62,-65,41,-67,41,-70,-84,41,-57,-92,-261,-91,41,41,-117,-30,41,-107,-106,41,-45,-46,41,-119,41,41,41,41,-98,41,41,41,-36,41,-47,41,41,-93,-99,-262,41,41,41,-120,41,41,-121,41,-123,-122,41,41,-108,-37,-39,-42,-38,-40,41,-158,-157,-43,-159,-41,-95,-94,-100,41,-110,-109,-177,-176,41,-174,-160,-173,-161,-172,-175,-164,-162,-163,-168,-167,-165,-169,-166,-171,-170,]),'MINUSEQUAL':([95,96,97,102,103,104,105,106,108,112,113,114,117,118,126,129,135,162,173,174,197,200,204,207,208,210,218,280,301,302,305,309,372,373,374,376,415,423,],[-255,-256,-253,-259,-252,-250,-257,-254,-251,185,-245,-243,-244,-220,-232,-249,-242,-262,-260,-258,-224,-238,-239,-218,-223,-221,-222,-249,-237,-236,-235,-246,-225,-233,-234,-219,-240,-241,]),'INT_CONST_OCT':([56,60,63,77,111,115,116,121,122,124,125,127,128,130,134,152,156,162,167,175,183,184,185,186,187,188,189,190,191,192,193,194,195,196,198,202,203,206,209,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,250,253,256,257,260,261,262,268,269,271,272,273,275,277,278,288,290,295,308,310,338,341,342,343,347,348,350,351,352,353,356,357,358,360,361,362,370,375,378,379,383,386,387,388,390,391,393,396,405,407,409,410,411,412,413,414,418,419,420,422,424,427,429,430,431,432,433,434,],[-261,108,108,-45,-231,108,-229,108,-228,108,-227,108,108,-226,-230,108,108,-262,108,108,108,-186,-189,-187,-183,-184,-188,-190,108,-192,-193,-185,-191,108,-227,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,-263,-39,-42,-38,108,-40,108,108,-158,-157,-43,-159,108,-41,108,-227,108,108,108,-12,108,108,-11,-177,-176,108,-174,108,108,-160,108,-173,-161,108,108,-227,108,-263,108,-263,-141,-172,-175,108,-164,108,-162,108,108,108,-163,108,108,108,-263,108,-168,-167,-165,108,108,108,-169,-166,108,-171,-170,]),'TIMESEQUAL':([95,96,97,102,103,104,105,106,108,112,113,114,117,118,126,129,135,162,173,174,197,200,204,207,208,210,218,280,301,302,305,309,372,373,374,376,415,423,],[-255,-256,-253,-259,-252,-250,-257,-254,-251,194,-245,-243,-244,-220,-232,-249,-242,-262,-260,-258,-224,-238,-239,-218,-223,-221,-222,-249,-237,-236,-235,-246,-225,-233,-234,-219,-240,-241,]),'OR':([95,96,97,102,103,104,105,106,108,112,113,114,117,118,120,126,129,131,135,162,173,174,197,200,204,207,208,210,218,280,301,302,305,309,312,313,314,315,316,317,318,319,320,321,322,323,324,325,326,327,329,330,372,373,374,376,415,423,],[-255,-256,-253,-259,-252,-250,-257,-254,-251,-218,-245,-243,-244,-220,-197,-232,-249,236,-242,-262,-260,-258,-224,-238,-239,-218,-223,-221,-222,-249,-237,-236,-235,-246,-203,236,-204,-202,-206,-210,-205,-201,-208,-213,-199,-198,-207,236,-209,-211,-212,-200,-225,-233,-234,-219,-240,-241,]),'SHORT':([0,1,2,3,5,6,9,10,11,12,13,14,15,17,18,19,22,23,24,25,26,28,30,32,33,34,36,37,38,39,40,41,43,44,45,46,47,49,50,55,56,57,58,60,61,62,64,65,66,75,77,82,84,85,86,87,88,89,90,91,98,127,155,156,157,158,159,160,161,162,178,183,196,205,206,209,211,212,238,239,240,245,249,255,256,257,260,262,269,271,272,273,275,278,282,283,287,296,334,335,347,348,350,351,356,358,360,387,388,391,396,410,419,420,422,430,431,433,434,],[2,2,-61,-82,-71,-58,-54,-55,-33,-29,-59,2,-34,-53,-68,-63,-52,2,-56,-180,-116,-66,-69,-32,-83,-118,-64,-31,-60,-35,-62,-65,2,-67,2,-70,-84,2,-57,-92,-261,-91,2,2,-117,-30,2,-107,-106,2,-45,-46,2,-119,2,2,2,2,-98,2,2,2,-36,2,-47,2,2,-93,-99,-262,2,2,2,-120,2,2,-121,2,-123,-122,2,2,-108,-37,-39,-42,-38,-40,2,-158,-157,-43,-159,-41,-95,-94,-100,2,-110,-109,-177,-176,2,-174,-160,-173,-161,-172,-175,-164,-162,-163,-168,-167,-165,-169,-166,-171,-170,]),'RETURN':([56,77,156,162,256,257,260,262,269,271,272,273,275,277,278,347,348,351,352,356,358,360,361,387,388,391,393,396,409,410,411,413,419,420,422,427,429,430,431,432,433,434,],[-261,-45,261,-262,-39,-42,-38,-40,261,-158,-157,-43,-159,261,-41,-177,-176,-174,261,-160,-173,-161,261,-172,-175,-164,261,-162,261,-163,261,261,-168,-167,-165,261,261,-169,-166,261,-171,-170,]),'RSHIFTEQUAL':([95,96,97,102,103,104,105,106,108,112,113,114,117,118,126,129,135,162,173,174,197,200,204,207,208,210,218,280,301,302,305,309,372,373,374,376,415,423,],[-255,-256,-253,-259,-252,-250,-257,-254,-251,195,-245,-243,-244,-220,-232,-249,-242,-262,-260,-258,-224,-238,-239,-218,-223,-221,-222,-249,-237,-236,-235,-246,-225,-233,-234,-219,-240,-241,]),'RESTRICT':([0,1,2,3,5,6,9,10,11,12,13,14,15,17,18,19,22,23,24,25,26,28,29,30,32,33,34,36,37,38,39,40,41,43,44,45,46,47,49,50,55,56,57,58,60,61,62,64,65,66,68,70,75,77,82,84,85,86,87,88,89,90,91,98,127,149,155,156,157,158,159,160,161,162,178,183,196,205,206,209,211,212,238,239,240,245,249,255,256,257,260,262,269,271,272,273,275,278,282,283,287,296,334,335,347,348,350,351,356,358,360,387,388,391,396,410,419,420,422,430,431,433,434,],[33,33,-61,-82,-71,-58,-54,-55,-33,-29,-59,33,-34,-53,-68,-63,-52,33,-56,-180,-116,-66,33,-69,-32,-83,-118,-64,-31,-60,-35,-62,-65,33,-67,33,-70,-84,33,-57,-92,-261,-91,33,33,-117,-30,33,-107,-106,33,-126,33,-45,-46,33,-119,33,33,33,33,-98,33,33,33,-127,-36,33,-47,33,33,-93,-99,-262,33,33,33,-120,33,33,-121,33,-123,-122,33,33,-108,-37,-39,-42,-38,-40,33,-158,-157,-43,-159,-41,-95,-94,-100,33,-110,-109,-177,-176,33,-174,-160,-173,-161,-172,-175,-164,-162,-163,-168,-167,-165,-169,-166,-171,-170,]),'STATIC':([0,1,2,3,5,6,9,10,11,12,13,14,15,17,18,19,22,23,24,25,26,28,30,32,33,34,36,37,38,39,40,41,43,44,45,46,47,49,50,55,56,57,61,62,64,65,66,75,77,82,84,85,155,156,157,160,162,178,205,211,238,239,240,245,249,255,256,257,260,262,269,271,272,273,275,278,282,283,296,334,335,347,348,350,351,356,358,360,387,388,391,396,410,419,420,422,430,431,433,434,],[9,9,-61,-82,-71,-58,-54,-55,-33,-29,-59,9,-34,-53,-68,-63,-52,9,-56,-180,-116,-66,-69,-32,-83,-118,-64,-31,-60,-35,-62,-65,9,-67,9,-70,-84,9,-57,-92,-261,-91,-117,-30,9,-107,-106,9,-45,-46,9,-119,-36,9,-47,-93,-262,9,-120,-121,-123,-122,9,9,-108,-37,-39,-42,-38,-40,9,-158,-157,-43,-159,-41,-95,-94,9,-110,-109,-177,-176,9,-174,-160,-173,-161,-172,-175,-164,-162,-163,-168,-167,-165,-169,-166,-171,-170,]),'SIZEOF':([56,63,77,111,115,116,121,122,124,125,127,128,130,134,152,156,162,167,175,184,185,186,187,188,189,190,191,192,193,194,195,196,198,202,203,206,209,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,250,253,256,257,260,261,262,268,269,271,272,273,275,277,278,288,290,295,308,310,338,341,342,343,347,348,350,351,352,353,356,357,358,360,361,362,370,375,378,379,383,386,387,388,390,391,393,396,405,407,409,410,411,412,413,414,418,419,420,422,424,427,429,430,431,432,433,434,],[-261,115,-45,-231,115,-229,115,-228,115,-227,115,115,-226,-230,115,115,-262,115,115,-186,-189,-187,-183,-184,-188,-190,115,-192,-193,-185,-191,115,-227,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,-263,-39,-42,-38,115,-40,115,115,-158,-157,-43,-159,115,-41,115,-227,115,115,115,-12,115,115,-11,-177,-176,115,-174,115,115,-160,115,-173,-161,115,115,-227,115,-263,115,-263,-141,-172,-175,115,-164,115,-162,115,115,115,-163,115,115,115,-263,115,-168,-167,-165,115,115,115,-169,-166,115,-171,-170,]),'UNSIGNED':([0,1,2,3,5,6,9,10,11,12,13,14,15,17,18,19,22,23,24,25,26,28,30,32,33,34,36,37,38,39,40,41,43,44,45,46,47,49,50,55,56,57,58,60,61,62,64,65,66,75,77,82,84,85,86,87,88,89,90,91,98,127,155,156,157,158,159,160,161,162,178,183,196,205,206,209,211,212,238,239,240,245,249,255,256,257,260,262,269,271,272,273,275,278,282,283,287,296,334,335,347,348,350,351,356,358,360,387,388,391,396,410,419,420,422,430,431,433,434,],[18,18,-61,-82,-71,-58,-54,-55,-33,-29,-59,18,-34,-53,-68,-63,-52,18,-56,-180,-116,-66,-69,-32,-83,-118,-64,-31,-60,-35,-62,-65,18,-67,18,-70,-84,18,-57,-92,-261,-91,18,18,-117,-30,18,-107,-106,18,-45,-46,18,-119,18,18,18,18,-98,18,18,18,-36,18,-47,18,18,-93,-99,-262,18,18,18,-120,18,18,-121,18,-123,-122,18,18,-108,-37,-39,-42,-38,-40,18,-158,-157,-43,-159,-41,-95,-94,-100,18,-110,-109,-177,-176,18,-174,-160,-173,-161,-172,-175,-164,-162,-163,-168,-167,-165,-169,-166,-171,-170,]),'UNION':([0,1,2,3,5,6,9,10,11,12,13,14,15,17,18,19,22,23,24,25,26,28,30,32,33,34,36,37,38,39,40,41,43,44,45,46,47,49,50,55,56,57,58,60,61,62,64,65,66,75,77,82,84,85,86,87,88,89,90,91,98,127,155,156,157,158,159,160,161,162,178,183,196,205,206,209,211,212,238,239,240,245,249,255,256,257,260,262,269,271,272,273,275,278,282,283,287,296,334,335,347,348,350,351,356,358,360,387,388,391,396,410,419,420,422,430,431,433,434,],[20,20,-61,-82,-71,-58,-54,-55,-33,-29,-59,20,-34,-53,-68,-63,-52,20,-56,-180,-116,-66,-69,-32,-83,-118,-64,-31,-60,-35,-62,-65,20,-67,20,-70,-84,20,-57,-92,-261,-91,20,20,-117,-30,20,-107,-106,20,-45,-46,20,-119,20,20,20,20,-98,20,20,20,-36,20,-47,20,20,-93,-99,-262,20,20,20,-120,20,20,-121,20,-123,-122,20,20,-108,-37,-39,-42,-38,-40,20,-158,-157,-43,-159,-41,-95,-94,-100,20,-110,-109,-177,-176,20,-174,-160,-173,-161,-172,-175,-164,-162,-163,-168,-167,-165,-169,-166,-171,-170,]),'COLON':([2,3,5,6,13,18,19,25,26,28,30,33,34,36,38,40,41,44,46,47,55,57,61,65,66,85,89,91,92,95,96,97,102,103,104,105,106,108,112,113,114,117,118,120,126,129,131,133,135,160,162,163,164,165,166,172,173,174,197,200,204,205,207,208,210,211,217,218,238,239,249,266,280,282,283,285,286,299,301,302,305,309,312,313,314,315,316,317,318,319,320,321,322,323,324,325,326,327,328,329,330,334,335,354,372,373,374,376,377,403,415,423,],[-61,-82,-71,-58,-59,-68,-63,-180,-116,-66,-69,-83,-118,-64,-60,-62,-65,-67,-70,-84,-92,-91,-117,-107,-106,-119,-263,-263,167,-255,-256,-253,-259,-252,-250,-257,-254,-251,-218,-245,-243,-244,-220,-197,-232,-249,-195,-181,-242,-93,-262,-21,-90,-22,-89,288,-260,-258,-224,-238,-239,-120,-218,-223,-221,-121,-178,-222,-123,-122,-108,352,361,-95,-94,-194,167,-182,-237,-236,-235,-246,-203,-215,-204,-202,-206,-210,-205,-201,-208,-213,-199,-198,-207,-214,-209,-211,379,-212,-200,-110,-109,393,-225,-233,-234,-219,-179,-196,-240,-241,]),'$end':([0,8,11,12,15,23,32,37,39,48,62,77,155,162,255,360,],[-263,0,-33,-29,-34,-27,-32,-31,-35,-28,-30,-45,-36,-262,-37,-161,]),'WSTRING_LITERAL':([56,60,63,77,94,102,111,113,115,116,121,122,124,125,127,128,130,134,152,156,162,167,173,175,183,184,185,186,187,188,189,190,191,192,193,194,195,196,198,202,203,206,209,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,250,253,256,257,260,261,262,268,269,271,272,273,275,277,278,288,290,295,308,310,338,341,342,343,347,348,350,351,352,353,356,357,358,360,361,362,370,375,378,379,383,386,387,388,390,391,393,396,405,407,409,410,411,412,413,414,418,419,420,422,424,427,429,430,431,432,433,434,],[-261,102,102,-45,173,-259,-231,173,102,-229,102,-228,102,-227,102,102,-226,-230,102,102,-262,102,-260,102,102,-186,-189,-187,-183,-184,-188,-190,102,-192,-193,-185,-191,102,-227,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,-263,-39,-42,-38,102,-40,102,102,-158,-157,-43,-159,102,-41,102,-227,102,102,102,-12,102,102,-11,-177,-176,102,-174,102,102,-160,102,-173,-161,102,102,-227,102,-263,102,-263,-141,-172,-175,102,-164,102,-162,102,102,102,-163,102,102,102,-263,102,-168,-167,-165,102,102,102,-169,-166,102,-171,-170,]),'DIVIDE':([95,96,97,102,103,104,105,106,108,112,113,114,117,118,120,126,129,131,135,162,173,174,197,200,204,207,208,210,218,280,301,302,305,309,312,313,314,315,316,317,318,319,320,321,322,323,324,325,326,327,329,330,372,373,374,376,415,423,],[-255,-256,-253,-259,-252,-250,-257,-254,-251,-218,-245,-243,-244,-220,-197,-232,-249,229,-242,-262,-260,-258,-224,-238,-239,-218,-223,-221,-222,-249,-237,-236,-235,-246,229,229,229,229,229,229,229,229,229,229,-199,-198,229,229,229,229,229,-200,-225,-233,-234,-219,-240,-241,]),'FOR':([56,77,156,162,256,257,260,262,269,271,272,273,275,277,278,347,348,351,352,356,358,360,361,387,388,391,393,396,409,410,411,413,419,420,422,427,429,430,431,432,433,434,],[-261,-45,263,-262,-39,-42,-38,-40,263,-158,-157,-43,-159,263,-41,-177,-176,-174,263,-160,-173,-161,263,-172,-175,-164,263,-162,263,-163,263,263,-168,-167,-165,263,263,-169,-166,263,-171,-170,]),'PLUSPLUS':([56,63,77,95,96,97,102,103,104,105,106,108,111,113,114,115,116,117,118,121,122,124,125,126,127,128,129,130,134,135,152,156,162,167,173,174,175,184,185,186,187,188,189,190,191,192,193,194,195,196,198,200,202,203,204,206,209,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,250,253,256,257,260,261,262,268,269,271,272,273,275,277,278,280,288,290,295,301,302,305,308,309,310,338,341,342,343,347,348,350,351,352,353,356,357,358,360,361,362,370,373,374,375,378,379,383,386,387,388,390,391,393,396,405,407,409,410,411,412,413,414,415,418,419,420,422,423,424,427,429,430,431,432,433,434,],[-261,124,-45,-255,-256,-253,-259,-252,-250,-257,-254,-251,-231,-245,-243,124,-229,-244,200,124,-228,124,-227,-232,124,124,-249,-226,-230,-242,124,124,-262,124,-260,-258,124,-186,-189,-187,-183,-184,-188,-190,124,-192,-193,-185,-191,124,-227,-238,124,124,-239,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,-263,-39,-42,-38,124,-40,124,124,-158,-157,-43,-159,124,-41,-249,124,-227,124,-237,-236,-235,124,-246,124,-12,124,124,-11,-177,-176,124,-174,124,124,-160,124,-173,-161,124,124,-227,-233,-234,124,-263,124,-263,-141,-172,-175,124,-164,124,-162,124,124,124,-163,124,124,124,-263,-240,124,-168,-167,-165,-241,124,124,124,-169,-166,124,-171,-170,]),'EQUALS':([26,34,61,75,85,95,96,97,102,103,104,105,106,108,112,113,114,117,118,126,129,135,148,154,162,173,174,197,200,204,205,207,208,210,211,218,238,239,280,301,302,305,309,339,345,372,373,374,376,380,385,404,415,423,],[-116,-118,-117,152,-119,-255,-256,-253,-259,-252,-250,-257,-254,-251,187,-245,-243,-244,-220,-232,-249,-242,250,152,-262,-260,-258,-224,-238,-239,-120,-218,-223,-221,-121,-222,-123,-122,-249,-237,-236,-235,-246,-142,386,-225,-233,-234,-219,-145,-143,-144,-240,-241,]),'ELSE':([162,256,257,260,262,273,278,347,348,351,358,360,387,388,391,396,410,419,420,422,430,431,433,434,],[-262,-39,-42,-38,-40,-43,-41,-177,-176,-174,-173,-161,-172,-175,-164,-162,-163,-168,-167,427,-169,-166,-171,-170,]),'ANDEQUAL':([95,96,97,102,103,104,105,106,108,112,113,114,117,118,126,129,135,162,173,174,197,200,204,207,208,210,218,280,301,302,305,309,372,373,374,376,415,423,],[-255,-256,-253,-259,-252,-250,-257,-254,-251,192,-245,-243,-244,-220,-232,-249,-242,-262,-260,-258,-224,-238,-239,-218,-223,-221,-222,-249,-237,-236,-235,-246,-225,-233,-234,-219,-240,-241,]),'EQ':([95,96,97,102,103,104,105,106,108,112,113,114,117,118,120,126,129,131,135,162,173,174,197,200,204,207,208,210,218,280,301,302,305,309,312,313,314,315,316,317,318,319,320,321,322,323,324,325,326,327,329,330,372,373,374,376,415,423,],[-255,-256,-253,-259,-252,-250,-257,-254,-251,-218,-245,-243,-244,-220,-197,-232,-249,233,-242,-262,-260,-258,-224,-238,-239,-218,-223,-221,-222,-249,-237,-236,-235,-246,-203,233,-204,-202,-206,-210,-205,-201,-208,233,-199,-198,-207,233,-209,233,233,-200,-225,-233,-234,-219,-240,-241,]),'AND':([56,63,77,95,96,97,102,103,104,105,106,108,111,112,113,114,115,116,117,118,120,121,122,124,125,126,127,128,129,130,131,134,135,152,156,162,167,173,174,175,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,200,202,203,204,206,207,208,209,210,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,250,253,256,257,260,261,262,268,269,271,272,273,275,277,278,280,288,290,295,301,302,305,308,309,310,312,313,314,315,316,317,318,319,320,321,322,323,324,325,326,327,329,330,338,341,342,343,347,348,350,351,352,353,356,357,358,360,361,362,370,372,373,374,375,376,378,379,383,386,387,388,390,391,393,396,405,407,409,410,411,412,413,414,415,418,419,420,422,423,424,427,429,430,431,432,433,434,],[-261,130,-45,-255,-256,-253,-259,-252,-250,-257,-254,-251,-231,-218,-245,-243,130,-229,-244,-220,-197,130,-228,130,-227,-232,130,130,-249,-226,234,-230,-242,130,130,-262,130,-260,-258,130,-186,-189,-187,-183,-184,-188,-190,130,-192,-193,-185,-191,130,-224,-227,-238,130,130,-239,130,-218,-223,130,-221,-222,130,130,130,130,130,130,130,130,130,130,130,130,130,130,130,130,130,130,130,130,-263,-39,-42,-38,130,-40,130,130,-158,-157,-43,-159,130,-41,-249,130,-227,130,-237,-236,-235,130,-246,130,-203,234,-204,-202,-206,-210,-205,-201,-208,234,-199,-198,-207,234,-209,-211,234,-200,-12,130,130,-11,-177,-176,130,-174,130,130,-160,130,-173,-161,130,130,-227,-225,-233,-234,130,-219,-263,130,-263,-141,-172,-175,130,-164,130,-162,130,130,130,-163,130,130,130,-263,-240,130,-168,-167,-165,-241,130,130,130,-169,-166,130,-171,-170,]),'TYPEID':([0,1,2,3,5,6,7,9,10,11,12,13,14,15,17,18,19,20,22,23,24,25,26,27,28,30,32,33,34,35,36,37,38,39,40,41,43,44,45,46,47,49,50,55,56,57,58,60,61,62,64,65,66,75,77,82,84,85,86,87,88,89,90,91,98,127,155,156,157,158,159,160,161,162,178,183,196,205,206,209,211,212,238,239,240,245,249,255,256,257,260,262,269,271,272,273,275,278,282,283,287,296,334,335,347,348,350,351,356,358,360,387,388,391,396,410,419,420,422,430,431,433,434,],[25,25,-61,-82,-71,-58,55,-54,-55,-33,-29,-59,25,-34,-53,-68,-63,-97,-52,25,-56,-180,-116,65,-66,-69,-32,-83,-118,-96,-64,-31,-60,-35,-62,-65,25,-67,25,-70,-84,25,-57,-92,-261,-91,25,25,-117,-30,25,-107,-106,25,-45,-46,25,-119,25,25,25,25,-98,25,25,25,-36,25,-47,25,25,-93,-99,-262,25,25,25,-120,25,25,-121,25,-123,-122,25,25,-108,-37,-39,-42,-38,-40,25,-158,-157,-43,-159,-41,-95,-94,-100,25,-110,-109,-177,-176,25,-174,-160,-173,-161,-172,-175,-164,-162,-163,-168,-167,-165,-169,-166,-171,-170,]),'LBRACE':([7,20,26,27,34,35,49,55,56,57,61,65,66,75,77,80,82,83,84,85,152,153,156,157,162,205,211,238,239,253,256,257,260,262,269,271,272,273,275,277,278,311,338,342,343,347,348,351,352,356,358,360,361,372,378,383,386,387,388,391,393,396,405,409,410,411,413,414,419,420,422,427,429,430,431,432,433,434,],[56,-97,-116,56,-118,-96,-263,56,-261,56,-117,56,56,-263,-45,-7,-46,56,-8,-119,56,56,56,-47,-262,-120,-121,-123,-122,-263,-39,-42,-38,-40,56,-158,-157,-43,-159,56,-41,56,-12,56,-11,-177,-176,-174,56,-160,-173,-161,56,56,-263,-263,-141,-172,-175,-164,56,-162,56,56,-163,56,56,-263,-168,-167,-165,56,56,-169,-166,56,-171,-170,]),'PPHASH':([0,11,12,15,23,32,37,39,62,77,155,162,255,360,],[39,-33,-29,-34,39,-32,-31,-35,-30,-45,-36,-262,-37,-161,]),'INT':([0,1,2,3,5,6,9,10,11,12,13,14,15,17,18,19,22,23,24,25,26,28,30,32,33,34,36,37,38,39,40,41,43,44,45,46,47,49,50,55,56,57,58,60,61,62,64,65,66,75,77,82,84,85,86,87,88,89,90,91,98,127,155,156,157,158,159,160,161,162,178,183,196,205,206,209,211,212,238,239,240,245,249,255,256,257,260,262,269,271,272,273,275,278,282,283,287,296,334,335,347,348,350,351,356,358,360,387,388,391,396,410,419,420,422,430,431,433,434,],[40,40,-61,-82,-71,-58,-54,-55,-33,-29,-59,40,-34,-53,-68,-63,-52,40,-56,-180,-116,-66,-69,-32,-83,-118,-64,-31,-60,-35,-62,-65,40,-67,40,-70,-84,40,-57,-92,-261,-91,40,40,-117,-30,40,-107,-106,40,-45,-46,40,-119,40,40,40,40,-98,40,40,40,-36,40,-47,40,40,-93,-99,-262,40,40,40,-120,40,40,-121,40,-123,-122,40,40,-108,-37,-39,-42,-38,-40,40,-158,-157,-43,-159,-41,-95,-94,-100,40,-110,-109,-177,-176,40,-174,-160,-173,-161,-172,-175,-164,-162,-163,-168,-167,-165,-169,-166,-171,-170,]),'SIGNED':([0,1,2,3,5,6,9,10,11,12,13,14,15,17,18,19,22,23,24,25,26,28,30,32,33,34,36,37,38,39,40,41,43,44,45,46,47,49,50,55,56,57,58,60,61,62,64,65,66,75,77,82,84,85,86,87,88,89,90,91,98,127,155,156,157,158,159,160,161,162,178,183,196,205,206,209,211,212,238,239,240,245,249,255,256,257,260,262,269,271,272,273,275,278,282,283,287,296,334,335,347,348,350,351,356,358,360,387,388,391,396,410,419,420,422,430,431,433,434,],[44,44,-61,-82,-71,-58,-54,-55,-33,-29,-59,44,-34,-53,-68,-63,-52,44,-56,-180,-116,-66,-69,-32,-83,-118,-64,-31,-60,-35,-62,-65,44,-67,44,-70,-84,44,-57,-92,-261,-91,44,44,-117,-30,44,-107,-106,44,-45,-46,44,-119,44,44,44,44,-98,44,44,44,-36,44,-47,44,44,-93,-99,-262,44,44,44,-120,44,44,-121,44,-123,-122,44,44,-108,-37,-39,-42,-38,-40,44,-158,-157,-43,-159,-41,-95,-94,-100,44,-110,-109,-177,-176,44,-174,-160,-173,-161,-172,-175,-164,-162,-163,-168,-167,-165,-169,-166,-171,-170,]),'CONTINUE':([56,77,156,162,256,257,260,262,269,271,272,273,275,277,278,347,348,351,352,356,358,360,361,387,388,391,393,396,409,410,411,413,419,420,422,427,429,430,431,432,433,434,],[-261,-45,264,-262,-39,-42,-38,-40,264,-158,-157,-43,-159,264,-41,-177,-176,-174,264,-160,-173,-161,264,-172,-175,-164,264,-162,264,-163,264,264,-168,-167,-165,264,264,-169,-166,264,-171,-170,]),'NOT':([56,63,77,111,115,116,121,122,124,125,127,128,130,134,152,156,162,167,175,184,185,186,187,188,189,190,191,192,193,194,195,196,198,202,203,206,209,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,250,253,256,257,260,261,262,268,269,271,272,273,275,277,278,288,290,295,308,310,338,341,342,343,347,348,350,351,352,353,356,357,358,360,361,362,370,375,378,379,383,386,387,388,390,391,393,396,405,407,409,410,411,412,413,414,418,419,420,422,424,427,429,430,431,432,433,434,],[-261,134,-45,-231,134,-229,134,-228,134,-227,134,134,-226,-230,134,134,-262,134,134,-186,-189,-187,-183,-184,-188,-190,134,-192,-193,-185,-191,134,-227,134,134,134,134,134,134,134,134,134,134,134,134,134,134,134,134,134,134,134,134,134,134,134,134,-263,-39,-42,-38,134,-40,134,134,-158,-157,-43,-159,134,-41,134,-227,134,134,134,-12,134,134,-11,-177,-176,134,-174,134,134,-160,134,-173,-161,134,134,-227,134,-263,134,-263,-141,-172,-175,134,-164,134,-162,134,134,134,-163,134,134,134,-263,134,-168,-167,-165,134,134,134,-169,-166,134,-171,-170,]),'OREQUAL':([95,96,97,102,103,104,105,106,108,112,113,114,117,118,126,129,135,162,173,174,197,200,204,207,208,210,218,280,301,302,305,309,372,373,374,376,415,423,],[-255,-256,-253,-259,-252,-250,-257,-254,-251,193,-245,-243,-244,-220,-232,-249,-242,-262,-260,-258,-224,-238,-239,-218,-223,-221,-222,-249,-237,-236,-235,-246,-225,-233,-234,-219,-240,-241,]),'MOD':([95,96,97,102,103,104,105,106,108,112,113,114,117,118,120,126,129,131,135,162,173,174,197,200,204,207,208,210,218,280,301,302,305,309,312,313,314,315,316,317,318,319,320,321,322,323,324,325,326,327,329,330,372,373,374,376,415,423,],[-255,-256,-253,-259,-252,-250,-257,-254,-251,-218,-245,-243,-244,-220,-197,-232,-249,237,-242,-262,-260,-258,-224,-238,-239,-218,-223,-221,-222,-249,-237,-236,-235,-246,237,237,237,237,237,237,237,237,237,237,-199,-198,237,237,237,237,237,-200,-225,-233,-234,-219,-240,-241,]),'RSHIFT':([95,96,97,102,103,104,105,106,108,112,113,114,117,118,120,126,129,131,135,162,173,174,197,200,204,207,208,210,218,280,301,302,305,309,312,313,314,315,316,317,318,319,320,321,322,323,324,325,326,327,329,330,372,373,374,376,415,423,],[-255,-256,-253,-259,-252,-250,-257,-254,-251,-218,-245,-243,-244,-220,-197,-232,-249,219,-242,-262,-260,-258,-224,-238,-239,-218,-223,-221,-222,-249,-237,-236,-235,-246,-203,219,-204,-202,219,219,219,-201,219,219,-199,-198,219,219,219,219,219,-200,-225,-233,-234,-219,-240,-241,]),'DEFAULT':([56,77,156,162,256,257,260,262,269,271,272,273,275,277,278,347,348,351,352,356,358,360,361,387,388,391,393,396,409,410,411,413,419,420,422,427,429,430,431,432,433,434,],[-261,-45,266,-262,-39,-42,-38,-40,266,-158,-157,-43,-159,266,-41,-177,-176,-174,266,-160,-173,-161,266,-172,-175,-164,266,-162,266,-163,266,266,-168,-167,-165,266,266,-169,-166,266,-171,-170,]),'CHAR':([0,1,2,3,5,6,9,10,11,12,13,14,15,17,18,19,22,23,24,25,26,28,30,32,33,34,36,37,38,39,40,41,43,44,45,46,47,49,50,55,56,57,58,60,61,62,64,65,66,75,77,82,84,85,86,87,88,89,90,91,98,127,155,156,157,158,159,160,161,162,178,183,196,205,206,209,211,212,238,239,240,245,249,255,256,257,260,262,269,271,272,273,275,278,282,283,287,296,334,335,347,348,350,351,356,358,360,387,388,391,396,410,419,420,422,430,431,433,434,],[38,38,-61,-82,-71,-58,-54,-55,-33,-29,-59,38,-34,-53,-68,-63,-52,38,-56,-180,-116,-66,-69,-32,-83,-118,-64,-31,-60,-35,-62,-65,38,-67,38,-70,-84,38,-57,-92,-261,-91,38,38,-117,-30,38,-107,-106,38,-45,-46,38,-119,38,38,38,38,-98,38,38,38,-36,38,-47,38,38,-93,-99,-262,38,38,38,-120,38,38,-121,38,-123,-122,38,38,-108,-37,-39,-42,-38,-40,38,-158,-157,-43,-159,-41,-95,-94,-100,38,-110,-109,-177,-176,38,-174,-160,-173,-161,-172,-175,-164,-162,-163,-168,-167,-165,-169,-166,-171,-170,]),'WHILE':([56,77,156,162,256,257,260,262,269,271,272,273,275,277,278,347,348,351,352,356,358,359,360,361,387,388,391,393,396,409,410,411,413,419,420,422,427,429,430,431,432,433,434,],[-261,-45,267,-262,-39,-42,-38,-40,267,-158,-157,-43,-159,267,-41,-177,-176,-174,267,-160,-173,395,-161,267,-172,-175,-164,267,-162,267,-163,267,267,-168,-167,-165,267,267,-169,-166,267,-171,-170,]),'DIVEQUAL':([95,96,97,102,103,104,105,106,108,112,113,114,117,118,126,129,135,162,173,174,197,200,204,207,208,210,218,280,301,302,305,309,372,373,374,376,415,423,],[-255,-256,-253,-259,-252,-250,-257,-254,-251,184,-245,-243,-244,-220,-232,-249,-242,-262,-260,-258,-224,-238,-239,-218,-223,-221,-222,-249,-237,-236,-235,-246,-225,-233,-234,-219,-240,-241,]),'EXTERN':([0,1,2,3,5,6,9,10,11,12,13,14,15,17,18,19,22,23,24,25,26,28,30,32,33,34,36,37,38,39,40,41,43,44,45,46,47,49,50,55,56,57,61,62,64,65,66,75,77,82,84,85,155,156,157,160,162,178,205,211,238,239,240,245,249,255,256,257,260,262,269,271,272,273,275,278,282,283,296,334,335,347,348,350,351,356,358,360,387,388,391,396,410,419,420,422,430,431,433,434,],[10,10,-61,-82,-71,-58,-54,-55,-33,-29,-59,10,-34,-53,-68,-63,-52,10,-56,-180,-116,-66,-69,-32,-83,-118,-64,-31,-60,-35,-62,-65,10,-67,10,-70,-84,10,-57,-92,-261,-91,-117,-30,10,-107,-106,10,-45,-46,10,-119,-36,10,-47,-93,-262,10,-120,-121,-123,-122,10,10,-108,-37,-39,-42,-38,-40,10,-158,-157,-43,-159,-41,-95,-94,10,-110,-109,-177,-176,10,-174,-160,-173,-161,-172,-175,-164,-162,-163,-168,-167,-165,-169,-166,-171,-170,]),'CASE':([56,77,156,162,256,257,260,262,269,271,272,273,275,277,278,347,348,351,352,356,358,360,361,387,388,391,393,396,409,410,411,413,419,420,422,427,429,430,431,432,433,434,],[-261,-45,268,-262,-39,-42,-38,-40,268,-158,-157,-43,-159,268,-41,-177,-176,-174,268,-160,-173,-161,268,-172,-175,-164,268,-162,268,-163,268,268,-168,-167,-165,268,268,-169,-166,268,-171,-170,]),'LAND':([95,96,97,102,103,104,105,106,108,112,113,114,117,118,120,126,129,131,135,162,173,174,197,200,204,207,208,210,218,280,301,302,305,309,312,313,314,315,316,317,318,319,320,321,322,323,324,325,326,327,329,330,372,373,374,376,415,423,],[-255,-256,-253,-259,-252,-250,-257,-254,-251,-218,-245,-243,-244,-220,-197,-232,-249,232,-242,-262,-260,-258,-224,-238,-239,-218,-223,-221,-222,-249,-237,-236,-235,-246,-203,232,-204,-202,-206,-210,-205,-201,-208,-213,-199,-198,-207,-214,-209,-211,-212,-200,-225,-233,-234,-219,-240,-241,]),'REGISTER':([0,1,2,3,5,6,9,10,11,12,13,14,15,17,18,19,22,23,24,25,26,28,30,32,33,34,36,37,38,39,40,41,43,44,45,46,47,49,50,55,56,57,61,62,64,65,66,75,77,82,84,85,155,156,157,160,162,178,205,211,238,239,240,245,249,255,256,257,260,262,269,271,272,273,275,278,282,283,296,334,335,347,348,350,351,356,358,360,387,388,391,396,410,419,420,422,430,431,433,434,],[17,17,-61,-82,-71,-58,-54,-55,-33,-29,-59,17,-34,-53,-68,-63,-52,17,-56,-180,-116,-66,-69,-32,-83,-118,-64,-31,-60,-35,-62,-65,17,-67,17,-70,-84,17,-57,-92,-261,-91,-117,-30,17,-107,-106,17,-45,-46,17,-119,-36,17,-47,-93,-262,17,-120,-121,-123,-122,17,17,-108,-37,-39,-42,-38,-40,17,-158,-157,-43,-159,-41,-95,-94,17,-110,-109,-177,-176,17,-174,-160,-173,-161,-172,-175,-164,-162,-163,-168,-167,-165,-169,-166,-171,-170,]),'MODEQUAL':([95,96,97,102,103,104,105,106,108,112,113,114,117,118,126,129,135,162,173,174,197,200,204,207,208,210,218,280,301,302,305,309,372,373,374,376,415,423,],[-255,-256,-253,-259,-252,-250,-257,-254,-251,186,-245,-243,-244,-220,-232,-249,-242,-262,-260,-258,-224,-238,-239,-218,-223,-221,-222,-249,-237,-236,-235,-246,-225,-233,-234,-219,-240,-241,]),'NE':([95,96,97,102,103,104,105,106,108,112,113,114,117,118,120,126,129,131,135,162,173,174,197,200,204,207,208,210,218,280,301,302,305,309,312,313,314,315,316,317,318,319,320,321,322,323,324,325,326,327,329,330,372,373,374,376,415,423,],[-255,-256,-253,-259,-252,-250,-257,-254,-251,-218,-245,-243,-244,-220,-197,-232,-249,224,-242,-262,-260,-258,-224,-238,-239,-218,-223,-221,-222,-249,-237,-236,-235,-246,-203,224,-204,-202,-206,-210,-205,-201,-208,224,-199,-198,-207,224,-209,224,224,-200,-225,-233,-234,-219,-240,-241,]),'SWITCH':([56,77,156,162,256,257,260,262,269,271,272,273,275,277,278,347,348,351,352,356,358,360,361,387,388,391,393,396,409,410,411,413,419,420,422,427,429,430,431,432,433,434,],[-261,-45,270,-262,-39,-42,-38,-40,270,-158,-157,-43,-159,270,-41,-177,-176,-174,270,-160,-173,-161,270,-172,-175,-164,270,-162,270,-163,270,270,-168,-167,-165,270,270,-169,-166,270,-171,-170,]),'INT_CONST_HEX':([56,60,63,77,111,115,116,121,122,124,125,127,128,130,134,152,156,162,167,175,183,184,185,186,187,188,189,190,191,192,193,194,195,196,198,202,203,206,209,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,250,253,256,257,260,261,262,268,269,271,272,273,275,277,278,288,290,295,308,310,338,341,342,343,347,348,350,351,352,353,356,357,358,360,361,362,370,375,378,379,383,386,387,388,390,391,393,396,405,407,409,410,411,412,413,414,418,419,420,422,424,427,429,430,431,432,433,434,],[-261,103,103,-45,-231,103,-229,103,-228,103,-227,103,103,-226,-230,103,103,-262,103,103,103,-186,-189,-187,-183,-184,-188,-190,103,-192,-193,-185,-191,103,-227,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,-263,-39,-42,-38,103,-40,103,103,-158,-157,-43,-159,103,-41,103,-227,103,103,103,-12,103,103,-11,-177,-176,103,-174,103,103,-160,103,-173,-161,103,103,-227,103,-263,103,-263,-141,-172,-175,103,-164,103,-162,103,103,103,-163,103,103,103,-263,103,-168,-167,-165,103,103,103,-169,-166,103,-171,-170,]),'_COMPLEX':([0,1,2,3,5,6,9,10,11,12,13,14,15,17,18,19,22,23,24,25,26,28,30,32,33,34,36,37,38,39,40,41,43,44,45,46,47,49,50,55,56,57,58,60,61,62,64,65,66,75,77,82,84,85,86,87,88,89,90,91,98,127,155,156,157,158,159,160,161,162,178,183,196,205,206,209,211,212,238,239,240,245,249,255,256,257,260,262,269,271,272,273,275,278,282,283,287,296,334,335,347,348,350,351,356,358,360,387,388,391,396,410,419,420,422,430,431,433,434,],[28,28,-61,-82,-71,-58,-54,-55,-33,-29,-59,28,-34,-53,-68,-63,-52,28,-56,-180,-116,-66,-69,-32,-83,-118,-64,-31,-60,-35,-62,-65,28,-67,28,-70,-84,28,-57,-92,-261,-91,28,28,-117,-30,28,-107,-106,28,-45,-46,28,-119,28,28,28,28,-98,28,28,28,-36,28,-47,28,28,-93,-99,-262,28,28,28,-120,28,28,-121,28,-123,-122,28,28,-108,-37,-39,-42,-38,-40,28,-158,-157,-43,-159,-41,-95,-94,-100,28,-110,-109,-177,-176,28,-174,-160,-173,-161,-172,-175,-164,-162,-163,-168,-167,-165,-169,-166,-171,-170,]),'PLUSEQUAL':([95,96,97,102,103,104,105,106,108,112,113,114,117,118,126,129,135,162,173,174,197,200,204,207,208,210,218,280,301,302,305,309,372,373,374,376,415,423,],[-255,-256,-253,-259,-252,-250,-257,-254,-251,189,-245,-243,-244,-220,-232,-249,-242,-262,-260,-258,-224,-238,-239,-218,-223,-221,-222,-249,-237,-236,-235,-246,-225,-233,-234,-219,-240,-241,]),'STRUCT':([0,1,2,3,5,6,9,10,11,12,13,14,15,17,18,19,22,23,24,25,26,28,30,32,33,34,36,37,38,39,40,41,43,44,45,46,47,49,50,55,56,57,58,60,61,62,64,65,66,75,77,82,84,85,86,87,88,89,90,91,98,127,155,156,157,158,159,160,161,162,178,183,196,205,206,209,211,212,238,239,240,245,249,255,256,257,260,262,269,271,272,273,275,278,282,283,287,296,334,335,347,348,350,351,356,358,360,387,388,391,396,410,419,420,422,430,431,433,434,],[35,35,-61,-82,-71,-58,-54,-55,-33,-29,-59,35,-34,-53,-68,-63,-52,35,-56,-180,-116,-66,-69,-32,-83,-118,-64,-31,-60,-35,-62,-65,35,-67,35,-70,-84,35,-57,-92,-261,-91,35,35,-117,-30,35,-107,-106,35,-45,-46,35,-119,35,35,35,35,-98,35,35,35,-36,35,-47,35,35,-93,-99,-262,35,35,35,-120,35,35,-121,35,-123,-122,35,35,-108,-37,-39,-42,-38,-40,35,-158,-157,-43,-159,-41,-95,-94,-100,35,-110,-109,-177,-176,35,-174,-160,-173,-161,-172,-175,-164,-162,-163,-168,-167,-165,-169,-166,-171,-170,]),'CONDOP':([95,96,97,102,103,104,105,106,108,112,113,114,117,118,120,126,129,131,135,162,173,174,197,200,204,207,208,210,218,280,301,302,305,309,312,313,314,315,316,317,318,319,320,321,322,323,324,325,326,327,329,330,372,373,374,376,415,423,],[-255,-256,-253,-259,-252,-250,-257,-254,-251,-218,-245,-243,-244,-220,-197,-232,-249,235,-242,-262,-260,-258,-224,-238,-239,-218,-223,-221,-222,-249,-237,-236,-235,-246,-203,-215,-204,-202,-206,-210,-205,-201,-208,-213,-199,-198,-207,-214,-209,-211,-212,-200,-225,-233,-234,-219,-240,-241,]),'BREAK':([56,77,156,162,256,257,260,262,269,271,272,273,275,277,278,347,348,351,352,356,358,360,361,387,388,391,393,396,409,410,411,413,419,420,422,427,429,430,431,432,433,434,],[-261,-45,274,-262,-39,-42,-38,-40,274,-158,-157,-43,-159,274,-41,-177,-176,-174,274,-160,-173,-161,274,-172,-175,-164,274,-162,274,-163,274,274,-168,-167,-165,274,274,-169,-166,274,-171,-170,]),'VOLATILE':([0,1,2,3,5,6,9,10,11,12,13,14,15,17,18,19,22,23,24,25,26,28,29,30,32,33,34,36,37,38,39,40,41,43,44,45,46,47,49,50,55,56,57,58,60,61,62,64,65,66,68,70,75,77,82,84,85,86,87,88,89,90,91,98,127,149,155,156,157,158,159,160,161,162,178,183,196,205,206,209,211,212,238,239,240,245,249,255,256,257,260,262,269,271,272,273,275,278,282,283,287,296,334,335,347,348,350,351,356,358,360,387,388,391,396,410,419,420,422,430,431,433,434,],[47,47,-61,-82,-71,-58,-54,-55,-33,-29,-59,47,-34,-53,-68,-63,-52,47,-56,-180,-116,-66,47,-69,-32,-83,-118,-64,-31,-60,-35,-62,-65,47,-67,47,-70,-84,47,-57,-92,-261,-91,47,47,-117,-30,47,-107,-106,47,-126,47,-45,-46,47,-119,47,47,47,47,-98,47,47,47,-127,-36,47,-47,47,47,-93,-99,-262,47,47,47,-120,47,47,-121,47,-123,-122,47,47,-108,-37,-39,-42,-38,-40,47,-158,-157,-43,-159,-41,-95,-94,-100,47,-110,-109,-177,-176,47,-174,-160,-173,-161,-172,-175,-164,-162,-163,-168,-167,-165,-169,-166,-171,-170,]),'INLINE':([0,1,2,3,5,6,9,10,11,12,13,14,15,17,18,19,22,23,24,25,26,28,30,32,33,34,36,37,38,39,40,41,43,44,45,46,47,49,50,55,56,57,61,62,64,65,66,75,77,82,84,85,155,156,157,160,162,178,205,211,238,239,240,245,249,255,256,257,260,262,269,271,272,273,275,278,282,283,296,334,335,347,348,350,351,356,358,360,387,388,391,396,410,419,420,422,430,431,433,434,],[50,50,-61,-82,-71,-58,-54,-55,-33,-29,-59,50,-34,-53,-68,-63,-52,50,-56,-180,-116,-66,-69,-32,-83,-118,-64,-31,-60,-35,-62,-65,50,-67,50,-70,-84,50,-57,-92,-261,-91,-117,-30,50,-107,-106,50,-45,-46,50,-119,-36,50,-47,-93,-262,50,-120,-121,-123,-122,50,50,-108,-37,-39,-42,-38,-40,50,-158,-157,-43,-159,-41,-95,-94,50,-110,-109,-177,-176,50,-174,-160,-173,-161,-172,-175,-164,-162,-163,-168,-167,-165,-169,-166,-171,-170,]),'DO':([56,77,156,162,256,257,260,262,269,271,272,273,275,277,278,347,348,351,352,356,358,360,361,387,388,391,393,396,409,410,411,413,419,420,422,427,429,430,431,432,433,434,],[-261,-45,277,-262,-39,-42,-38,-40,277,-158,-157,-43,-159,277,-41,-177,-176,-174,277,-160,-173,-161,277,-172,-175,-164,277,-162,277,-163,277,277,-168,-167,-165,277,277,-169,-166,277,-171,-170,]),'LNOT':([56,63,77,111,115,116,121,122,124,125,127,128,130,134,152,156,162,167,175,184,185,186,187,188,189,190,191,192,193,194,195,196,198,202,203,206,209,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,250,253,256,257,260,261,262,268,269,271,272,273,275,277,278,288,290,295,308,310,338,341,342,343,347,348,350,351,352,353,356,357,358,360,361,362,370,375,378,379,383,386,387,388,390,391,393,396,405,407,409,410,411,412,413,414,418,419,420,422,424,427,429,430,431,432,433,434,],[-261,111,-45,-231,111,-229,111,-228,111,-227,111,111,-226,-230,111,111,-262,111,111,-186,-189,-187,-183,-184,-188,-190,111,-192,-193,-185,-191,111,-227,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,-263,-39,-42,-38,111,-40,111,111,-158,-157,-43,-159,111,-41,111,-227,111,111,111,-12,111,111,-11,-177,-176,111,-174,111,111,-160,111,-173,-161,111,111,-227,111,-263,111,-263,-141,-172,-175,111,-164,111,-162,111,111,111,-163,111,111,111,-263,111,-168,-167,-165,111,111,111,-169,-166,111,-171,-170,]),'CONST':([0,1,2,3,5,6,9,10,11,12,13,14,15,17,18,19,22,23,24,25,26,28,29,30,32,33,34,36,37,38,39,40,41,43,44,45,46,47,49,50,55,56,57,58,60,61,62,64,65,66,68,70,75,77,82,84,85,86,87,88,89,90,91,98,127,149,155,156,157,158,159,160,161,162,178,183,196,205,206,209,211,212,238,239,240,245,249,255,256,257,260,262,269,271,272,273,275,278,282,283,287,296,334,335,347,348,350,351,356,358,360,387,388,391,396,410,419,420,422,430,431,433,434,],[3,3,-61,-82,-71,-58,-54,-55,-33,-29,-59,3,-34,-53,-68,-63,-52,3,-56,-180,-116,-66,3,-69,-32,-83,-118,-64,-31,-60,-35,-62,-65,3,-67,3,-70,-84,3,-57,-92,-261,-91,3,3,-117,-30,3,-107,-106,3,-126,3,-45,-46,3,-119,3,3,3,3,-98,3,3,3,-127,-36,3,-47,3,3,-93,-99,-262,3,3,3,-120,3,3,-121,3,-123,-122,3,3,-108,-37,-39,-42,-38,-40,3,-158,-157,-43,-159,-41,-95,-94,-100,3,-110,-109,-177,-176,3,-174,-160,-173,-161,-172,-175,-164,-162,-163,-168,-167,-165,-169,-166,-171,-170,]),'LOR':([95,96,97,102,103,104,105,106,108,112,113,114,117,118,120,126,129,131,135,162,173,174,197,200,204,207,208,210,218,280,301,302,305,309,312,313,314,315,316,317,318,319,320,321,322,323,324,325,326,327,329,330,372,373,374,376,415,423,],[-255,-256,-253,-259,-252,-250,-257,-254,-251,-218,-245,-243,-244,-220,-197,-232,-249,220,-242,-262,-260,-258,-224,-238,-239,-218,-223,-221,-222,-249,-237,-236,-235,-246,-203,-215,-204,-202,-206,-210,-205,-201,-208,-213,-199,-198,-207,-214,-209,-211,-212,-200,-225,-233,-234,-219,-240,-241,]),'CHAR_CONST':([56,60,63,77,111,115,116,121,122,124,125,127,128,130,134,152,156,162,167,175,183,184,185,186,187,188,189,190,191,192,193,194,195,196,198,202,203,206,209,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,250,253,256,257,260,261,262,268,269,271,272,273,275,277,278,288,290,295,308,310,338,341,342,343,347,348,350,351,352,353,356,357,358,360,361,362,370,375,378,379,383,386,387,388,390,391,393,396,405,407,409,410,411,412,413,414,418,419,420,422,424,427,429,430,431,432,433,434,],[-261,95,95,-45,-231,95,-229,95,-228,95,-227,95,95,-226,-230,95,95,-262,95,95,95,-186,-189,-187,-183,-184,-188,-190,95,-192,-193,-185,-191,95,-227,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,-263,-39,-42,-38,95,-40,95,95,-158,-157,-43,-159,95,-41,95,-227,95,95,95,-12,95,95,-11,-177,-176,95,-174,95,95,-160,95,-173,-161,95,95,-227,95,-263,95,-263,-141,-172,-175,95,-164,95,-162,95,95,95,-163,95,95,95,-263,95,-168,-167,-165,95,95,95,-169,-166,95,-171,-170,]),'LSHIFT':([95,96,97,102,103,104,105,106,108,112,113,114,117,118,120,126,129,131,135,162,173,174,197,200,204,207,208,210,218,280,301,302,305,309,312,313,314,315,316,317,318,319,320,321,322,323,324,325,326,327,329,330,372,373,374,376,415,423,],[-255,-256,-253,-259,-252,-250,-257,-254,-251,-218,-245,-243,-244,-220,-197,-232,-249,221,-242,-262,-260,-258,-224,-238,-239,-218,-223,-221,-222,-249,-237,-236,-235,-246,-203,221,-204,-202,221,221,221,-201,221,221,-199,-198,221,221,221,221,221,-200,-225,-233,-234,-219,-240,-241,]),'RBRACE':([56,77,88,90,95,96,97,102,103,104,105,106,108,112,113,114,117,118,120,126,129,131,133,135,146,147,148,156,158,159,161,162,173,174,197,200,204,207,208,210,218,246,247,248,254,256,257,260,262,269,271,272,273,275,276,278,279,285,287,299,301,302,305,309,312,313,314,315,316,317,318,319,320,321,322,323,324,325,326,327,329,330,336,337,344,347,348,351,356,358,360,372,373,374,376,382,383,384,387,388,391,396,402,403,406,410,414,415,416,419,420,422,423,430,431,433,434,],[-261,-45,162,-98,-255,-256,-253,-259,-252,-250,-257,-254,-251,-218,-245,-243,-244,-220,-197,-232,-249,-195,-181,-242,-111,162,-114,-263,162,162,-99,-262,-260,-258,-224,-238,-239,-218,-223,-221,-222,162,162,-112,-136,-39,-42,-38,-40,-6,-158,-157,-43,-159,-5,-41,162,-194,-100,-182,-237,-236,-235,-246,-203,-215,-204,-202,-206,-210,-205,-201,-208,-213,-199,-198,-207,-214,-209,-211,-212,-200,-113,-115,162,-177,-176,-174,-160,-173,-161,-225,-233,-234,-219,-139,162,-137,-172,-175,-164,-162,162,-196,-138,-163,162,-240,-140,-168,-167,-165,-241,-169,-166,-171,-170,]),'_BOOL':([0,1,2,3,5,6,9,10,11,12,13,14,15,17,18,19,22,23,24,25,26,28,30,32,33,34,36,37,38,39,40,41,43,44,45,46,47,49,50,55,56,57,58,60,61,62,64,65,66,75,77,82,84,85,86,87,88,89,90,91,98,127,155,156,157,158,159,160,161,162,178,183,196,205,206,209,211,212,238,239,240,245,249,255,256,257,260,262,269,271,272,273,275,278,282,283,287,296,334,335,347,348,350,351,356,358,360,387,388,391,396,410,419,420,422,430,431,433,434,],[13,13,-61,-82,-71,-58,-54,-55,-33,-29,-59,13,-34,-53,-68,-63,-52,13,-56,-180,-116,-66,-69,-32,-83,-118,-64,-31,-60,-35,-62,-65,13,-67,13,-70,-84,13,-57,-92,-261,-91,13,13,-117,-30,13,-107,-106,13,-45,-46,13,-119,13,13,13,13,-98,13,13,13,-36,13,-47,13,13,-93,-99,-262,13,13,13,-120,13,13,-121,13,-123,-122,13,13,-108,-37,-39,-42,-38,-40,13,-158,-157,-43,-159,-41,-95,-94,-100,13,-110,-109,-177,-176,13,-174,-160,-173,-161,-172,-175,-164,-162,-163,-168,-167,-165,-169,-166,-171,-170,]),'LE':([95,96,97,102,103,104,105,106,108,112,113,114,117,118,120,126,129,131,135,162,173,174,197,200,204,207,208,210,218,280,301,302,305,309,312,313,314,315,316,317,318,319,320,321,322,323,324,325,326,327,329,330,372,373,374,376,415,423,],[-255,-256,-253,-259,-252,-250,-257,-254,-251,-218,-245,-243,-244,-220,-197,-232,-249,223,-242,-262,-260,-258,-224,-238,-239,-218,-223,-221,-222,-249,-237,-236,-235,-246,-203,223,-204,-202,-206,223,-205,-201,-208,223,-199,-198,-207,223,223,223,223,-200,-225,-233,-234,-219,-240,-241,]),'SEMI':([0,1,2,3,5,6,9,10,11,12,13,14,15,17,18,19,21,22,23,24,25,26,28,30,31,32,33,34,36,37,38,39,40,41,42,43,44,45,46,47,50,51,52,53,55,56,57,59,61,62,65,66,72,73,74,75,76,77,78,79,81,85,89,91,92,95,96,97,102,103,104,105,106,108,112,113,114,117,118,120,126,129,131,133,135,154,155,156,160,162,163,164,165,166,168,169,170,171,172,173,174,182,197,200,204,205,207,208,210,211,217,218,238,239,249,251,252,254,255,256,257,259,260,261,262,264,265,269,271,272,273,274,275,276,277,278,280,282,283,284,285,299,301,302,305,309,312,313,314,315,316,317,318,319,320,321,322,323,324,325,326,327,329,330,334,335,346,347,348,349,350,351,352,355,356,358,360,361,363,364,372,373,374,376,377,384,387,388,389,390,391,393,396,403,406,407,408,409,410,411,413,415,417,419,420,422,423,426,427,429,430,431,432,433,434,],[15,-263,-61,-82,-71,-58,-54,-55,-33,-29,-59,-263,-34,-53,-68,-63,-80,-52,15,-56,-180,-116,-66,-69,-263,-32,-83,-118,-64,-31,-60,-35,-62,-65,77,-263,-67,-263,-70,-84,-57,-50,-9,-10,-92,-261,-91,-49,-117,-30,-107,-106,-18,-44,-17,-87,-85,-45,-48,-51,-263,-119,-263,-263,-263,-255,-256,-253,-259,-252,-250,-257,-254,-251,-218,-245,-243,-244,-220,-197,-232,-249,-195,-181,-242,-87,-36,-263,-93,-262,-21,-90,-22,-89,-24,287,-101,-23,-103,-260,-258,-81,-224,-238,-239,-120,-218,-223,-221,-121,-178,-222,-123,-122,-108,-86,-88,-136,-37,-39,-42,347,-38,348,-40,351,-14,-263,-158,-157,-43,358,-159,-13,-263,-41,-249,-95,-94,-105,-194,-182,-237,-236,-235,-246,-203,-215,-204,-202,-206,-210,-205,-201,-208,-213,-199,-198,-207,-214,-209,-211,-212,-200,-110,-109,387,-177,-176,388,-263,-174,-263,-13,-160,-173,-161,-263,-102,-104,-225,-233,-234,-219,-179,-137,-172,-175,407,-263,-164,-263,-162,-196,-138,-263,418,-263,-163,-263,-263,-240,424,-168,-167,-165,-241,430,-263,-263,-169,-166,-263,-171,-170,]),'LT':([2,5,6,13,14,18,19,25,28,30,36,38,40,41,44,46,55,57,65,66,95,96,97,98,102,103,104,105,106,108,112,113,114,117,118,120,126,129,131,135,160,162,173,174,197,200,204,207,208,210,212,218,249,280,282,283,301,302,305,309,312,313,314,315,316,317,318,319,320,321,322,323,324,325,326,327,329,330,334,335,372,373,374,376,415,423,],[-61,-71,-58,-59,60,-68,-63,-180,-66,-69,-64,-60,-62,-65,-67,-70,-92,-91,-107,-106,-255,-256,-253,60,-259,-252,-250,-257,-254,-251,-218,-245,-243,-244,-220,-197,-232,-249,225,-242,-93,-262,-260,-258,-224,-238,-239,-218,-223,-221,60,-222,-108,-249,-95,-94,-237,-236,-235,-246,-203,225,-204,-202,-206,225,-205,-201,-208,225,-199,-198,-207,225,225,225,225,-200,-110,-109,-225,-233,-234,-219,-240,-241,]),'COMMA':([1,2,3,5,6,9,10,13,14,17,18,19,21,22,24,25,26,28,29,30,33,34,36,38,40,41,43,44,45,46,47,50,51,52,53,55,57,59,61,65,66,68,69,70,71,72,75,76,78,79,85,89,91,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,112,113,114,117,118,120,126,129,131,133,135,139,140,141,142,143,146,147,148,149,150,154,160,162,163,164,165,166,168,170,172,173,174,176,177,179,180,181,182,183,197,200,204,205,207,208,210,211,215,217,218,238,239,241,242,243,246,247,248,249,251,252,254,265,280,282,283,284,285,297,298,299,301,302,303,304,305,306,309,312,313,314,315,316,317,318,319,320,321,322,323,324,325,326,327,328,329,330,331,333,334,335,336,337,344,349,363,364,365,366,367,368,372,373,374,376,377,382,384,392,394,397,398,399,400,401,402,403,406,415,416,421,423,],[-263,-61,-82,-71,-58,-54,-55,-59,-263,-53,-68,-63,-80,-52,-56,-180,-116,-66,-263,-69,-83,-118,-64,-60,-62,-65,-263,-67,-263,-70,-84,-57,-50,-9,-10,-92,-91,-49,-117,-107,-106,-26,-124,-126,-25,151,-87,-85,-48,-51,-119,-263,-263,-72,-74,-255,-256,-253,-263,-75,-73,-76,-259,-252,-250,-257,-254,-77,-251,-263,183,-218,-245,-243,-244,-220,-197,-232,-249,-195,-181,-242,-130,-263,244,245,-134,-111,248,-114,-127,-125,-87,-93,-262,-21,-90,-22,-89,286,-101,-103,-260,-258,-146,-2,-149,-147,-1,-81,-78,-224,-238,-239,-120,-218,-223,-221,-121,310,-178,-222,-123,-122,-133,-132,-147,248,248,-112,-108,-86,-88,-136,310,-249,-95,-94,-105,-194,-148,-79,-182,-237,-236,310,-247,-235,375,-246,-203,-215,-204,-202,-206,-210,-205,-201,-208,-213,-199,-198,-207,-214,-209,-211,310,-212,-200,-135,-131,-110,-109,-113,-115,383,310,-102,-104,-152,-154,-156,-150,-225,-233,-234,-219,-179,-139,-137,310,310,310,-151,-153,-155,-248,414,-196,-138,-240,-140,310,-241,]),'TYPEDEF':([0,1,2,3,5,6,9,10,11,12,13,14,15,17,18,19,22,23,24,25,26,28,30,32,33,34,36,37,38,39,40,41,43,44,45,46,47,49,50,55,56,57,61,62,64,65,66,75,77,82,84,85,155,156,157,160,162,178,205,211,238,239,240,245,249,255,256,257,260,262,269,271,272,273,275,278,282,283,296,334,335,347,348,350,351,356,358,360,387,388,391,396,410,419,420,422,430,431,433,434,],[24,24,-61,-82,-71,-58,-54,-55,-33,-29,-59,24,-34,-53,-68,-63,-52,24,-56,-180,-116,-66,-69,-32,-83,-118,-64,-31,-60,-35,-62,-65,24,-67,24,-70,-84,24,-57,-92,-261,-91,-117,-30,24,-107,-106,24,-45,-46,24,-119,-36,24,-47,-93,-262,24,-120,-121,-123,-122,24,24,-108,-37,-39,-42,-38,-40,24,-158,-157,-43,-159,-41,-95,-94,24,-110,-109,-177,-176,24,-174,-160,-173,-161,-172,-175,-164,-162,-163,-168,-167,-165,-169,-166,-171,-170,]),'XOR':([95,96,97,102,103,104,105,106,108,112,113,114,117,118,120,126,129,131,135,162,173,174,197,200,204,207,208,210,218,280,301,302,305,309,312,313,314,315,316,317,318,319,320,321,322,323,324,325,326,327,329,330,372,373,374,376,415,423,],[-255,-256,-253,-259,-252,-250,-257,-254,-251,-218,-245,-243,-244,-220,-197,-232,-249,228,-242,-262,-260,-258,-224,-238,-239,-218,-223,-221,-222,-249,-237,-236,-235,-246,-203,228,-204,-202,-206,-210,-205,-201,-208,-213,-199,-198,-207,228,-209,-211,228,-200,-225,-233,-234,-219,-240,-241,]),'AUTO':([0,1,2,3,5,6,9,10,11,12,13,14,15,17,18,19,22,23,24,25,26,28,30,32,33,34,36,37,38,39,40,41,43,44,45,46,47,49,50,55,56,57,61,62,64,65,66,75,77,82,84,85,155,156,157,160,162,178,205,211,238,239,240,245,249,255,256,257,260,262,269,271,272,273,275,278,282,283,296,334,335,347,348,350,351,356,358,360,387,388,391,396,410,419,420,422,430,431,433,434,],[22,22,-61,-82,-71,-58,-54,-55,-33,-29,-59,22,-34,-53,-68,-63,-52,22,-56,-180,-116,-66,-69,-32,-83,-118,-64,-31,-60,-35,-62,-65,22,-67,22,-70,-84,22,-57,-92,-261,-91,-117,-30,22,-107,-106,22,-45,-46,22,-119,-36,22,-47,-93,-262,22,-120,-121,-123,-122,22,22,-108,-37,-39,-42,-38,-40,22,-158,-157,-43,-159,-41,-95,-94,22,-110,-109,-177,-176,22,-174,-160,-173,-161,-172,-175,-164,-162,-163,-168,-167,-165,-169,-166,-171,-170,]),'TIMES':([0,1,2,3,4,5,6,9,10,11,12,13,14,15,17,18,19,21,22,23,24,25,28,29,30,31,32,33,36,37,38,39,40,41,43,44,45,46,47,50,51,52,53,55,56,57,59,62,63,65,66,68,69,70,71,77,78,79,81,89,91,92,95,96,97,98,102,103,104,105,106,108,109,111,112,113,114,115,116,117,118,120,121,122,124,125,126,127,128,129,130,131,134,135,140,149,151,152,155,156,160,162,163,164,165,166,167,173,174,175,178,182,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,200,202,203,204,206,207,208,209,210,212,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,240,249,250,253,255,256,257,260,261,262,268,269,271,272,273,275,277,278,280,282,283,286,288,290,295,301,302,305,308,309,310,312,313,314,315,316,317,318,319,320,321,322,323,324,325,326,327,329,330,334,335,338,341,342,343,347,348,350,351,352,353,356,357,358,360,361,362,370,372,373,374,375,376,378,379,383,386,387,388,390,391,393,396,405,407,409,410,411,412,413,414,415,418,419,420,422,423,424,427,429,430,431,432,433,434,],[29,-263,-61,-82,29,-71,-58,-54,-55,-33,-29,-59,-263,-34,-53,-68,-63,-80,-52,29,-56,-180,-66,-263,-69,29,-32,-83,-64,-31,-60,-35,-62,-65,-263,-67,-263,-70,-84,-57,-50,-9,-10,-92,-261,-91,-49,-30,125,-107,-106,-26,29,-126,-25,-45,-48,-51,29,-263,-263,29,-255,-256,-253,-263,-259,-252,-250,-257,-254,-251,29,-231,-218,-245,-243,198,-229,-244,-220,-197,198,-228,198,-227,-232,198,198,-249,-226,230,-230,-242,29,-127,29,198,-36,198,-93,-262,-21,-90,-22,-89,198,-260,-258,290,29,-81,-186,-189,-187,-183,-184,-188,-190,198,-192,-193,-185,-191,198,-224,-227,-238,198,198,-239,198,-218,-223,198,-221,-263,-222,198,198,198,198,198,198,198,198,198,198,198,198,198,198,198,198,198,198,198,29,-108,198,-263,-37,-39,-42,-38,198,-40,198,198,-158,-157,-43,-159,198,-41,-249,-95,-94,29,198,-227,370,-237,-236,-235,198,-246,198,230,230,230,230,230,230,230,230,230,230,-199,-198,230,230,230,230,230,-200,-110,-109,-12,198,198,-11,-177,-176,198,-174,198,198,-160,198,-173,-161,198,198,-227,-225,-233,-234,198,-219,-263,198,-263,-141,-172,-175,198,-164,198,-162,198,198,198,-163,198,198,198,-263,-240,198,-168,-167,-165,-241,198,198,198,-169,-166,198,-171,-170,]),'LPAREN':([0,1,2,3,4,5,6,9,10,11,12,13,14,15,16,17,18,19,21,22,23,24,25,26,28,29,30,31,32,33,34,36,37,38,39,40,41,43,44,45,46,47,50,51,52,53,55,56,57,59,61,62,63,65,66,68,69,70,71,77,78,79,81,85,89,91,92,95,96,97,98,102,103,104,105,106,108,109,111,113,114,115,116,117,118,121,122,124,125,126,127,128,129,130,134,135,140,149,150,151,152,155,156,160,162,163,164,165,166,167,173,174,175,178,179,180,182,184,185,186,187,188,189,190,191,192,193,194,195,196,198,200,202,203,204,205,206,209,211,212,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,243,249,250,253,255,256,257,260,261,262,263,267,268,269,270,271,272,273,275,277,278,280,281,282,283,286,288,290,295,297,301,302,305,308,309,310,334,335,338,341,342,343,347,348,350,351,352,353,356,357,358,360,361,362,365,366,367,368,370,373,374,375,378,379,383,386,387,388,390,391,393,395,396,398,399,400,405,407,409,410,411,412,413,414,415,418,419,420,422,423,424,427,429,430,431,432,433,434,],[4,-263,-61,-82,4,-71,-58,-54,-55,-33,-29,-59,-263,-34,4,-53,-68,-63,-80,-52,4,-56,-180,64,-66,-263,-69,4,-32,-83,-118,-64,-31,-60,-35,-62,-65,-263,-67,-263,-70,-84,-57,-50,-9,-10,-92,-261,-91,-49,64,-30,127,-107,-106,-26,-124,-126,-25,-45,-48,-51,4,-119,-263,-263,4,-255,-256,-253,-263,-259,-252,-250,-257,-254,-251,178,-231,-245,-243,196,-229,-244,203,206,-228,209,-227,-232,127,209,-249,-226,-230,-242,240,-127,-125,4,127,-36,127,-93,-262,-21,-90,-22,-89,206,-260,-258,127,178,296,178,-81,-186,-189,-187,-183,-184,-188,-190,127,-192,-193,-185,-191,127,-227,-238,127,127,-239,-120,127,127,-121,-263,206,206,206,206,206,206,206,206,206,206,206,206,206,206,206,206,127,206,206,-123,-122,240,240,-108,206,-263,-37,-39,-42,-38,127,-40,350,353,206,127,357,-158,-157,-43,-159,127,-41,-249,362,-95,-94,4,206,-227,127,296,-237,-236,-235,206,-246,127,-110,-109,-12,206,127,-11,-177,-176,127,-174,127,127,-160,127,-173,-161,127,127,-152,-154,-156,-150,-227,-233,-234,127,-263,206,-263,-141,-172,-175,127,-164,127,412,-162,-151,-153,-155,127,127,127,-163,127,127,127,-263,-240,127,-168,-167,-165,-241,127,127,127,-169,-166,127,-171,-170,]),'MINUSMINUS':([56,63,77,95,96,97,102,103,104,105,106,108,111,113,114,115,116,117,118,121,122,124,125,126,127,128,129,130,134,135,152,156,162,167,173,174,175,184,185,186,187,188,189,190,191,192,193,194,195,196,198,200,202,203,204,206,209,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,250,253,256,257,260,261,262,268,269,271,272,273,275,277,278,280,288,290,295,301,302,305,308,309,310,338,341,342,343,347,348,350,351,352,353,356,357,358,360,361,362,370,373,374,375,378,379,383,386,387,388,390,391,393,396,405,407,409,410,411,412,413,414,415,418,419,420,422,423,424,427,429,430,431,432,433,434,],[-261,128,-45,-255,-256,-253,-259,-252,-250,-257,-254,-251,-231,-245,-243,128,-229,-244,204,128,-228,128,-227,-232,128,128,-249,-226,-230,-242,128,128,-262,128,-260,-258,128,-186,-189,-187,-183,-184,-188,-190,128,-192,-193,-185,-191,128,-227,-238,128,128,-239,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,-263,-39,-42,-38,128,-40,128,128,-158,-157,-43,-159,128,-41,-249,128,-227,128,-237,-236,-235,128,-246,128,-12,128,128,-11,-177,-176,128,-174,128,128,-160,128,-173,-161,128,128,-227,-233,-234,128,-263,128,-263,-141,-172,-175,128,-164,128,-162,128,128,128,-163,128,128,128,-263,-240,128,-168,-167,-165,-241,128,128,128,-169,-166,128,-171,-170,]),'ID':([0,1,2,3,4,5,6,7,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,27,28,29,30,31,32,33,35,36,37,38,39,40,41,43,44,45,46,47,50,51,52,53,55,56,57,59,62,63,64,65,66,67,68,69,70,71,77,78,79,81,89,91,92,111,115,116,121,122,124,125,127,128,130,134,140,144,145,149,150,151,152,155,156,160,162,163,164,165,166,167,175,182,184,185,186,187,188,189,190,191,192,193,194,195,196,198,199,201,202,203,206,209,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,240,243,244,248,249,250,253,255,256,257,258,260,261,262,268,269,271,272,273,275,277,278,282,283,286,288,290,295,308,310,334,335,338,340,341,342,343,347,348,350,351,352,353,356,357,358,360,361,362,370,375,378,379,383,386,387,388,390,391,393,396,405,407,409,410,411,412,413,414,418,419,420,422,424,427,429,430,431,432,433,434,],[34,-263,-61,-82,34,-71,-58,57,-54,-55,-33,-29,-59,-263,-34,34,-53,-68,-63,-97,-80,-52,34,-56,-180,66,-66,-263,-69,34,-32,-83,-96,-64,-31,-60,-35,-62,-65,-263,-67,-263,-70,-84,-57,-50,-9,-10,-92,-261,-91,-49,-30,129,129,-107,-106,148,-26,-124,-126,-25,-45,-48,-51,34,-263,-263,34,-231,129,-229,129,-228,129,-227,129,129,-226,-230,34,148,148,-127,-125,34,129,-36,280,-93,-262,-21,-90,-22,-89,129,129,-81,-186,-189,-187,-183,-184,-188,-190,129,-192,-193,-185,-191,129,-227,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,34,34,129,148,-108,129,-263,-37,-39,-42,346,-38,129,-40,129,280,-158,-157,-43,-159,280,-41,-95,-94,34,129,-227,129,129,129,-110,-109,-12,129,129,129,-11,-177,-176,129,-174,280,129,-160,129,-173,-161,280,129,-227,129,-263,129,-263,-141,-172,-175,129,-164,280,-162,129,129,280,-163,280,129,280,-263,129,-168,-167,-165,129,280,280,-169,-166,280,-171,-170,]),'IF':([56,77,156,162,256,257,260,262,269,271,272,273,275,277,278,347,348,351,352,356,358,360,361,387,388,391,393,396,409,410,411,413,419,420,422,427,429,430,431,432,433,434,],[-261,-45,281,-262,-39,-42,-38,-40,281,-158,-157,-43,-159,281,-41,-177,-176,-174,281,-160,-173,-161,281,-172,-175,-164,281,-162,281,-163,281,281,-168,-167,-165,281,281,-169,-166,281,-171,-170,]),'STRING_LITERAL':([56,60,63,77,100,105,111,115,116,117,121,122,124,125,127,128,130,134,152,156,162,167,174,175,183,184,185,186,187,188,189,190,191,192,193,194,195,196,198,202,203,206,209,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,250,253,256,257,260,261,262,268,269,271,272,273,275,277,278,288,290,295,308,310,338,341,342,343,347,348,350,351,352,353,356,357,358,360,361,362,370,375,378,379,383,386,387,388,390,391,393,396,405,407,409,410,411,412,413,414,418,419,420,422,424,427,429,430,431,432,433,434,],[-261,105,105,-45,174,-257,-231,105,-229,174,105,-228,105,-227,105,105,-226,-230,105,105,-262,105,-258,105,105,-186,-189,-187,-183,-184,-188,-190,105,-192,-193,-185,-191,105,-227,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,-263,-39,-42,-38,105,-40,105,105,-158,-157,-43,-159,105,-41,105,-227,105,105,105,-12,105,105,-11,-177,-176,105,-174,105,105,-160,105,-173,-161,105,105,-227,105,-263,105,-263,-141,-172,-175,105,-164,105,-162,105,105,105,-163,105,105,105,-263,105,-168,-167,-165,105,105,105,-169,-166,105,-171,-170,]),'FLOAT':([0,1,2,3,5,6,9,10,11,12,13,14,15,17,18,19,22,23,24,25,26,28,30,32,33,34,36,37,38,39,40,41,43,44,45,46,47,49,50,55,56,57,58,60,61,62,64,65,66,75,77,82,84,85,86,87,88,89,90,91,98,127,155,156,157,158,159,160,161,162,178,183,196,205,206,209,211,212,238,239,240,245,249,255,256,257,260,262,269,271,272,273,275,278,282,283,287,296,334,335,347,348,350,351,356,358,360,387,388,391,396,410,419,420,422,430,431,433,434,],[36,36,-61,-82,-71,-58,-54,-55,-33,-29,-59,36,-34,-53,-68,-63,-52,36,-56,-180,-116,-66,-69,-32,-83,-118,-64,-31,-60,-35,-62,-65,36,-67,36,-70,-84,36,-57,-92,-261,-91,36,36,-117,-30,36,-107,-106,36,-45,-46,36,-119,36,36,36,36,-98,36,36,36,-36,36,-47,36,36,-93,-99,-262,36,36,36,-120,36,36,-121,36,-123,-122,36,36,-108,-37,-39,-42,-38,-40,36,-158,-157,-43,-159,-41,-95,-94,-100,36,-110,-109,-177,-176,36,-174,-160,-173,-161,-172,-175,-164,-162,-163,-168,-167,-165,-169,-166,-171,-170,]),'XOREQUAL':([95,96,97,102,103,104,105,106,108,112,113,114,117,118,126,129,135,162,173,174,197,200,204,207,208,210,218,280,301,302,305,309,372,373,374,376,415,423,],[-255,-256,-253,-259,-252,-250,-257,-254,-251,188,-245,-243,-244,-220,-232,-249,-242,-262,-260,-258,-224,-238,-239,-218,-223,-221,-222,-249,-237,-236,-235,-246,-225,-233,-234,-219,-240,-241,]),'LSHIFTEQUAL':([95,96,97,102,103,104,105,106,108,112,113,114,117,118,126,129,135,162,173,174,197,200,204,207,208,210,218,280,301,302,305,309,372,373,374,376,415,423,],[-255,-256,-253,-259,-252,-250,-257,-254,-251,190,-245,-243,-244,-220,-232,-249,-242,-262,-260,-258,-224,-238,-239,-218,-223,-221,-222,-249,-237,-236,-235,-246,-225,-233,-234,-219,-240,-241,]),'RBRACKET':([63,95,96,97,102,103,104,105,106,108,112,113,114,117,118,119,120,123,125,126,129,131,132,133,135,162,173,174,175,197,200,204,207,208,210,217,218,285,289,290,295,299,301,302,303,305,309,312,313,314,315,316,317,318,319,320,321,322,323,324,325,326,327,329,330,369,370,372,373,374,376,377,381,403,415,423,],[-263,-255,-256,-253,-259,-252,-250,-257,-254,-251,-218,-245,-243,-244,-220,205,-197,-4,211,-232,-249,-195,-3,-181,-242,-262,-260,-258,-263,-224,-238,-239,-218,-223,-221,-178,-222,-194,365,366,-263,-182,-237,-236,373,-235,-246,-203,-215,-204,-202,-206,-210,-205,-201,-208,-213,-199,-198,-207,-214,-209,-211,-212,-200,398,399,-225,-233,-234,-219,-179,404,-196,-240,-241,]),}
+
+_lr_action = { }
+for _k, _v in _lr_action_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+      if not _x in _lr_action:  _lr_action[_x] = { }
+      _lr_action[_x][_k] = _y
+del _lr_action_items
+
+_lr_goto_items = {'expression_statement':([156,269,277,352,361,393,409,411,413,427,429,432,],[256,256,256,256,256,256,256,256,256,256,256,256,]),'struct_or_union_specifier':([0,1,14,23,43,45,49,58,60,64,75,84,86,87,88,89,91,98,127,156,158,159,178,183,196,206,209,212,240,245,269,296,350,],[5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,]),'init_declarator_list':([31,81,],[72,72,]),'init_declarator_list_opt':([31,81,],[73,73,]),'iteration_statement':([156,269,277,352,361,393,409,411,413,427,429,432,],[257,257,257,257,257,257,257,257,257,257,257,257,]),'unified_string_literal':([60,63,115,121,124,127,128,152,156,167,175,183,191,196,202,203,206,209,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,250,261,268,269,277,288,295,308,310,341,342,350,352,353,357,361,362,375,379,390,393,405,407,409,411,412,413,418,424,427,429,432,],[100,117,117,117,117,117,117,117,117,117,117,100,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,]),'assignment_expression_opt':([63,175,295,],[119,289,369,]),'brace_open':([7,27,55,57,65,66,83,152,153,156,269,277,311,342,352,361,372,393,405,409,411,413,427,429,432,],[58,67,86,87,144,145,156,253,156,156,156,156,378,253,156,156,378,156,253,156,156,156,156,156,156,]),'enumerator':([67,144,145,248,],[146,146,146,336,]),'type_qualifier_list_opt':([29,],[69,]),'expression_opt':([156,269,277,350,352,361,390,393,407,409,411,413,418,424,427,429,432,],[259,259,259,389,259,259,408,259,417,259,259,259,425,428,259,259,259,]),'parameter_list':([64,178,240,296,],[142,142,142,142,]),'designation':([253,378,383,414,],[338,338,338,338,]),'labeled_statement':([156,269,277,352,361,393,409,411,413,427,429,432,],[260,260,260,260,260,260,260,260,260,260,260,260,]),'declaration_list':([49,75,],[84,84,]),'init_declarator':([31,81,151,],[76,76,251,]),'direct_abstract_declarator':([109,140,178,180,240,243,],[179,179,179,297,179,297,]),'designator_list':([253,378,383,414,],[345,345,345,345,]),'identifier':([63,64,115,121,124,127,128,152,156,167,175,191,196,199,201,202,203,206,209,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,244,250,261,268,269,277,288,295,308,310,340,341,342,350,352,353,357,361,362,375,379,390,393,405,407,409,411,412,413,418,424,427,429,432,],[135,143,135,135,135,135,135,135,135,135,135,135,135,301,302,135,135,135,135,135,135,135,135,135,135,135,135,135,135,135,135,135,135,135,135,135,135,135,331,135,135,135,135,135,135,135,135,135,380,135,135,135,135,135,135,135,135,135,135,135,135,135,135,135,135,135,135,135,135,135,135,135,]),'unary_expression':([63,115,121,124,127,128,152,156,167,175,191,196,202,203,206,209,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,250,261,268,269,277,288,295,308,310,341,342,350,352,353,357,361,362,375,379,390,393,405,407,409,411,412,413,418,424,427,429,432,],[112,197,207,210,112,218,112,112,207,112,112,112,112,112,112,112,207,207,207,207,207,207,207,207,207,207,207,207,207,207,207,207,112,207,207,207,112,207,112,112,207,112,207,112,207,112,112,112,112,112,112,112,112,207,112,112,112,112,112,112,112,112,112,112,112,112,112,]),'abstract_declarator_opt':([109,140,],[176,241,]),'initializer':([152,342,405,],[252,382,416,]),'struct_declaration_list':([58,86,87,],[88,158,159,]),'pp_directive':([0,23,],[11,11,]),'abstract_declarator':([109,140,178,240,],[177,177,294,294,]),'type_specifier':([0,1,14,23,43,45,49,58,60,64,75,84,86,87,88,89,91,98,127,156,158,159,178,183,196,206,209,212,240,245,269,296,350,],[14,14,14,14,14,14,14,89,98,14,14,14,89,89,89,89,89,89,212,14,89,89,14,98,89,98,89,89,14,14,14,14,14,]),'compound_statement':([83,153,156,269,277,352,361,393,409,411,413,427,429,432,],[155,255,262,262,262,262,262,262,262,262,262,262,262,262,]),'pointer':([0,4,23,31,69,81,92,109,140,151,178,240,286,],[16,16,16,16,150,16,16,180,243,16,180,243,16,]),'template':([0,1,14,23,43,45,49,60,64,75,84,127,156,178,183,206,240,245,269,296,350,],[21,21,21,21,21,21,21,101,21,21,21,213,21,21,101,213,21,21,21,21,21,]),'translation_unit':([0,],[23,]),'direct_declarator':([0,4,16,23,31,81,92,140,151,240,243,286,],[26,26,61,26,26,26,26,26,26,26,61,26,]),'initializer_list':([253,378,],[344,402,]),'argument_expression_list':([203,],[306,]),'specifier_qualifier_list_opt':([89,91,98,212,],[164,166,164,164,]),'declarator':([0,4,23,31,81,92,140,151,240,286,],[49,54,49,75,154,172,242,154,54,172,]),'typedef_name':([0,1,14,23,43,45,49,58,60,64,75,84,86,87,88,89,91,98,127,156,158,159,178,183,196,206,209,212,240,245,269,296,350,],[30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,]),'parameter_type_list_opt':([178,240,296,],[293,293,371,]),'struct_declarator':([92,286,],[170,363,]),'type_qualifier':([0,1,14,23,29,43,45,49,58,60,64,68,75,84,86,87,88,89,91,98,127,156,158,159,178,183,196,206,209,212,240,245,269,296,350,],[43,43,43,43,70,43,43,43,91,91,43,149,43,43,91,91,91,91,91,91,91,43,91,91,43,91,91,91,91,91,43,43,43,43,43,]),'struct_declarator_list_opt':([92,],[169,]),'cast_type':([127,206,],[214,214,]),'assignment_operator':([112,],[191,]),'declaration_specifiers_list':([60,],[110,]),'expression':([127,156,196,202,206,209,235,261,269,277,350,352,353,357,361,362,390,393,407,409,411,412,413,418,424,427,429,432,],[215,265,215,303,215,215,328,349,265,265,265,265,392,394,265,397,265,265,265,265,265,421,265,265,265,265,265,265,]),'storage_class_specifier':([0,1,14,23,43,45,49,64,75,84,156,178,240,245,269,296,350,],[1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,]),'unified_wstring_literal':([60,63,115,121,124,127,128,152,156,167,175,183,191,196,202,203,206,209,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,250,261,268,269,277,288,295,308,310,341,342,350,352,353,357,361,362,375,379,390,393,405,407,409,411,412,413,418,424,427,429,432,],[94,113,113,113,113,113,113,113,113,113,113,94,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,]),'translation_unit_or_empty':([0,],[8,]),'brace_close':([88,147,158,159,246,247,279,344,383,402,414,],[160,249,282,283,334,335,360,384,406,415,423,]),'declaration_specifiers_opt':([1,14,43,45,],[51,59,78,79,]),'external_declaration':([0,23,],[12,62,]),'type_name':([60,127,183,196,206,209,],[99,216,99,300,216,307,]),'block_item_list':([156,],[269,]),'designation_opt':([253,378,383,414,],[342,342,405,405,]),'statement':([156,269,277,352,361,393,409,411,413,427,429,432,],[271,271,359,391,396,410,419,420,422,431,433,434,]),'cast_expression':([63,121,127,152,156,167,175,191,196,202,203,206,209,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,250,261,268,269,277,288,295,308,310,341,342,350,352,353,357,361,362,375,379,390,393,405,407,409,411,412,413,418,424,427,429,432,],[120,208,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,376,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,]),'struct_declarator_list':([92,],[168,]),'constant_expression':([167,250,268,288,341,],[284,337,354,364,381,]),'parameter_declaration':([64,178,240,245,296,],[139,139,139,333,139,]),'primary_expression':([63,115,121,124,127,128,152,156,167,175,191,196,202,203,206,209,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,250,261,268,269,277,288,295,308,310,341,342,350,352,353,357,361,362,375,379,390,393,405,407,409,411,412,413,418,424,427,429,432,],[126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,]),'declaration':([0,23,49,75,84,156,269,350,],[32,32,82,82,157,272,272,390,]),'jump_statement':([156,269,277,352,361,393,409,411,413,427,429,432,],[273,273,273,273,273,273,273,273,273,273,273,273,]),'enumerator_list':([67,144,145,],[147,246,247,]),'block_item':([156,269,],[275,356,]),'empty':([0,1,14,29,31,43,45,49,63,64,75,81,89,91,92,98,109,140,156,175,178,212,240,253,269,277,295,296,350,352,361,378,383,390,393,407,409,411,413,414,418,424,427,429,432,],[48,52,52,71,74,52,52,80,132,137,80,74,163,163,171,163,181,181,276,132,291,163,291,343,355,355,132,291,355,355,355,343,343,355,355,355,355,355,355,343,355,355,355,355,355,]),'identifier_list_opt':([64,],[136,]),'constant':([60,63,115,121,124,127,128,152,156,167,175,183,191,196,202,203,206,209,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,250,261,268,269,277,288,295,308,310,341,342,350,352,353,357,361,362,375,379,390,393,405,407,409,411,412,413,418,424,427,429,432,],[93,114,114,114,114,114,114,114,114,114,114,93,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,]),'struct_declaration':([58,86,87,88,158,159,],[90,90,90,161,161,161,]),'selection_statement':([156,269,277,352,361,393,409,411,413,427,429,432,],[278,278,278,278,278,278,278,278,278,278,278,278,]),'postfix_expression':([63,115,121,124,127,128,152,156,167,175,191,196,202,203,206,209,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,250,261,268,269,277,288,295,308,310,341,342,350,352,353,357,361,362,375,379,390,393,405,407,409,411,412,413,418,424,427,429,432,],[118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,]),'unary_operator':([63,115,121,124,127,128,152,156,167,175,191,196,202,203,206,209,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,250,261,268,269,277,288,295,308,310,341,342,350,352,353,357,361,362,375,379,390,393,405,407,409,411,412,413,418,424,427,429,432,],[121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,]),'struct_or_union':([0,1,14,23,43,45,49,58,60,64,75,84,86,87,88,89,91,98,127,156,158,159,178,183,196,206,209,212,240,245,269,296,350,],[7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,]),'block_item_list_opt':([156,],[279,]),'assignment_expression':([63,127,152,156,175,191,196,202,203,206,209,235,261,269,277,295,310,342,350,352,353,357,361,362,375,390,393,405,407,409,411,412,413,418,424,427,429,432,],[123,217,254,217,123,299,217,217,304,217,217,217,217,217,217,123,377,254,217,217,217,217,217,217,401,217,217,254,217,217,217,217,217,217,217,217,217,217,]),'parameter_type_list':([64,178,240,296,],[138,292,292,292,]),'type_qualifier_list':([29,],[68,]),'designator':([253,345,378,383,414,],[339,385,339,339,339,]),'declaration_specifiers':([0,1,14,23,43,45,49,64,75,84,156,178,240,245,269,296,350,],[31,53,53,31,53,53,81,140,81,81,81,140,140,140,81,140,81,]),'identifier_list':([64,],[141,]),'declaration_list_opt':([49,75,],[83,153,]),'function_definition':([0,23,],[37,37,]),'binary_expression':([63,127,152,156,167,175,191,196,202,203,206,209,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,250,261,268,269,277,288,295,310,341,342,350,352,353,357,361,362,375,379,390,393,405,407,409,411,412,413,418,424,427,429,432,],[131,131,131,131,131,131,131,131,131,131,131,131,312,313,314,315,316,317,318,319,320,321,322,323,324,325,326,327,131,329,330,131,131,131,131,131,131,131,131,131,131,131,131,131,131,131,131,131,131,131,131,131,131,131,131,131,131,131,131,131,131,131,]),'enum_specifier':([0,1,14,23,43,45,49,58,60,64,75,84,86,87,88,89,91,98,127,156,158,159,178,183,196,206,209,212,240,245,269,296,350,],[46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,]),'decl_body':([0,23,49,75,84,156,269,350,],[42,42,42,42,42,42,42,42,]),'const_or_type':([60,183,],[107,298,]),'function_specifier':([0,1,14,23,43,45,49,64,75,84,156,178,240,245,269,296,350,],[45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,]),'specifier_qualifier_list':([58,60,86,87,88,89,91,98,127,158,159,183,196,206,209,212,],[92,109,92,92,92,165,165,165,109,92,92,109,109,109,109,165,]),'conditional_expression':([63,127,152,156,167,175,191,196,202,203,206,209,235,250,261,268,269,277,288,295,310,341,342,350,352,353,357,361,362,375,379,390,393,405,407,409,411,412,413,418,424,427,429,432,],[133,133,133,133,285,133,133,133,133,133,133,133,133,285,133,285,133,133,285,133,133,285,133,133,133,133,133,133,133,133,403,133,133,133,133,133,133,133,133,133,133,133,133,133,]),}
+
+_lr_goto = { }
+for _k, _v in _lr_goto_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+       if not _x in _lr_goto: _lr_goto[_x] = { }
+       _lr_goto[_x][_k] = _y
+del _lr_goto_items
+_lr_productions = [
+  ("S' -> translation_unit_or_empty","S'",1,None,None,None),
+  ('abstract_declarator_opt -> empty','abstract_declarator_opt',1,'p_abstract_declarator_opt','plyparser.py',41),
+  ('abstract_declarator_opt -> abstract_declarator','abstract_declarator_opt',1,'p_abstract_declarator_opt','plyparser.py',42),
+  ('assignment_expression_opt -> empty','assignment_expression_opt',1,'p_assignment_expression_opt','plyparser.py',41),
+  ('assignment_expression_opt -> assignment_expression','assignment_expression_opt',1,'p_assignment_expression_opt','plyparser.py',42),
+  ('block_item_list_opt -> empty','block_item_list_opt',1,'p_block_item_list_opt','plyparser.py',41),
+  ('block_item_list_opt -> block_item_list','block_item_list_opt',1,'p_block_item_list_opt','plyparser.py',42),
+  ('declaration_list_opt -> empty','declaration_list_opt',1,'p_declaration_list_opt','plyparser.py',41),
+  ('declaration_list_opt -> declaration_list','declaration_list_opt',1,'p_declaration_list_opt','plyparser.py',42),
+  ('declaration_specifiers_opt -> empty','declaration_specifiers_opt',1,'p_declaration_specifiers_opt','plyparser.py',41),
+  ('declaration_specifiers_opt -> declaration_specifiers','declaration_specifiers_opt',1,'p_declaration_specifiers_opt','plyparser.py',42),
+  ('designation_opt -> empty','designation_opt',1,'p_designation_opt','plyparser.py',41),
+  ('designation_opt -> designation','designation_opt',1,'p_designation_opt','plyparser.py',42),
+  ('expression_opt -> empty','expression_opt',1,'p_expression_opt','plyparser.py',41),
+  ('expression_opt -> expression','expression_opt',1,'p_expression_opt','plyparser.py',42),
+  ('identifier_list_opt -> empty','identifier_list_opt',1,'p_identifier_list_opt','plyparser.py',41),
+  ('identifier_list_opt -> identifier_list','identifier_list_opt',1,'p_identifier_list_opt','plyparser.py',42),
+  ('init_declarator_list_opt -> empty','init_declarator_list_opt',1,'p_init_declarator_list_opt','plyparser.py',41),
+  ('init_declarator_list_opt -> init_declarator_list','init_declarator_list_opt',1,'p_init_declarator_list_opt','plyparser.py',42),
+  ('parameter_type_list_opt -> empty','parameter_type_list_opt',1,'p_parameter_type_list_opt','plyparser.py',41),
+  ('parameter_type_list_opt -> parameter_type_list','parameter_type_list_opt',1,'p_parameter_type_list_opt','plyparser.py',42),
+  ('specifier_qualifier_list_opt -> empty','specifier_qualifier_list_opt',1,'p_specifier_qualifier_list_opt','plyparser.py',41),
+  ('specifier_qualifier_list_opt -> specifier_qualifier_list','specifier_qualifier_list_opt',1,'p_specifier_qualifier_list_opt','plyparser.py',42),
+  ('struct_declarator_list_opt -> empty','struct_declarator_list_opt',1,'p_struct_declarator_list_opt','plyparser.py',41),
+  ('struct_declarator_list_opt -> struct_declarator_list','struct_declarator_list_opt',1,'p_struct_declarator_list_opt','plyparser.py',42),
+  ('type_qualifier_list_opt -> empty','type_qualifier_list_opt',1,'p_type_qualifier_list_opt','plyparser.py',41),
+  ('type_qualifier_list_opt -> type_qualifier_list','type_qualifier_list_opt',1,'p_type_qualifier_list_opt','plyparser.py',42),
+  ('translation_unit_or_empty -> translation_unit','translation_unit_or_empty',1,'p_translation_unit_or_empty','c_parser.py',372),
+  ('translation_unit_or_empty -> empty','translation_unit_or_empty',1,'p_translation_unit_or_empty','c_parser.py',373),
+  ('translation_unit -> external_declaration','translation_unit',1,'p_translation_unit_1','c_parser.py',381),
+  ('translation_unit -> translation_unit external_declaration','translation_unit',2,'p_translation_unit_2','c_parser.py',388),
+  ('external_declaration -> function_definition','external_declaration',1,'p_external_declaration_1','c_parser.py',400),
+  ('external_declaration -> declaration','external_declaration',1,'p_external_declaration_2','c_parser.py',405),
+  ('external_declaration -> pp_directive','external_declaration',1,'p_external_declaration_3','c_parser.py',410),
+  ('external_declaration -> SEMI','external_declaration',1,'p_external_declaration_4','c_parser.py',415),
+  ('pp_directive -> PPHASH','pp_directive',1,'p_pp_directive','c_parser.py',420),
+  ('function_definition -> declarator declaration_list_opt compound_statement','function_definition',3,'p_function_definition_1','c_parser.py',429),
+  ('function_definition -> declaration_specifiers declarator declaration_list_opt compound_statement','function_definition',4,'p_function_definition_2','c_parser.py',446),
+  ('statement -> labeled_statement','statement',1,'p_statement','c_parser.py',457),
+  ('statement -> expression_statement','statement',1,'p_statement','c_parser.py',458),
+  ('statement -> compound_statement','statement',1,'p_statement','c_parser.py',459),
+  ('statement -> selection_statement','statement',1,'p_statement','c_parser.py',460),
+  ('statement -> iteration_statement','statement',1,'p_statement','c_parser.py',461),
+  ('statement -> jump_statement','statement',1,'p_statement','c_parser.py',462),
+  ('decl_body -> declaration_specifiers init_declarator_list_opt','decl_body',2,'p_decl_body','c_parser.py',476),
+  ('declaration -> decl_body SEMI','declaration',2,'p_declaration','c_parser.py',559),
+  ('declaration_list -> declaration','declaration_list',1,'p_declaration_list','c_parser.py',568),
+  ('declaration_list -> declaration_list declaration','declaration_list',2,'p_declaration_list','c_parser.py',569),
+  ('declaration_specifiers -> type_qualifier declaration_specifiers_opt','declaration_specifiers',2,'p_declaration_specifiers_1','c_parser.py',574),
+  ('declaration_specifiers -> type_specifier declaration_specifiers_opt','declaration_specifiers',2,'p_declaration_specifiers_2','c_parser.py',579),
+  ('declaration_specifiers -> storage_class_specifier declaration_specifiers_opt','declaration_specifiers',2,'p_declaration_specifiers_3','c_parser.py',584),
+  ('declaration_specifiers -> function_specifier declaration_specifiers_opt','declaration_specifiers',2,'p_declaration_specifiers_4','c_parser.py',589),
+  ('storage_class_specifier -> AUTO','storage_class_specifier',1,'p_storage_class_specifier','c_parser.py',594),
+  ('storage_class_specifier -> REGISTER','storage_class_specifier',1,'p_storage_class_specifier','c_parser.py',595),
+  ('storage_class_specifier -> STATIC','storage_class_specifier',1,'p_storage_class_specifier','c_parser.py',596),
+  ('storage_class_specifier -> EXTERN','storage_class_specifier',1,'p_storage_class_specifier','c_parser.py',597),
+  ('storage_class_specifier -> TYPEDEF','storage_class_specifier',1,'p_storage_class_specifier','c_parser.py',598),
+  ('function_specifier -> INLINE','function_specifier',1,'p_function_specifier','c_parser.py',603),
+  ('type_specifier -> VOID','type_specifier',1,'p_type_specifier_1','c_parser.py',608),
+  ('type_specifier -> _BOOL','type_specifier',1,'p_type_specifier_1','c_parser.py',609),
+  ('type_specifier -> CHAR','type_specifier',1,'p_type_specifier_1','c_parser.py',610),
+  ('type_specifier -> SHORT','type_specifier',1,'p_type_specifier_1','c_parser.py',611),
+  ('type_specifier -> INT','type_specifier',1,'p_type_specifier_1','c_parser.py',612),
+  ('type_specifier -> LONG','type_specifier',1,'p_type_specifier_1','c_parser.py',613),
+  ('type_specifier -> FLOAT','type_specifier',1,'p_type_specifier_1','c_parser.py',614),
+  ('type_specifier -> DOUBLE','type_specifier',1,'p_type_specifier_1','c_parser.py',615),
+  ('type_specifier -> _COMPLEX','type_specifier',1,'p_type_specifier_1','c_parser.py',616),
+  ('type_specifier -> SIGNED','type_specifier',1,'p_type_specifier_1','c_parser.py',617),
+  ('type_specifier -> UNSIGNED','type_specifier',1,'p_type_specifier_1','c_parser.py',618),
+  ('type_specifier -> typedef_name','type_specifier',1,'p_type_specifier_2','c_parser.py',623),
+  ('type_specifier -> enum_specifier','type_specifier',1,'p_type_specifier_2','c_parser.py',624),
+  ('type_specifier -> struct_or_union_specifier','type_specifier',1,'p_type_specifier_2','c_parser.py',625),
+  ('const_or_type -> constant','const_or_type',1,'p_const_or_type','c_parser.py',630),
+  ('const_or_type -> unified_string_literal','const_or_type',1,'p_const_or_type','c_parser.py',631),
+  ('const_or_type -> unified_wstring_literal','const_or_type',1,'p_const_or_type','c_parser.py',632),
+  ('const_or_type -> type_name','const_or_type',1,'p_const_or_type','c_parser.py',633),
+  ('const_or_type -> template','const_or_type',1,'p_const_or_type','c_parser.py',634),
+  ('declaration_specifiers_list -> const_or_type','declaration_specifiers_list',1,'p_declaration_specifiers_list','c_parser.py',642),
+  ('declaration_specifiers_list -> declaration_specifiers_list COMMA','declaration_specifiers_list',2,'p_declaration_specifiers_list','c_parser.py',643),
+  ('declaration_specifiers_list -> declaration_specifiers_list COMMA const_or_type','declaration_specifiers_list',3,'p_declaration_specifiers_list','c_parser.py',644),
+  ('declaration_specifiers -> template','declaration_specifiers',1,'p_declaration_specifier_template','c_parser.py',659),
+  ('template -> type_specifier LT declaration_specifiers_list GT','template',4,'p_template','c_parser.py',663),
+  ('type_qualifier -> CONST','type_qualifier',1,'p_type_qualifier','c_parser.py',677),
+  ('type_qualifier -> RESTRICT','type_qualifier',1,'p_type_qualifier','c_parser.py',678),
+  ('type_qualifier -> VOLATILE','type_qualifier',1,'p_type_qualifier','c_parser.py',679),
+  ('init_declarator_list -> init_declarator','init_declarator_list',1,'p_init_declarator_list','c_parser.py',684),
+  ('init_declarator_list -> init_declarator_list COMMA init_declarator','init_declarator_list',3,'p_init_declarator_list','c_parser.py',685),
+  ('init_declarator -> declarator','init_declarator',1,'p_init_declarator','c_parser.py',693),
+  ('init_declarator -> declarator EQUALS initializer','init_declarator',3,'p_init_declarator','c_parser.py',694),
+  ('specifier_qualifier_list -> type_qualifier specifier_qualifier_list_opt','specifier_qualifier_list',2,'p_specifier_qualifier_list_1','c_parser.py',699),
+  ('specifier_qualifier_list -> type_specifier specifier_qualifier_list_opt','specifier_qualifier_list',2,'p_specifier_qualifier_list_2','c_parser.py',704),
+  ('struct_or_union_specifier -> struct_or_union ID','struct_or_union_specifier',2,'p_struct_or_union_specifier_1','c_parser.py',712),
+  ('struct_or_union_specifier -> struct_or_union TYPEID','struct_or_union_specifier',2,'p_struct_or_union_specifier_1','c_parser.py',713),
+  ('struct_or_union_specifier -> struct_or_union brace_open struct_declaration_list brace_close','struct_or_union_specifier',4,'p_struct_or_union_specifier_2','c_parser.py',722),
+  ('struct_or_union_specifier -> struct_or_union ID brace_open struct_declaration_list brace_close','struct_or_union_specifier',5,'p_struct_or_union_specifier_3','c_parser.py',731),
+  ('struct_or_union_specifier -> struct_or_union TYPEID brace_open struct_declaration_list brace_close','struct_or_union_specifier',5,'p_struct_or_union_specifier_3','c_parser.py',732),
+  ('struct_or_union -> STRUCT','struct_or_union',1,'p_struct_or_union','c_parser.py',741),
+  ('struct_or_union -> UNION','struct_or_union',1,'p_struct_or_union','c_parser.py',742),
+  ('struct_declaration_list -> struct_declaration','struct_declaration_list',1,'p_struct_declaration_list','c_parser.py',749),
+  ('struct_declaration_list -> struct_declaration_list struct_declaration','struct_declaration_list',2,'p_struct_declaration_list','c_parser.py',750),
+  ('struct_declaration -> specifier_qualifier_list struct_declarator_list_opt SEMI','struct_declaration',3,'p_struct_declaration_1','c_parser.py',755),
+  ('struct_declarator_list -> struct_declarator','struct_declarator_list',1,'p_struct_declarator_list','c_parser.py',806),
+  ('struct_declarator_list -> struct_declarator_list COMMA struct_declarator','struct_declarator_list',3,'p_struct_declarator_list','c_parser.py',807),
+  ('struct_declarator -> declarator','struct_declarator',1,'p_struct_declarator_1','c_parser.py',815),
+  ('struct_declarator -> declarator COLON constant_expression','struct_declarator',3,'p_struct_declarator_2','c_parser.py',820),
+  ('struct_declarator -> COLON constant_expression','struct_declarator',2,'p_struct_declarator_2','c_parser.py',821),
+  ('enum_specifier -> ENUM ID','enum_specifier',2,'p_enum_specifier_1','c_parser.py',829),
+  ('enum_specifier -> ENUM TYPEID','enum_specifier',2,'p_enum_specifier_1','c_parser.py',830),
+  ('enum_specifier -> ENUM brace_open enumerator_list brace_close','enum_specifier',4,'p_enum_specifier_2','c_parser.py',835),
+  ('enum_specifier -> ENUM ID brace_open enumerator_list brace_close','enum_specifier',5,'p_enum_specifier_3','c_parser.py',840),
+  ('enum_specifier -> ENUM TYPEID brace_open enumerator_list brace_close','enum_specifier',5,'p_enum_specifier_3','c_parser.py',841),
+  ('enumerator_list -> enumerator','enumerator_list',1,'p_enumerator_list','c_parser.py',846),
+  ('enumerator_list -> enumerator_list COMMA','enumerator_list',2,'p_enumerator_list','c_parser.py',847),
+  ('enumerator_list -> enumerator_list COMMA enumerator','enumerator_list',3,'p_enumerator_list','c_parser.py',848),
+  ('enumerator -> ID','enumerator',1,'p_enumerator','c_parser.py',859),
+  ('enumerator -> ID EQUALS constant_expression','enumerator',3,'p_enumerator','c_parser.py',860),
+  ('declarator -> direct_declarator','declarator',1,'p_declarator_1','c_parser.py',872),
+  ('declarator -> pointer direct_declarator','declarator',2,'p_declarator_2','c_parser.py',877),
+  ('direct_declarator -> ID','direct_declarator',1,'p_direct_declarator_1','c_parser.py',882),
+  ('direct_declarator -> LPAREN declarator RPAREN','direct_declarator',3,'p_direct_declarator_2','c_parser.py',891),
+  ('direct_declarator -> direct_declarator LBRACKET assignment_expression_opt RBRACKET','direct_declarator',4,'p_direct_declarator_3','c_parser.py',896),
+  ('direct_declarator -> direct_declarator LBRACKET TIMES RBRACKET','direct_declarator',4,'p_direct_declarator_4','c_parser.py',908),
+  ('direct_declarator -> direct_declarator LPAREN parameter_type_list RPAREN','direct_declarator',4,'p_direct_declarator_5','c_parser.py',918),
+  ('direct_declarator -> direct_declarator LPAREN identifier_list_opt RPAREN','direct_declarator',4,'p_direct_declarator_5','c_parser.py',919),
+  ('pointer -> TIMES type_qualifier_list_opt','pointer',2,'p_pointer','c_parser.py',929),
+  ('pointer -> TIMES type_qualifier_list_opt pointer','pointer',3,'p_pointer','c_parser.py',930),
+  ('type_qualifier_list -> type_qualifier','type_qualifier_list',1,'p_type_qualifier_list','c_parser.py',940),
+  ('type_qualifier_list -> type_qualifier_list type_qualifier','type_qualifier_list',2,'p_type_qualifier_list','c_parser.py',941),
+  ('parameter_type_list -> parameter_list','parameter_type_list',1,'p_parameter_type_list','c_parser.py',946),
+  ('parameter_type_list -> parameter_list COMMA ELLIPSIS','parameter_type_list',3,'p_parameter_type_list','c_parser.py',947),
+  ('parameter_list -> parameter_declaration','parameter_list',1,'p_parameter_list','c_parser.py',955),
+  ('parameter_list -> parameter_list COMMA parameter_declaration','parameter_list',3,'p_parameter_list','c_parser.py',956),
+  ('parameter_declaration -> declaration_specifiers declarator','parameter_declaration',2,'p_parameter_declaration_1','c_parser.py',965),
+  ('parameter_declaration -> declaration_specifiers abstract_declarator_opt','parameter_declaration',2,'p_parameter_declaration_2','c_parser.py',984),
+  ('identifier_list -> identifier','identifier_list',1,'p_identifier_list','c_parser.py',996),
+  ('identifier_list -> identifier_list COMMA identifier','identifier_list',3,'p_identifier_list','c_parser.py',997),
+  ('initializer -> assignment_expression','initializer',1,'p_initializer_1','c_parser.py',1006),
+  ('initializer -> brace_open initializer_list brace_close','initializer',3,'p_initializer_2','c_parser.py',1011),
+  ('initializer -> brace_open initializer_list COMMA brace_close','initializer',4,'p_initializer_2','c_parser.py',1012),
+  ('initializer_list -> designation_opt initializer','initializer_list',2,'p_initializer_list','c_parser.py',1017),
+  ('initializer_list -> initializer_list COMMA designation_opt initializer','initializer_list',4,'p_initializer_list','c_parser.py',1018),
+  ('designation -> designator_list EQUALS','designation',2,'p_designation','c_parser.py',1029),
+  ('designator_list -> designator','designator_list',1,'p_designator_list','c_parser.py',1037),
+  ('designator_list -> designator_list designator','designator_list',2,'p_designator_list','c_parser.py',1038),
+  ('designator -> LBRACKET constant_expression RBRACKET','designator',3,'p_designator','c_parser.py',1043),
+  ('designator -> PERIOD identifier','designator',2,'p_designator','c_parser.py',1044),
+  ('type_name -> specifier_qualifier_list abstract_declarator_opt','type_name',2,'p_type_name','c_parser.py',1049),
+  ('abstract_declarator -> pointer','abstract_declarator',1,'p_abstract_declarator_1','c_parser.py',1065),
+  ('abstract_declarator -> pointer direct_abstract_declarator','abstract_declarator',2,'p_abstract_declarator_2','c_parser.py',1073),
+  ('abstract_declarator -> direct_abstract_declarator','abstract_declarator',1,'p_abstract_declarator_3','c_parser.py',1078),
+  ('direct_abstract_declarator -> LPAREN abstract_declarator RPAREN','direct_abstract_declarator',3,'p_direct_abstract_declarator_1','c_parser.py',1088),
+  ('direct_abstract_declarator -> direct_abstract_declarator LBRACKET assignment_expression_opt RBRACKET','direct_abstract_declarator',4,'p_direct_abstract_declarator_2','c_parser.py',1092),
+  ('direct_abstract_declarator -> LBRACKET assignment_expression_opt RBRACKET','direct_abstract_declarator',3,'p_direct_abstract_declarator_3','c_parser.py',1102),
+  ('direct_abstract_declarator -> direct_abstract_declarator LBRACKET TIMES RBRACKET','direct_abstract_declarator',4,'p_direct_abstract_declarator_4','c_parser.py',1110),
+  ('direct_abstract_declarator -> LBRACKET TIMES RBRACKET','direct_abstract_declarator',3,'p_direct_abstract_declarator_5','c_parser.py',1120),
+  ('direct_abstract_declarator -> direct_abstract_declarator LPAREN parameter_type_list_opt RPAREN','direct_abstract_declarator',4,'p_direct_abstract_declarator_6','c_parser.py',1128),
+  ('direct_abstract_declarator -> LPAREN parameter_type_list_opt RPAREN','direct_abstract_declarator',3,'p_direct_abstract_declarator_7','c_parser.py',1138),
+  ('block_item -> declaration','block_item',1,'p_block_item','c_parser.py',1149),
+  ('block_item -> statement','block_item',1,'p_block_item','c_parser.py',1150),
+  ('block_item_list -> block_item','block_item_list',1,'p_block_item_list','c_parser.py',1157),
+  ('block_item_list -> block_item_list block_item','block_item_list',2,'p_block_item_list','c_parser.py',1158),
+  ('compound_statement -> brace_open block_item_list_opt brace_close','compound_statement',3,'p_compound_statement_1','c_parser.py',1164),
+  ('labeled_statement -> ID COLON statement','labeled_statement',3,'p_labeled_statement_1','c_parser.py',1170),
+  ('labeled_statement -> CASE constant_expression COLON statement','labeled_statement',4,'p_labeled_statement_2','c_parser.py',1174),
+  ('labeled_statement -> DEFAULT COLON statement','labeled_statement',3,'p_labeled_statement_3','c_parser.py',1178),
+  ('selection_statement -> IF LPAREN expression RPAREN statement','selection_statement',5,'p_selection_statement_1','c_parser.py',1182),
+  ('selection_statement -> IF LPAREN expression RPAREN statement ELSE statement','selection_statement',7,'p_selection_statement_2','c_parser.py',1186),
+  ('selection_statement -> SWITCH LPAREN expression RPAREN statement','selection_statement',5,'p_selection_statement_3','c_parser.py',1190),
+  ('iteration_statement -> WHILE LPAREN expression RPAREN statement','iteration_statement',5,'p_iteration_statement_1','c_parser.py',1195),
+  ('iteration_statement -> DO statement WHILE LPAREN expression RPAREN SEMI','iteration_statement',7,'p_iteration_statement_2','c_parser.py',1199),
+  ('iteration_statement -> FOR LPAREN expression_opt SEMI expression_opt SEMI expression_opt RPAREN statement','iteration_statement',9,'p_iteration_statement_3','c_parser.py',1203),
+  ('iteration_statement -> FOR LPAREN declaration expression_opt SEMI expression_opt RPAREN statement','iteration_statement',8,'p_iteration_statement_4','c_parser.py',1207),
+  ('jump_statement -> GOTO ID SEMI','jump_statement',3,'p_jump_statement_1','c_parser.py',1211),
+  ('jump_statement -> BREAK SEMI','jump_statement',2,'p_jump_statement_2','c_parser.py',1215),
+  ('jump_statement -> CONTINUE SEMI','jump_statement',2,'p_jump_statement_3','c_parser.py',1219),
+  ('jump_statement -> RETURN expression SEMI','jump_statement',3,'p_jump_statement_4','c_parser.py',1223),
+  ('jump_statement -> RETURN SEMI','jump_statement',2,'p_jump_statement_4','c_parser.py',1224),
+  ('expression_statement -> expression_opt SEMI','expression_statement',2,'p_expression_statement','c_parser.py',1229),
+  ('expression -> assignment_expression','expression',1,'p_expression','c_parser.py',1236),
+  ('expression -> expression COMMA assignment_expression','expression',3,'p_expression','c_parser.py',1237),
+  ('typedef_name -> TYPEID','typedef_name',1,'p_typedef_name','c_parser.py',1249),
+  ('assignment_expression -> conditional_expression','assignment_expression',1,'p_assignment_expression','c_parser.py',1253),
+  ('assignment_expression -> unary_expression assignment_operator assignment_expression','assignment_expression',3,'p_assignment_expression','c_parser.py',1254),
+  ('assignment_operator -> EQUALS','assignment_operator',1,'p_assignment_operator','c_parser.py',1267),
+  ('assignment_operator -> XOREQUAL','assignment_operator',1,'p_assignment_operator','c_parser.py',1268),
+  ('assignment_operator -> TIMESEQUAL','assignment_operator',1,'p_assignment_operator','c_parser.py',1269),
+  ('assignment_operator -> DIVEQUAL','assignment_operator',1,'p_assignment_operator','c_parser.py',1270),
+  ('assignment_operator -> MODEQUAL','assignment_operator',1,'p_assignment_operator','c_parser.py',1271),
+  ('assignment_operator -> PLUSEQUAL','assignment_operator',1,'p_assignment_operator','c_parser.py',1272),
+  ('assignment_operator -> MINUSEQUAL','assignment_operator',1,'p_assignment_operator','c_parser.py',1273),
+  ('assignment_operator -> LSHIFTEQUAL','assignment_operator',1,'p_assignment_operator','c_parser.py',1274),
+  ('assignment_operator -> RSHIFTEQUAL','assignment_operator',1,'p_assignment_operator','c_parser.py',1275),
+  ('assignment_operator -> ANDEQUAL','assignment_operator',1,'p_assignment_operator','c_parser.py',1276),
+  ('assignment_operator -> OREQUAL','assignment_operator',1,'p_assignment_operator','c_parser.py',1277),
+  ('constant_expression -> conditional_expression','constant_expression',1,'p_constant_expression','c_parser.py',1282),
+  ('conditional_expression -> binary_expression','conditional_expression',1,'p_conditional_expression','c_parser.py',1286),
+  ('conditional_expression -> binary_expression CONDOP expression COLON conditional_expression','conditional_expression',5,'p_conditional_expression','c_parser.py',1287),
+  ('binary_expression -> cast_expression','binary_expression',1,'p_binary_expression','c_parser.py',1295),
+  ('binary_expression -> binary_expression TIMES binary_expression','binary_expression',3,'p_binary_expression','c_parser.py',1296),
+  ('binary_expression -> binary_expression DIVIDE binary_expression','binary_expression',3,'p_binary_expression','c_parser.py',1297),
+  ('binary_expression -> binary_expression MOD binary_expression','binary_expression',3,'p_binary_expression','c_parser.py',1298),
+  ('binary_expression -> binary_expression PLUS binary_expression','binary_expression',3,'p_binary_expression','c_parser.py',1299),
+  ('binary_expression -> binary_expression MINUS binary_expression','binary_expression',3,'p_binary_expression','c_parser.py',1300),
+  ('binary_expression -> binary_expression RSHIFT binary_expression','binary_expression',3,'p_binary_expression','c_parser.py',1301),
+  ('binary_expression -> binary_expression LSHIFT binary_expression','binary_expression',3,'p_binary_expression','c_parser.py',1302),
+  ('binary_expression -> binary_expression LT binary_expression','binary_expression',3,'p_binary_expression','c_parser.py',1303),
+  ('binary_expression -> binary_expression LE binary_expression','binary_expression',3,'p_binary_expression','c_parser.py',1304),
+  ('binary_expression -> binary_expression GE binary_expression','binary_expression',3,'p_binary_expression','c_parser.py',1305),
+  ('binary_expression -> binary_expression GT binary_expression','binary_expression',3,'p_binary_expression','c_parser.py',1306),
+  ('binary_expression -> binary_expression EQ binary_expression','binary_expression',3,'p_binary_expression','c_parser.py',1307),
+  ('binary_expression -> binary_expression NE binary_expression','binary_expression',3,'p_binary_expression','c_parser.py',1308),
+  ('binary_expression -> binary_expression AND binary_expression','binary_expression',3,'p_binary_expression','c_parser.py',1309),
+  ('binary_expression -> binary_expression OR binary_expression','binary_expression',3,'p_binary_expression','c_parser.py',1310),
+  ('binary_expression -> binary_expression XOR binary_expression','binary_expression',3,'p_binary_expression','c_parser.py',1311),
+  ('binary_expression -> binary_expression LAND binary_expression','binary_expression',3,'p_binary_expression','c_parser.py',1312),
+  ('binary_expression -> binary_expression LOR binary_expression','binary_expression',3,'p_binary_expression','c_parser.py',1313),
+  ('cast_type -> type_name','cast_type',1,'p_cast_type','c_parser.py',1322),
+  ('cast_type -> template','cast_type',1,'p_cast_type','c_parser.py',1323),
+  ('cast_expression -> unary_expression','cast_expression',1,'p_cast_expression_1','c_parser.py',1327),
+  ('cast_expression -> LPAREN cast_type RPAREN cast_expression','cast_expression',4,'p_cast_expression_2','c_parser.py',1331),
+  ('unary_expression -> postfix_expression','unary_expression',1,'p_unary_expression_1','c_parser.py',1335),
+  ('unary_expression -> PLUSPLUS unary_expression','unary_expression',2,'p_unary_expression_2','c_parser.py',1339),
+  ('unary_expression -> MINUSMINUS unary_expression','unary_expression',2,'p_unary_expression_2','c_parser.py',1340),
+  ('unary_expression -> unary_operator cast_expression','unary_expression',2,'p_unary_expression_2','c_parser.py',1341),
+  ('unary_expression -> SIZEOF unary_expression','unary_expression',2,'p_unary_expression_3','c_parser.py',1346),
+  ('unary_expression -> SIZEOF LPAREN type_name RPAREN','unary_expression',4,'p_unary_expression_3','c_parser.py',1347),
+  ('unary_operator -> AND','unary_operator',1,'p_unary_operator','c_parser.py',1355),
+  ('unary_operator -> TIMES','unary_operator',1,'p_unary_operator','c_parser.py',1356),
+  ('unary_operator -> PLUS','unary_operator',1,'p_unary_operator','c_parser.py',1357),
+  ('unary_operator -> MINUS','unary_operator',1,'p_unary_operator','c_parser.py',1358),
+  ('unary_operator -> NOT','unary_operator',1,'p_unary_operator','c_parser.py',1359),
+  ('unary_operator -> LNOT','unary_operator',1,'p_unary_operator','c_parser.py',1360),
+  ('postfix_expression -> primary_expression','postfix_expression',1,'p_postfix_expression_1','c_parser.py',1365),
+  ('postfix_expression -> postfix_expression LBRACKET expression RBRACKET','postfix_expression',4,'p_postfix_expression_2','c_parser.py',1369),
+  ('postfix_expression -> postfix_expression LPAREN argument_expression_list RPAREN','postfix_expression',4,'p_postfix_expression_3','c_parser.py',1373),
+  ('postfix_expression -> postfix_expression LPAREN RPAREN','postfix_expression',3,'p_postfix_expression_3','c_parser.py',1374),
+  ('postfix_expression -> postfix_expression PERIOD identifier','postfix_expression',3,'p_postfix_expression_4','c_parser.py',1379),
+  ('postfix_expression -> postfix_expression ARROW identifier','postfix_expression',3,'p_postfix_expression_4','c_parser.py',1380),
+  ('postfix_expression -> postfix_expression PLUSPLUS','postfix_expression',2,'p_postfix_expression_5','c_parser.py',1385),
+  ('postfix_expression -> postfix_expression MINUSMINUS','postfix_expression',2,'p_postfix_expression_5','c_parser.py',1386),
+  ('postfix_expression -> LPAREN type_name RPAREN brace_open initializer_list brace_close','postfix_expression',6,'p_postfix_expression_6','c_parser.py',1391),
+  ('postfix_expression -> LPAREN type_name RPAREN brace_open initializer_list COMMA brace_close','postfix_expression',7,'p_postfix_expression_6','c_parser.py',1392),
+  ('primary_expression -> identifier','primary_expression',1,'p_primary_expression_1','c_parser.py',1397),
+  ('primary_expression -> constant','primary_expression',1,'p_primary_expression_2','c_parser.py',1401),
+  ('primary_expression -> unified_string_literal','primary_expression',1,'p_primary_expression_3','c_parser.py',1405),
+  ('primary_expression -> unified_wstring_literal','primary_expression',1,'p_primary_expression_3','c_parser.py',1406),
+  ('primary_expression -> LPAREN expression RPAREN','primary_expression',3,'p_primary_expression_4','c_parser.py',1411),
+  ('argument_expression_list -> assignment_expression','argument_expression_list',1,'p_argument_expression_list','c_parser.py',1415),
+  ('argument_expression_list -> argument_expression_list COMMA assignment_expression','argument_expression_list',3,'p_argument_expression_list','c_parser.py',1416),
+  ('identifier -> ID','identifier',1,'p_identifier','c_parser.py',1425),
+  ('constant -> INT_CONST_DEC','constant',1,'p_constant_1','c_parser.py',1429),
+  ('constant -> INT_CONST_OCT','constant',1,'p_constant_1','c_parser.py',1430),
+  ('constant -> INT_CONST_HEX','constant',1,'p_constant_1','c_parser.py',1431),
+  ('constant -> FLOAT_CONST','constant',1,'p_constant_2','c_parser.py',1437),
+  ('constant -> HEX_FLOAT_CONST','constant',1,'p_constant_2','c_parser.py',1438),
+  ('constant -> CHAR_CONST','constant',1,'p_constant_3','c_parser.py',1444),
+  ('constant -> WCHAR_CONST','constant',1,'p_constant_3','c_parser.py',1445),
+  ('unified_string_literal -> STRING_LITERAL','unified_string_literal',1,'p_unified_string_literal','c_parser.py',1456),
+  ('unified_string_literal -> unified_string_literal STRING_LITERAL','unified_string_literal',2,'p_unified_string_literal','c_parser.py',1457),
+  ('unified_wstring_literal -> WSTRING_LITERAL','unified_wstring_literal',1,'p_unified_wstring_literal','c_parser.py',1467),
+  ('unified_wstring_literal -> unified_wstring_literal WSTRING_LITERAL','unified_wstring_literal',2,'p_unified_wstring_literal','c_parser.py',1468),
+  ('brace_open -> LBRACE','brace_open',1,'p_brace_open','c_parser.py',1478),
+  ('brace_close -> RBRACE','brace_close',1,'p_brace_close','c_parser.py',1484),
+  ('empty -> <empty>','empty',0,'p_empty','c_parser.py',1490),
+]
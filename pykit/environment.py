@@ -10,7 +10,7 @@ import copy
 
 from pykit.analysis import cfa
 from pykit.lower import lower_calls, lower_errcheck
-from pykit.codegen import resolve_typedefs, llvm
+from pykit.codegen import resolve_typedefs
 
 root = abspath(dirname(__file__))
 
@@ -47,6 +47,28 @@ default_passes = {
     "passes.codegen": None, # Use codegen.install()
 }
 
+def optin_passes():
+    """
+    Passes that are registered but not part of the default pipeline, see
+    docs/source/pipeline.rst for how to enable them. These are imported
+    when an environment is created, not when pykit is imported.
+    """
+    from pykit.transform import sroa, tailcall, stackalloc, refcounts
+    from pykit.lower import lower_refcounts
+
+    return {
+        # Analyze
+        "passes.sroa": sroa, # before cfa
+
+        # Optimize
+        "passes.tailcall": tailcall,
+        "passes.stackalloc": stackalloc,
+
+        # Lower
+        "passes.lower_refcounts": lower_refcounts,
+        "passes.refcounts": refcounts, # after lower_refcounts
+    }
+
 # ______________________________________________________________________
 
 def fresh_env():
@@ -62,6 +84,7 @@ def fresh_env():
 
     # Passes
     env.update(default_passes)
+    env.update(optin_passes())
 
     # Runtime
     env["runtime.librarypaths"] = []
@@ -70,9 +93,13 @@ def fresh_env():
     # Libraries
     env["library.threads"] = None
 
+    # Exceptions: "costful" or "zerocost" (see pykit.lower.lower_errcheck)
+    env["exceptions.model"] = "costful"
+
     # Misc data
     # { Long : Int32, ...}
     env['types.typedefmap'] = dict(resolve_typedefs.typedef_map)
+    env['types.typedefcache'] = {} # { typemap : { type : resolved type } }
     env["codegen.impl"] = None
     env["codegen.cache"] = {}
 
@@ -344,15 +344,9 @@ class Builder(OpBuilder):
 
         if op:
             if op == 'head':
-                trailing = list(self._curblock.ops)
-            elif op == 'tail':
-                trailing = []
-            else:
-                trailing = list(op.block.ops.iter_from(op))[1:]
-
-            for op in trailing:
-                op.unlink()
-            newblock.extend(trailing)
+                self.func.split_block(self._curblock, None, newblock)
+            elif op != 'tail':
+                self.func.split_block(op.block, op, newblock)
 
         # -------------------------------------------------
         # Patch phis
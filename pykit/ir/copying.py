@@ -7,8 +7,8 @@ Copy pykit IR.
 from __future__ import print_function, division, absolute_import
 from functools import partial
 from pykit.ir import (Module, Value, Function, Block, Constant, Op,
-                      GlobalValue, Undef, FuncArg)
-from pykit.utils import nestedmap, make_temper
+                      GlobalValue, Undef, FuncArg, ops)
+from pykit.utils import make_temper
 
 def _lookup(module, function, valuemap, arg):
     """Helper to reconstruct Operations"""
@@ -72,8 +72,11 @@ def copy_function(func, temper=None, module=None):
     for block in func.blocks:
         new_block = valuemap[block]
         for op in block.ops:
-            new_op = Op(op.opcode, op.type, nestedmap(lookup, op.args),
+            new_args = ops.map_args(lookup, op.opcode, op.args)
+            new_op = Op(op.opcode, op.type, new_args,
                         result=temper(op.result), parent=new_block)
+            if op.metadata:
+                new_op.add_metadata(dict(op.metadata))
             # assert new_op.result != op.result
 
             valuemap[op] = new_op
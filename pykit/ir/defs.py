@@ -8,12 +8,9 @@ from __future__ import print_function, division, absolute_import
 
 import math
 import operator
-import ctypes.util
-
-import numpy as np
 
 from pykit.ir import ops
-from pykit.utils import invert, mergedicts
+from pykit.utils import invert, mergedicts, cached
 
 #===------------------------------------------------------------------===
 # Python Version Compatibility
@@ -73,36 +70,48 @@ compare = {
     ops.contains      : operator.contains,
 }
 
-math_funcs = {
-    ops.Sin         : np.sin,
-    ops.Asin        : np.arcsin,
-    ops.Sinh        : np.sinh,
-    ops.Asinh       : np.arcsinh,
-    ops.Cos         : np.cos,
-    ops.Acos        : np.arccos,
-    ops.Cosh        : np.cosh,
-    ops.Acosh       : np.arccosh,
-    ops.Tan         : np.tan,
-    ops.Atan        : np.arctan,
-    ops.Atan2       : np.arctan2,
-    ops.Tanh        : np.tanh,
-    ops.Atanh       : np.arctanh,
-    ops.Log         : np.log,
-    ops.Log2        : np.log2,
-    ops.Log10       : np.log10,
-    ops.Log1p       : np.log1p,
-    ops.Exp         : np.exp,
-    ops.Exp2        : np.exp2,
-    ops.Expm1       : np.expm1,
-    ops.Floor       : np.floor,
-    ops.Ceil        : np.ceil,
-    ops.Abs         : np.abs,
-    ops.Erfc        : erfc,
-    ops.Rint        : np.rint,
-    ops.Pow         : np.power,
-    ops.Round       : np.round,
+math_names = { # numpy function names, see math_funcs()
+    ops.Sin         : 'sin',
+    ops.Asin        : 'arcsin',
+    ops.Sinh        : 'sinh',
+    ops.Asinh       : 'arcsinh',
+    ops.Cos         : 'cos',
+    ops.Acos        : 'arccos',
+    ops.Cosh        : 'cosh',
+    ops.Acosh       : 'arccosh',
+    ops.Tan         : 'tan',
+    ops.Atan        : 'arctan',
+    ops.Atan2       : 'arctan2',
+    ops.Tanh        : 'tanh',
+    ops.Atanh       : 'arctanh',
+    ops.Log         : 'log',
+    ops.Log2        : 'log2',
+    ops.Log10       : 'log10',
+    ops.Log1p       : 'log1p',
+    ops.Exp         : 'exp',
+    ops.Exp2        : 'exp2',
+    ops.Expm1       : 'expm1',
+    ops.Floor       : 'floor',
+    ops.Ceil        : 'ceil',
+    ops.Abs         : 'abs',
+    ops.Erfc        : None, # erfc() above
+    ops.Rint        : 'rint',
+    ops.Pow         : 'power',
+    ops.Round       : 'round',
 }
 
+@cached
+def math_funcs():
+    """
+    Return { math_opcode : evaluation function }. NumPy is imported on first
+    use, so that importing pykit.ir stays cheap.
+    """
+    import numpy as np
+    funcs = dict((name, getattr(np, npname))
+                     for name, npname in math_names.items() if npname)
+    funcs[ops.Erfc] = erfc
+    return funcs
+
 #===------------------------------------------------------------------===
 # Definitions
 #===------------------------------------------------------------------===
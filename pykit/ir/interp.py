@@ -6,6 +6,7 @@ IR interpreter.
 
 from __future__ import print_function, division, absolute_import
 
+import time
 import ctypes
 import operator
 try:
@@ -13,14 +14,15 @@ try:
 except ImportError:
     import builtins as exceptions
 from itertools import chain, product
-from collections import namedtuple
+from collections import namedtuple, defaultdict, Counter
 from functools import partial
 
 import numpy as np
 
 from pykit import types
 from pykit.ir import Function, Block, GlobalValue, Const, combine, ArgLoader
-from pykit.ir import ops, linearize, defs
+from pykit.ir import ops, linearize, defs, Value, Op, FuncArg, Constant
+from pykit.analysis import regalloc
 from pykit.utils import ValueDict
 
 #===------------------------------------------------------------------===
@@ -28,7 +30,6 @@ from pykit.utils import ValueDict
 #===------------------------------------------------------------------===
 
 Undef = object()                        # Undefined/uninitialized value
-State = namedtuple('State', ['refs'])   # State shared by stack frames
 
 class Reference(object):
     """
@@ -40,49 +41,304 @@ class Reference(object):
         self.refcount = refcount
         self.producer = producer
 
+    def __repr__(self):
+        return "Reference(%r, refcount=%d)" % (self.obj, self.refcount)
+
+class Refcounts(object):
+    """
+    Reference counts of managed objects, shared by all frames (and nested
+    runs) of an interpreter run. Only references owned by interpreted code
+    are counted: objects enter the table through gc_gotref (or as managed
+    arguments) and leave it when their count drops to zero.
+
+        refs:       { id(obj) : Reference }
+        expected:   { id(obj) : refcount } left alive legitimately, i.e.
+                    references owned by the caller (arguments) or returned
+                    to the caller (results)
+        checked:    Whether to verify each refcount operation. In unchecked
+                    mode operations are a single dict update and errors
+                    only show up in the leak report.
+
+    Tracked references keep their objects alive, so ids are not reused
+    while an object is in the table.
+    """
+
+    def __init__(self, checked=True):
+        self.refs = {}
+        self.expected = Counter()
+        self.checked = checked
+
+    def enter(self, func, args):
+        """Track the caller's references to managed arguments of `func`"""
+        for param, arg in zip(func.args, args):
+            if param.type.managed:
+                ref = self.refs.get(id(arg))
+                if ref is None:
+                    self.refs[id(arg)] = Reference(arg, 1, producer=param)
+                else:
+                    ref.refcount += 1
+                self.expected[id(arg)] += 1
+
+    def leave(self, func, args, result):
+        """
+        Release the caller's references to the arguments, and expect a
+        reference to a managed result
+        """
+        for param, arg in zip(func.args, args):
+            if param.type.managed:
+                self.expected[id(arg)] -= 1
+                self.release(arg)
+        if func.type.restype.managed:
+            self.expected[id(result)] += 1
+            if id(result) not in self.refs:
+                self.refs[id(result)] = Reference(result, 0, producer=None)
+
+    def release(self, obj):
+        ref = self.refs.get(id(obj))
+        if ref is None:
+            self.refs[id(obj)] = ref = Reference(obj, 0, producer=None)
+        ref.refcount -= 1
+        if ref.refcount == 0 and not self.expected.get(id(obj)):
+            del self.refs[id(obj)]
+
+    def leaks(self):
+        """
+        Return [(Reference, expected_refcount)] for all objects with an
+        unexpected refcount: leaked references (refcount too high) and
+        over-released ones (refcount too low)
+        """
+        result = []
+        for key, ref in self.refs.items():
+            expected = self.expected[key]
+            if ref.refcount != expected:
+                result.append((ref, expected))
+        return result
+
+    def report(self):
+        """Textual leak report, empty if there are no leaks"""
+        lines = []
+        for ref, expected in self.leaks():
+            if ref.refcount > expected:
+                kind = "leaked %d" % (ref.refcount - expected)
+            else:
+                kind = "over-released %d" % (expected - ref.refcount)
+            lines.append("%s: %s (refcount %d, expected %d), produced by %s" % (
+                kind, ref.obj, ref.refcount, expected, ref.producer))
+        return "\n".join(lines)
+
 class UncaughtException(Exception):
     """
     Raised by the interpreter when code raises an exception that isn't caught
     """
 
+class Code(object):
+    """
+    A function prepared for interpretation, shared by all its frames.
+
+        ops:            Flat list of the function's operations
+        blockstarts:    Dict mapping block labels to address offsets
+        slots:          { Op/FuncArg : register slot }
+        nslots:         Number of register slots
+        results:        Result slot of each operation, indexed by pc
+        loaders:        (template, [(index, slot)]) for each pc, building the
+                        argument list from a template by filling in
+                        registers, or None to use the ArgLoader instead
+        phis:           { Block : [phi Operation] } for blocks with phis
+
+    Values get dense register slots, which are reused when values are no
+    longer live (see pykit.analysis.regalloc). Code is cached on the
+    function and reused by later runs until the function is mutated
+    (see get_code()).
+    """
+
+    def __init__(self, func):
+        self.func = func
+        self.ops, self.blockstarts = linearize(func)
+        self.slots, self.nslots = regalloc.allocate(func)
+        self.undefs = [Undef] * self.nslots
+        self.argslots = [self.slots[arg] for arg in func.args]
+        self.results = [self.slots[op] for op in self.ops]
+        self.loaders = [self.make_loader(op) for op in self.ops]
+        self.phis = {}
+        for op in self.ops:
+            if op.opcode == 'phi':
+                self.phis.setdefault(op.block, []).append(op)
+        self.mutations = func.mutations
+
+    def make_loader(self, op):
+        if op.opcode == 'phi':
+            return None # phis load their own arguments
+
+        template, fill = [], []
+        for i, arg in enumerate(op.args):
+            if isinstance(arg, (Op, FuncArg)):
+                template.append(None)
+                fill.append((i, self.slots[arg]))
+            elif isinstance(arg, Constant):
+                template.append(arg.const)
+            elif isinstance(arg, (Block, Function)):
+                template.append(arg)
+            elif isinstance(arg, (Value, list)):
+                return None
+            else:
+                template.append(arg)
+
+        return template, fill
+
+
+def get_code(func):
+    """Return the Code of `func`, reusing it until `func` is mutated"""
+    code = getattr(func, '_interp_code', None)
+    if (code is None or code.func is not func or
+            code.mutations != func.mutations):
+        code = Code(func)
+        func._interp_code = code
+    return code
+
+
+class Frame(object):
+    """
+    Activation record of an interpreted function. Frames are kept on an
+    explicit stack by the interpreter and recycled through frame_pool,
+    together with their list of values.
+
+        func:           The ir.Function
+        code:           The function's Code
+        values:         [runtime value], indexed by register slot
+        pc:             Program Counter
+        prevblock:      Previously executing basic block
+        exc_handlers:   List of exception target blocks to try
+        call:           The 'call' Operation in the caller receiving our result
+    """
+
+    __slots__ = ('func', 'code', 'values', 'pc', 'prevblock',
+                 'exc_handlers', 'call')
+
+    def __init__(self):
+        self.values = None
+
+# Released Frames, shared by all interpreters
+frame_pool = []
+max_pooled_frames = 256
+
+
 class Interp(object):
     """
     Interpret the function given as a ir.Function. See the run() function
-    below.
+    below. Calls to other pykit functions push a new Frame, they do not
+    recurse in Python.
 
-        func:           The ir.Function we interpret
         exc_model:      ExceptionModel that knows how to deal with exceptions
         argloader:      InterpArgloader: knows how pykit Values are associated
                         with runtime (stack) values (loads from the store)
-        ops:            Flat list of instruction targets (['%0'])
-        blockstarts:    Dict mapping block labels to address offsets
-        prevblock:      Previously executing basic block
-        pc:             Program Counter
+        frames:         Stack of Frames, the last one executing
+        frame:          The executing Frame (frames[-1])
+        code:           { Function : Code }
         lastpc:         Last value of Program Counter
-        exc_handlers:   List of exception target blocks to try
         exception:      Currently raised exception
+        tl_exc:         Thread-local exception (store_tl_exc/load_tl_exc),
+                        e.g. set by external functions that return an error
+        refcounts:      Refcounts of managed objects
         refs:           { id(obj) : Reference }
+        profile:        Profile or None
+
+    The func, ops, blockstarts, pc, prevblock and exc_handlers attributes
+    refer to the executing frame.
     """
 
-    def __init__(self, func, env, exc_model, argloader, state):
-        self.func = func
+    def __init__(self, func, env, exc_model, argloader, refcounts,
+                 profile=None, args=()):
         self.env = env
         self.exc_model = exc_model
         self.argloader = argloader
+        self.profile = profile
 
         self.state = {
             'env':       env,
             'exc_model': exc_model,
+            'profile':   profile,
+            'refcounts': refcounts,
         }
 
-        self.ops, self.blockstarts = linearize(func)
+        self.frames = []
+        self.frame = None
+        self.pool = frame_pool
+        self.code = {}
         self.lastpc = 0
-        self._pc = 0
-        self.prevblock = None
-        self.exc_handlers = None
         self.exception = None
+        self.tl_exc = None
 
-        self.refs = state.refs
+        self.refcounts = refcounts
+        self.refs = refcounts.refs
+        if not refcounts.checked:
+            self.gc_incref = self._fast_incref
+            self.gc_decref = self._fast_decref
+            self.gc_gotref = self._fast_incref
+            self.gc_giveref = self._fast_decref
+        self.push_frame(func, args)
+
+    # __________________________________________________________________
+    # Frames
+
+    def push_frame(self, func, args, call=None):
+        """Enter `func` with the given arguments, called by `call`"""
+        code = self.code.get(func)
+        if code is None:
+            code = self.code[func] = get_code(func)
+
+        frame = self.pool.pop() if self.pool else Frame()
+        frame.func = func
+        frame.code = code
+        values = frame.values
+        if values is None or len(values) != code.nslots:
+            frame.values = values = list(code.undefs)
+        for slot, arg in zip(code.argslots, args):
+            values[slot] = arg
+        frame.pc = 0
+        frame.prevblock = None
+        frame.exc_handlers = []
+        frame.call = call
+
+        self.frames.append(frame)
+        self.frame = frame
+        self.argloader.store = values
+        self.argloader.slots = code.slots
+
+    def pop_frame(self):
+        """Leave the executing frame, returning the 'call' that entered it"""
+        call = self.release_frame()
+        self.frame = caller = self.frames[-1]
+        self.argloader.store = caller.values
+        self.argloader.slots = caller.code.slots
+        return call
+
+    def release_frame(self):
+        """
+        Pop the executing frame and return it to the pool, keeping its
+        (cleared) values list for reuse. Returns the 'call' that entered it.
+        """
+        frame = self.frames.pop()
+        call = frame.call
+        frame.values[:] = frame.code.undefs
+        frame.func = frame.code = frame.call = None
+        frame.prevblock = frame.exc_handlers = None
+        if len(self.pool) < max_pooled_frames:
+            self.pool.append(frame)
+        return call
+
+    func = property(lambda self: self.frame.func)
+    ops = property(lambda self: self.frame.code.ops)
+    blockstarts = property(lambda self: self.frame.code.blockstarts)
+
+    def _setprevblock(self, block):
+        self.frame.prevblock = block
+
+    def _setexc_handlers(self, exc_handlers):
+        self.frame.exc_handlers = exc_handlers
+
+    prevblock = property(lambda self: self.frame.prevblock, _setprevblock)
+    exc_handlers = property(lambda self: self.frame.exc_handlers,
+                            _setexc_handlers)
 
     # __________________________________________________________________
     # Utils
@@ -98,18 +354,28 @@ class Interp(object):
 
     def getop(self, pc):
         """PC -> Op"""
-        return self.ops[pc]
+        return self.frame.code.ops[pc]
 
     def setpc(self, newpc):
-        self.lastpc = self.pc
-        self._pc = newpc
+        self.lastpc = self.frame.pc
+        self.frame.pc = newpc
 
-    pc = property(lambda self: self._pc, setpc, doc="Program Counter")
+    pc = property(lambda self: self.frame.pc, setpc, doc="Program Counter")
 
     def blockswitch(self, oldblock, newblock):
         self.prevblock = oldblock
         self.exc_handlers = []
 
+        code = self.frame.code
+        if newblock in code.phis:
+            # All phis of a block read their incoming values before any of
+            # them is assigned
+            phis = code.phis[newblock]
+            incoming = [self._incoming(phi) for phi in phis]
+            values = self.frame.values
+            for phi, value in zip(phis, incoming):
+                values[code.slots[phi]] = value
+
     noop = lambda *args: None
 
     # __________________________________________________________________
@@ -142,13 +408,17 @@ class Interp(object):
         var['value'] = value
 
     def phi(self):
-        for i, block in enumerate(self.op.args[0]):
+        # Evaluated on entry of the block, see blockswitch()
+        return self.argloader.load_op(self.op)
+
+    def _incoming(self, phi):
+        for i, block in enumerate(phi.args[0]):
             if block == self.prevblock:
-                values = self.op.args[1]
+                values = phi.args[1]
                 return self.argloader.load_op(values[i])
 
         raise RuntimeError("Previous block %r not a predecessor of %r!" %
-                                    (self.prevblock.name, self.op.block.name))
+                                    (self.prevblock.name, phi.block.name))
 
     # __________________________________________________________________
     # Functions
@@ -158,22 +428,20 @@ class Interp(object):
 
     def partial(self, function, *args):
         if isinstance(function, Function):
-            return lambda *more: self.call(function, *(args + more))
+            # Called from Python (e.g. by map()), interpret separately
+            return lambda *more: run(function, args=args + more,
+                                     **self.state)
 
     def call(self, func, args):
         if isinstance(func, Function):
-            # We're calling another known pykit function,
-            try:
-                return run(func, args=args, **self.state)
-            except UncaughtException, e:
-                # make sure to handle any uncaught exceptions properly
-                self.exception, = e.args
-                self._propagate_exc()
+            # We're calling another known pykit function, the dispatch loop
+            # continues in the new frame
+            self.push_frame(func, args, self.op)
         else:
             return func(*args)
 
     def call_math(self, fname, *args):
-        return math_funcs[fname](*args)
+        return defs.math_funcs()[fname](*args)
 
     def call_external(self):
         pass
@@ -301,6 +569,12 @@ class Interp(object):
         self.exception = exc
         self._propagate_exc() # Find exception handler
 
+    def store_tl_exc(self, exc):
+        self.tl_exc = exc
+
+    def load_tl_exc(self):
+        return self.tl_exc
+
     def _exc_match(self, exc_types):
         """
         See whether the current exception matches any of the exception types
@@ -309,25 +583,45 @@ class Interp(object):
                         for exc_type in exc_types)
 
     def _propagate_exc(self):
-        """Propagate installed exception (`self.exception`)"""
+        """
+        Propagate installed exception (`self.exception`), unwinding frames
+        until a handler is found
+        """
         catch_op = self._find_handler()
+        while not catch_op and len(self.frames) > 1:
+            # Propagate to the caller
+            self.pop_frame()
+            catch_op = self._find_handler()
+
         if catch_op:
             # Exception caught! Transfer control to block
             catch_block = catch_op.parent
+            self.blockswitch(self.op.block, catch_block)
             self.pc = self.blockstarts[catch_block.name]
         else:
             # No exception handler!
             raise UncaughtException(self.exception)
 
     def _find_handler(self):
-        """Find a handler for an active exception"""
+        """
+        Find a handler for an active exception. A call unwinds to the
+        handlers in its "exc.unwind" metadata (see lower_errcheck) if it has
+        any, otherwise to the handlers installed by exc_setup.
+        """
         exc = self.exception
 
-        for block in self.exc_handlers:
+        handlers = self.exc_handlers
+        metadata = self.op.metadata
+        if metadata and "exc.unwind" in metadata:
+            handlers = metadata["exc.unwind"]
+
+        for block in handlers:
             for leader in block.leaders:
-                if (leader.opcode == ops.exc_catch and
-                        self._exc_match(leader.args)):
-                    return leader
+                if leader.opcode == ops.exc_catch:
+                    exc_types = [self.argloader.load_op(exc_type)
+                                     for exc_type in leader.args[0]]
+                    if self._exc_match(exc_types):
+                        return leader
 
     # __________________________________________________________________
     # Generators
@@ -374,31 +668,55 @@ class Interp(object):
 
     # __________________________________________________________________
     # GC/Refcounting
+    #
+    # gc_gotref acquires a new reference (e.g. the result of a call), and
+    # gc_giveref hands one off (e.g. stored in a container or returned).
+    # With unchecked Refcounts the _fast_* versions are installed instead.
 
     def _checkref(self, obj):
-        assert id(obj) in self.refs
+        assert id(obj) in self.refs, "Untracked object: %r" % (obj,)
         ref = self.refs[id(obj)]
         assert ref.obj is obj
-        assert ref.refcount >= 1
+        assert ref.refcount >= 1, "Dead object: %r" % (obj,)
+        return ref
 
     def gc_incref(self, obj):
-        self._checkref(obj)
-        ref = self.refs[id(obj)]
+        ref = self._checkref(obj)
         ref.refcount += 1
 
     def gc_decref(self, obj):
-        self._checkref(obj)
-        ref = self.refs[id(obj)]
+        ref = self._checkref(obj)
         ref.refcount -= 1
-        if ref.refcount == 0:
+        if ref.refcount == 0 and not self.refcounts.expected.get(id(obj)):
             del self.refs[id(obj)]
 
     def gc_gotref(self, obj):
-        assert id(obj) not in self.refs
-        self.refs[id(obj)] = 1
+        ref = self.refs.get(id(obj))
+        if ref is None:
+            self.refs[id(obj)] = Reference(obj, 1, producer=self.op)
+        else:
+            assert ref.obj is obj
+            ref.refcount += 1
+
+    gc_giveref = gc_decref
+
+    def _fast_incref(self, obj):
+        try:
+            self.refs[id(obj)].refcount += 1
+        except KeyError:
+            self.refs[id(obj)] = Reference(obj, 1, producer=self.op)
 
-    def gc_giveref(self, obj):
-        self._checkref(obj)
+    def _fast_decref(self, obj):
+        refs = self.refs
+        try:
+            ref = refs[id(obj)]
+        except KeyError:
+            # Over-released, leave it for the leak report
+            refs[id(obj)] = Reference(obj, -1, producer=self.op)
+        else:
+            ref.refcount -= 1
+            if not ref.refcount and not self.refcounts.expected.get(id(obj)):
+                del refs[id(obj)]
 
     def gc_alloc(self, n):
         result = np.empty(n, dtype=np.object)
@@ -448,20 +766,114 @@ class ExceptionModel(object):
         return exc_type(*args)
 
 #===------------------------------------------------------------------===
-# Run
+# Profiling
 #===------------------------------------------------------------------===
 
-def _init_state(func, args):
-    """Initialize refcount state"""
-    refcounts = {}
-    return State(refcounts) # todo
-    for param, arg in zip(func.args, args):
-        if param.type.managed:
-            refcounts[id(arg)] = Reference(obj=arg, refcount=1, producer=param)
+class Profile(object):
+    """
+    Execution profile, collected by run(func, ..., profile=Profile()). A
+    profile accumulates over multiple runs and over calls to other pykit
+    functions. The time of a 'call' does not include the time spent in the
+    callee.
+
+        counts:         { Operation : number of executions }
+        times:          { Operation : cumulative time in seconds }
+        block_counts:   { Block : number of times the block was entered }
+        edges:          { (Block, Block) : number of jumps/cbranches taken }
+    """
+
+    def __init__(self, timer=time.time):
+        self.timer = timer
+        self.counts = Counter()
+        self.times = Counter()
+        self.block_counts = Counter()
+        self.edges = Counter()
 
-    return State(refcounts)
+    def record(self, op, elapsed):
+        self.counts[op] += 1
+        self.times[op] += elapsed
+
+    def enter_block(self, block):
+        self.block_counts[block] += 1
+
+    def record_edge(self, src, dst):
+        self.edges[src, dst] += 1
+
+    # __________________________________________________________________
+
+    @property
+    def block_times(self):
+        """{ Block : cumulative time of the ops in the block }"""
+        result = Counter()
+        for op, t in self.times.items():
+            result[op.block] += t
+        return result
+
+    @property
+    def opcode_counts(self):
+        """{ opcode : number of executions }"""
+        result = Counter()
+        for op, n in self.counts.items():
+            result[op.opcode] += n
+        return result
+
+    @property
+    def opcode_times(self):
+        """{ opcode : cumulative time }"""
+        result = Counter()
+        for op, t in self.times.items():
+            result[op.opcode] += t
+        return result
+
+    def annotate(self):
+        """
+        Attach the profile to the executed operations as metadata:
+
+            profile.count:  number of executions
+            profile.time:   cumulative time
+            profile.edges:  { Block : count } on jump and cbranch
+        """
+        successors = defaultdict(dict)
+        for (src, dst), n in self.edges.items():
+            successors[src][dst] = n
+
+        for op, n in self.counts.items():
+            metadata = { 'profile.count': n, 'profile.time': self.times[op] }
+            if op.opcode in (ops.jump, ops.cbranch):
+                metadata['profile.edges'] = successors[op.block]
+            op.add_metadata(metadata)
+
+    def report(self, limit=10):
+        """Return a textual summary of the hottest opcodes and blocks"""
+        lines = ["%-24s %10s %12s" % ("opcode", "count", "time (ms)")]
+        counts = self.opcode_counts
+        for opcode, t in self.opcode_times.most_common(limit):
+            lines.append("%-24s %10d %12.3f" % (opcode, counts[opcode], t*1000))
+
+        lines.append("")
+        lines.append("%-24s %10s %12s" % ("block", "count", "time (ms)"))
+        for block, t in self.block_times.most_common(limit):
+            name = "%s.%s" % (block.parent.name, block.name)
+            lines.append("%-24s %10d %12.3f" % (name, self.block_counts[block],
+                                                t * 1000))
+        return "\n".join(lines)
+
+#===------------------------------------------------------------------===
+# Run
+#===------------------------------------------------------------------===
 
 class InterpArgLoader(ArgLoader):
+    """
+    Load runtime values of a frame. The store is the list of registers,
+    indexed by slot.
+    """
+
+    slots = None # { Op/FuncArg : slot }
+
+    def load_Operation(self, arg):
+        return self.store[self.slots[arg]]
+
+    load_FuncArg = load_Operation
 
     def load_GlobalValue(self, arg):
         assert not arg.external, "Not supported yet"
@@ -471,43 +883,85 @@ class InterpArgLoader(ArgLoader):
         return Undef
 
 
-def run(func, env=None, exc_model=None, _state=None, args=()):
+def run(func, env=None, exc_model=None, args=(), profile=None,
+        refcounts=None):
     """
     Interpret function. Raises UncaughtException(exc) for uncaught exceptions
+
+    Pass a Profile as `profile` to collect execution counts and timings.
+    Pass Refcounts as `refcounts` to inspect managed references after the
+    run, e.g. refcounts.report() lists leaks. Refcounts(checked=False)
+    verifies less, but costs O(1) per refcount operation.
     """
     assert len(func.args) == len(args)
 
-    valuemap = dict(zip(func.argnames, args)) # { '%0' : pyval }
-    argloader = InterpArgLoader(valuemap)
+    if refcounts is None:
+        refcounts = Refcounts()
+    refcounts.enter(func, args)
+
+    argloader = InterpArgLoader()
     interp = Interp(func, env, exc_model or ExceptionModel(),
-                    argloader, state=_state or _init_state(func, args))
+                    argloader, refcounts, profile=profile, args=args)
     if env:
         handlers = env.get("interp.handlers") or {}
     else:
         handlers = {}
 
-    curblock = None
+    if profile is not None:
+        timer = profile.timer
+
     while True:
-        op = interp.op
-        if op.block != curblock:
-            interp.blockswitch(curblock, op.block)
-            curblock = op.block
+        frame = interp.frame
+        code = frame.code
+        oldpc = frame.pc
+        op = code.ops[oldpc]
 
         if op.opcode in handlers:
             fn = partial(handlers[op.opcode], interp)
         else:
             fn = getattr(interp, op.opcode)
 
-        args = argloader.load_args(op)
+        loader = code.loaders[oldpc]
+        if loader is None:
+            opargs = argloader.load_args(op)
+        else:
+            template, fill = loader
+            opargs = list(template)
+            values = frame.values
+            for i, slot in fill:
+                opargs[i] = values[slot]
 
         # Execute...
-        oldpc = interp.pc
-        result = fn(*args)
-        valuemap[op.result] = result
+        if profile is None:
+            result = fn(*opargs)
+        else:
+            if op.block.ops.head is op:
+                profile.enter_block(op.block)
+            t = timer()
+            result = fn(*opargs)
+            profile.record(op, timer() - t)
+
+        if interp.frame is not frame:
+            # Entered a callee, or unwound to an exception handler of a caller
+            continue
+
+        frame.values[code.results[oldpc]] = result
 
         # Advance PC
-        if oldpc == interp.pc:
-            interp.incr_pc()
-        elif interp.pc == -1:
+        if oldpc == frame.pc:
+            frame.pc += 1
+        elif frame.pc == -1:
             # Returning...
-            return result
\ No newline at end of file
+            if len(interp.frames) == 1:
+                interp.release_frame()
+                refcounts.leave(func, args, result)
+                return result
+            call = interp.pop_frame()
+            caller = interp.frame
+            caller.values[caller.code.slots[call]] = result
+            caller.pc += 1
+        else:
+            newblock = code.ops[frame.pc].block
+            interp.blockswitch(op.block, newblock)
+            if profile is not None and op.opcode in (ops.jump, ops.cbranch):
+                profile.record_edge(op.block, newblock)
@@ -12,6 +12,7 @@ except NameError:
 
 all_ops = []
 op_syntax = {} # Op -> Syntax
+list_positions = {} # Op -> indices of nested lists, or None if unknown
 
 List  = collections.namedtuple('List',  []) # syntactic list
 Value = collections.namedtuple('Value', []) # single Value
@@ -34,6 +35,11 @@ def op(name, *args):
     name = intern(name)
     all_ops.append(name)
     op_syntax[name] = list(args)
+    if any(arg in (Any, Obj, Star) for arg in args):
+        list_positions[name] = None
+    else:
+        list_positions[name] = tuple(i for i, arg in enumerate(args)
+                                           if arg == List)
     return name
 
 #===------------------------------------------------------------------===
@@ -278,3 +284,53 @@ def oplist(pattern):
     for name, value in globals().iteritems():
         if not name.startswith('__') and fnmatch.fnmatch(name, pattern):
             yield value
+
+#===------------------------------------------------------------------===
+# Operand iteration
+#===------------------------------------------------------------------===
+
+# These use list_positions to know which arguments are nested lists, and
+# fall back to isinstance checks for opcodes with Any, Obj or Star syntax
+# (or unknown opcodes). A malformed argument (a non-list at a List position)
+# is passed through as is, so the verifier can report it.
+
+def flat_args(opcode, args):
+    """
+    Iterate over the arguments of an `opcode` operation, flattening nested
+    lists. Arguments without nested lists are returned as is.
+    """
+    positions = list_positions.get(opcode)
+    if positions == ():
+        return args
+    elif positions is None:
+        return _flatten(args)
+    return _flatten_positions(args, positions)
+
+def map_args(f, opcode, args):
+    """Map `f` over the arguments of an `opcode` operation and nested lists"""
+    positions = list_positions.get(opcode)
+    if positions == ():
+        return [f(arg) for arg in args]
+    elif positions is None:
+        return [[f(x) for x in arg] if isinstance(arg, list) else f(arg)
+                    for arg in args]
+
+    return [[f(x) for x in arg]
+                if i in positions and isinstance(arg, list) else f(arg)
+                    for i, arg in enumerate(args)]
+
+def _flatten(args):
+    for arg in args:
+        if isinstance(arg, list):
+            for x in arg:
+                yield x
+        else:
+            yield arg
+
+def _flatten_positions(args, positions):
+    for i, arg in enumerate(args):
+        if i in positions and isinstance(arg, list):
+            for x in arg:
+                yield x
+        else:
+            yield arg
@@ -5,7 +5,6 @@ Pretty print pykit IR.
 """
 
 from __future__ import print_function, division, absolute_import
-from pykit.utils import hashable
 
 prefix = lambda s: '%' + s
 indent = lambda s: '\n'.join('    ' + s for s in s.splitlines())
@@ -41,27 +40,47 @@ def fblock(block):
 
 def _farg(oparg):
     from pykit import ir
-    if isinstance(oparg, ir.Function):
-        return oparg.name
+    if isinstance(oparg, list):
+        return '[' + ajoin(map(_farg, oparg)) + ']'
+    elif isinstance(oparg, dict):
+        items = sorted((_farg(key), _farg(value))
+                           for key, value in oparg.iteritems())
+        return '{' + ajoin(key + ': ' + value for key, value in items) + '}'
+    elif isinstance(oparg, (ir.Constant, ir.Undef)):
+        return pretty(oparg)
+    elif isinstance(oparg, ir.Value):
+        return prefix(oparg.result)
     else:
-        return str(oparg)
+        return fliteral(oparg)
+
+def fliteral(value):
+    """Format a Python value, exceptions are formatted by name"""
+    if isinstance(value, type) and issubclass(value, BaseException):
+        return value.__name__
+    elif isinstance(value, BaseException):
+        return type(value).__name__ + parens(ajoin(map(fliteral, value.args)))
+    return repr(value)
 
 def fop(op):
-    return '%{0} = ({1}) {2}({3})'.format(op.result, ftype(op.type), op.opcode,
-                                          ajoin(map(prefix, map(_farg, op.operands))))
+    result = '%{0} = ({1}) {2}({3})'.format(op.result, ftype(op.type),
+                                            op.opcode,
+                                            ajoin(map(_farg, op.args)))
+    if op.metadata:
+        result += ' !' + _farg(op.metadata)
+    return result
 
 def fconst(c):
-    return 'const(%s, %s)' % (ftype(c.type), c.const)
+    return 'const(%s, %s)' % (ftype(c.type), fliteral(c.const))
 
 def fglobal(val):
     return "global %{0} = {1}".format(val.name, ftype(val.type))
 
 def fundef(val):
-    return 'Undef'
+    return 'Undef(%s)' % (ftype(val.type),)
 
 def ftype(val):
     from pykit import types
-    if hashable(val) and val in types.type2name:
+    if isinstance(val, types.Type) and val in types.type2name:
         return types.type2name[val]
     return str(val)
 
@@ -17,14 +17,14 @@ entry:
 
 start:
     %1 = (Float32) convert(%0)
-    %4 = (Void) store(%const(Int32, 5), %3)
+    %4 = (Void) store(const(Int32, 5), %3)
     %5 = (Void) jump(%loop.cond)
 
 loop.cond:
     %6 = (Int32) load(%3)
-    %7 = (Int32) add(%6, %const(Int32, 2))
+    %7 = (Int32) add(%6, const(Int32, 2))
     %8 = (Void) store(%7, %3)
-    %9 = (Bool) lt(%6, %const(Int32, 10))
+    %9 = (Bool) lt(%6, const(Int32, 10))
     %10 = (Void) cbranch(%9, %loop.body, %loop.exit)
 
 loop.body:
@@ -1,9 +1,11 @@
 # -*- coding: utf-8 -*-
 from __future__ import print_function, division, absolute_import
 
+import sys
 import unittest
 from pykit.parsing import cirparser
-from pykit.ir import verify, interp
+from pykit import types
+from pykit.ir import verify, interp, Function, Builder, Const
 
 source = """
 #include <pykit_ir.h>
@@ -27,6 +29,20 @@ int raise() {
     exc_throw(exc);
     return 0;
 }
+
+int call_raise() {
+    int x = call(raise, list());
+    return x;
+}
+
+Int32 depth(Int32 n) {
+    if (n < 1) {
+        return 0;
+    }
+    Int32 m = n - 1;
+    Int32 x = call(depth, list(m));
+    return x + 1;
+}
 """
 
 mod = cirparser.from_c(source)
@@ -52,4 +68,104 @@ class TestInterp(unittest.TestCase):
             exc, = e.args
             assert isinstance(exc, TypeError), exc
         else:
-            assert False, result
\ No newline at end of file
+            assert False, result
+
+    def test_exception_propagation(self):
+        f = mod.get_function('call_raise')
+        self.assertRaises(interp.UncaughtException, interp.run, f)
+
+    def test_deep_recursion(self):
+        # calls do not recurse in Python
+        f = mod.get_function('depth')
+        n = sys.getrecursionlimit() * 2
+        self.assertEqual(interp.run(f, args=[n]), n)
+
+    def test_code_cache(self):
+        f = Function("square", ["x"],
+                     types.Function(types.Int32, [types.Int32]))
+        b = Builder(f)
+        b.position_at_end(f.new_block("entry"))
+        x = f.get_arg("x")
+        mul = b.mul(types.Int32, [x, x])
+        b.ret(mul)
+
+        code = interp.get_code(f)
+        self.assertIs(interp.get_code(f), code)
+        self.assertEqual(interp.run(f, args=[3]), 9)
+
+        # Mutating the function invalidates its Code
+        mul.replace_op('add', [x, x])
+        self.assertIsNot(interp.get_code(f), code)
+        self.assertEqual(interp.run(f, args=[3]), 6)
+
+    def test_profile(self):
+        loop = mod.get_function('loop')
+        cond, body, exit = [loop.get_block(name)
+                            for name in ('cond1', 'body1', 'exit1')]
+        profile = interp.Profile()
+        result = interp.run(loop, profile=profile)
+        assert result == 45, result
+
+        self.assertEqual(profile.block_counts[loop.startblock], 1)
+        self.assertEqual(profile.block_counts[cond], 11)
+        self.assertEqual(profile.block_counts[body], 10)
+        self.assertEqual(profile.edges[cond, body], 10)
+        self.assertEqual(profile.edges[cond, exit], 1)
+        self.assertEqual(profile.opcode_counts['add'], 20)
+        self.assertEqual(profile.opcode_counts['ret'], 1)
+
+        profile.annotate()
+        self.assertEqual(cond.terminator.metadata['profile.edges'],
+                         { body: 10, exit: 1 })
+        self.assertEqual(body.terminator.metadata['profile.count'], 10)
+
+# ______________________________________________________________________
+
+ManagedList = types.List(types.Int32, -1, managed=True)
+
+def refcount_function(incref=0, decref=0, give=False):
+    """
+    Build a function that takes a managed list argument, applies the given
+    refcount operations to it, and creates a new list which is either
+    released or returned
+    """
+    restype = ManagedList if give else types.Int32
+    f = Function("refs", ["lst"], types.Function(restype, [ManagedList]))
+    b = Builder(f)
+    b.position_at_end(f.new_block("entry"))
+    new = b.new_list(ManagedList, [[]])
+    b.gc_gotref(types.Void, [new])
+    for i in range(incref):
+        b.gc_incref(types.Void, [f.get_arg("lst")])
+    for i in range(decref):
+        b.gc_decref(types.Void, [f.get_arg("lst")])
+    if not give:
+        b.gc_decref(types.Void, [new])
+    b.ret(new if give else Const(0, types.Int32))
+    return f
+
+class TestRefcounts(unittest.TestCase):
+
+    def check(self, f, leaks, checked=True):
+        refcounts = interp.Refcounts(checked=checked)
+        interp.run(f, args=[[1, 2]], refcounts=refcounts)
+        self.assertEqual([(ref.refcount, expected)
+                              for ref, expected in refcounts.leaks()], leaks)
+        return refcounts
+
+    def test_balanced(self):
+        for checked in (True, False):
+            self.check(refcount_function(incref=2, decref=2), [], checked)
+            self.check(refcount_function(give=True), [], checked)
+
+    def test_leak(self):
+        for checked in (True, False):
+            refcounts = self.check(refcount_function(incref=2, decref=1),
+                                   [(1, 0)], checked)
+            self.assertIn("leaked 1", refcounts.report())
+
+    def test_overrelease(self):
+        f = refcount_function(decref=2)
+        self.assertRaises(AssertionError, interp.run, f, args=[[1]])
+        refcounts = self.check(f, [(-2, 0)], checked=False)
+        self.assertIn("over-released 2", refcounts.report())
@@ -5,8 +5,9 @@ import unittest
 
 from pykit import types
 from pykit.parsing import from_c
-from pykit.ir import Builder, ops, opcodes
+from pykit.ir import Builder, Op, Const, ops, opcodes
 from pykit.analysis import cfa
+from pykit.tests import make_function
 
 source = """
 float testfunc(int a) {
@@ -32,4 +33,92 @@ class TestIR(unittest.TestCase):
                 break
 
         cfa.run(self.f)
-        self.assertEqual(opcodes(self.f), ['mul', 'add', 'convert', 'ret'])
\ No newline at end of file
+        self.assertEqual(opcodes(self.f), ['mul', 'add', 'convert', 'ret'])
+
+
+class TestOperands(unittest.TestCase):
+
+    def test_flat_args(self):
+        args = ['f', ['a', 'b']]
+        self.assertEqual(ops.list_positions[ops.call], None)
+        self.assertEqual(ops.list_positions[ops.new_list], (0,))
+        self.assertEqual(list(ops.flat_args(ops.call, args)), ['f', 'a', 'b'])
+        self.assertEqual(list(ops.flat_args(ops.new_list, [['a', 'b']])),
+                         ['a', 'b'])
+        self.assertEqual(list(ops.flat_args(ops.add, ['a', 'b'])), ['a', 'b'])
+        self.assertEqual(list(ops.flat_args('unknown', args)), ['f', 'a', 'b'])
+
+    def test_map_args(self):
+        f = str.upper
+        self.assertEqual(ops.map_args(f, ops.call, ['f', ['a', 'b']]),
+                         ['F', ['A', 'B']])
+        self.assertEqual(ops.map_args(f, ops.phi, [['a'], ['b']]),
+                         [['A'], ['B']])
+        self.assertEqual(ops.map_args(f, ops.add, ['a', 'b']), ['A', 'B'])
+
+    def test_malformed(self):
+        # A non-list at a List position is left for the verifier
+        self.assertEqual(list(ops.flat_args(ops.new_list, ['a'])), ['a'])
+        self.assertEqual(ops.map_args(str.upper, ops.new_list, ['a']), ['A'])
+        f, b = make_function([])
+        self.assertRaises(AssertionError, b.new_list,
+                          types.List(types.Int32, -1), [Const(1, types.Int32)])
+
+
+class TestBlocks(unittest.TestCase):
+
+    def setUp(self):
+        self.f, self.b = make_function([types.Int32], argnames=["a"])
+        self.entry = self.f.startblock
+        a = self.f.get_arg("a")
+        self.add = self.b.add(types.Int32, [a, a])
+        self.mul = self.b.mul(types.Int32, [self.add, a])
+        self.b.ret(self.mul)
+
+    def test_split_merge(self):
+        uses = dict((op, set(self.f.uses[op])) for op in self.f.ops)
+        block = self.f.new_block("block", after=self.entry)
+        self.f.split_block(self.entry, self.add, block)
+        self.assertEqual(opcodes(self.entry), ['add'])
+        self.assertEqual(opcodes(block), ['mul', 'ret'])
+        self.assertIs(self.mul.block, block)
+
+        self.f.merge_blocks(self.entry, block)
+        self.assertEqual(opcodes(self.f), ['add', 'mul', 'ret'])
+        self.assertEqual([b.name for b in self.f.blocks], ['entry'])
+        self.assertIs(self.mul.block, self.entry)
+        self.assertEqual(len(self.entry.ops), 3)
+        self.assertEqual(dict((op, self.f.uses[op]) for op in self.f.ops), uses)
+
+    def test_split_all(self):
+        block = self.f.new_block("block", after=self.entry)
+        self.f.split_block(self.entry, None, block)
+        self.assertEqual(opcodes(self.entry), [])
+        self.assertEqual(opcodes(block), ['add', 'mul', 'ret'])
+
+    def test_comes_before(self):
+        ret = self.entry.terminator
+        self.assertTrue(self.add.comes_before(self.mul))
+        self.assertFalse(ret.comes_before(self.mul))
+        self.assertFalse(self.add.comes_before(self.add))
+
+        # Insert repeatedly at the same position until renumbering
+        a = self.f.get_arg("a")
+        last = self.mul
+        for i in range(20):
+            op = Op('add', types.Int32, [a, a], self.f.temp())
+            op.insert_after(self.add)
+            self.assertTrue(self.add.comes_before(op))
+            self.assertTrue(op.comes_before(last))
+            last = op
+
+        with self.b.at_end(self.entry):
+            op = self.b.add(types.Int32, [a, a])
+        self.assertTrue(ret.comes_before(op))
+
+    def test_comes_before_moved(self):
+        self.assertTrue(self.add.comes_before(self.mul))
+        block = self.f.new_block("block", after=self.entry)
+        self.f.split_block(self.entry, None, block)
+        self.assertTrue(self.add.comes_before(self.mul))
+        self.assertTrue(self.mul.comes_before(block.terminator))
@@ -1,7 +1,11 @@
 # -*- coding: utf-8 -*-
 from __future__ import print_function, division, absolute_import
 
-from pykit.ir import visit, combine, Op
+import unittest
+
+from pykit import types
+from pykit.ir import visit, combine, Op, Function, Builder, traversal
+from pykit.error import CompileError
 from pykit.tests import *
 
 class SampleVisitor(object):
@@ -28,4 +32,40 @@ class TestTraversal(SourceTestCase):
         with self.b.at_front(self.entry):
             self.b.emit(Op('blah', None, []))
         visit(comb, self.f)
-        self.eq(visitor.recorded, ['blah', 'mul'])
\ No newline at end of file
+        self.eq(visitor.recorded, ['blah', 'mul'])
+
+class TestDispatch(unittest.TestCase):
+
+    def setUp(self):
+        self.f = Function("f", ["a"], types.Function(types.Int32, [types.Int32]))
+        b = Builder(self.f)
+        b.position_at_end(self.f.new_block("entry"))
+        a = self.f.get_arg("a")
+        b.ret(b.mul(types.Int32, [b.add(types.Int32, [a, a]), a]))
+
+    def test_dispatch_table(self):
+        visitor = SampleVisitor()
+        visitor.op_add = lambda op: visitor.recorded.append('add')
+        table = traversal.dispatch_table(visitor)
+        self.assertEqual(sorted(table), ['add', 'mul'])
+        self.assertEqual(table['mul'], visitor.op_mul)
+        self.assertIn(SampleVisitor, traversal._method_tables)
+
+        visit(visitor, self.f)
+        self.assertEqual(visitor.recorded, ['add', 'mul'])
+
+    def test_cached_table(self):
+        visitor = SampleVisitor()
+        table = traversal.dispatch_table(visitor)
+        self.assertIs(traversal.dispatch_table(visitor), table)
+
+        visitor.op_ret = lambda op: visitor.recorded.append('ret')
+        visit(visitor, self.f)
+        self.assertEqual(visitor.recorded, ['mul'])
+        traversal.clear_dispatch_table(visitor)
+        visit(visitor, self.f)
+        self.assertEqual(visitor.recorded, ['mul', 'mul', 'ret'])
+
+    def test_errmissing(self):
+        self.assertRaises(CompileError, visit, SampleVisitor(), self.f,
+                          errmissing=True)
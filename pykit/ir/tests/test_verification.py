@@ -0,0 +1,130 @@
+# -*- coding: utf-8 -*-
+
+from __future__ import print_function, division, absolute_import
+import unittest
+
+from pykit import types
+from pykit.ir import Op, Const, FuncArg, ops, verification
+from pykit.ir.verification import verify_function, verify_op_syntax, VerifyError
+from pykit.tests import make_function
+
+def make_jump():
+    f, b = make_function([types.Int32], argnames=["x"])
+    entry = f.startblock
+    exit = f.new_block("exit")
+    a = b.add(types.Int32, [f.get_arg("x"), f.get_arg("x")])
+    b.jump(exit)
+    b.position_at_end(exit)
+    b.ret(a)
+    return f, entry, exit
+
+def corrupt(block):
+    """Add an op with bad syntax without bumping the block's mutations"""
+    bad = Op("add", types.Int32, [], "bad")
+    bad.parent = block
+    block.ops.insert_before(bad, block.tail)
+    return bad
+
+class TestVerification(unittest.TestCase):
+
+    def test_verify(self):
+        f, entry, exit = make_jump()
+        verify_function(f)
+        corrupt(exit)
+        verification.invalidate(f)
+        self.assertRaises(AssertionError, verify_function, f)
+
+    def test_incremental(self):
+        f, entry, exit = make_jump()
+        verify_function(f)
+
+        # Unchanged blocks are not verified again
+        bad = corrupt(exit)
+        verify_function(f)
+
+        exit.mutations += 1
+        self.assertRaises(AssertionError, verify_function, f)
+        bad.parent.ops.remove(bad)
+        verify_function(f)
+
+    def test_mutation(self):
+        f, entry, exit = make_jump()
+        verify_function(f)
+        ret = exit.terminator
+        ret.set_args([f.get_arg("x")])
+        verify_function(f)
+        ret.set_args([])
+        self.assertRaises(ValueError, verify_function, f)
+
+    def test_signature(self):
+        f, entry, exit = make_jump()
+        verify_function(f)
+        f.type = types.Function(types.Float32, [types.Int32])
+        self.assertRaises(AssertionError, verify_function, f)
+
+    def test_uniqueness(self):
+        f, entry, exit = make_jump()
+        verify_function(f)
+        a = entry.head
+        ret = exit.terminator
+        ret.result = a.result
+        exit.mutations += 1
+        self.assertRaises(VerifyError, verify_function, f)
+
+        # Names of changed blocks are released
+        a.result = f.temp()
+        entry.mutations += 1
+        verify_function(f)
+
+    def test_block_order(self):
+        f, entry, exit = make_jump()
+        verify_function(f)
+        f.del_block(entry)
+        f.add_block(entry)
+        self.assertRaises(VerifyError, verify_function, f)
+
+    def test_levels(self):
+        f, entry, exit = make_jump()
+        corrupt(exit)
+        verify_function(f, level="off")
+        self.assertRaises(AssertionError, verify_function, f, level="cheap")
+
+    def test_cheap(self):
+        f, entry, exit = make_jump()
+        f.del_block(entry)
+        f.add_block(entry)
+        verify_function(f, level="cheap")
+        self.assertRaises(VerifyError, verify_function, f, level="full")
+
+class TestOpSyntax(unittest.TestCase):
+
+    def test_validators(self):
+        f, entry, exit = make_jump()
+        x = f.get_arg("x")
+        const = Const(1, types.Int32)
+        verify_op_syntax(Op("add", types.Int32, [x, x]))
+        verify_op_syntax(Op("call", types.Int32, [f, [x]]))
+        verify_op_syntax(Op("cbranch", types.Void, [x, entry, exit]))
+        verify_op_syntax(Op("call_math", types.Int32, [const, [x]]))
+
+        self.assertRaises(AssertionError, verify_op_syntax,
+                          Op("add", types.Int32, [x]))
+        self.assertRaises(AssertionError, verify_op_syntax,
+                          Op("call", types.Int32, []))
+        self.assertRaises(AssertionError, verify_op_syntax,
+                          Op("add", types.Int32, [x, [x]]))
+
+    def test_vararg(self):
+        validator = verification.make_validator(
+            "foo", [ops.Value, ops.List, ops.Star])
+        x = FuncArg(None, "x", types.Int32)
+        validator(Op("foo", types.Void, [x, [], 1, 2]))
+        self.assertRaises(AssertionError, validator, Op("foo", types.Void, [x]))
+
+    def test_invalid_syntax(self):
+        self.assertRaises(ValueError, verification.make_validator,
+                          "foo", [ops.Value, object])
+
+
+if __name__ == '__main__':
+    unittest.main()
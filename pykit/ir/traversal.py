@@ -15,24 +15,74 @@ Visitor and transformer helpers.
 
     Combinator([visitors...]):
         Combine a bunch of visitors into one
+
+    dispatch_table(visitor):
+        { opcode : handler } for the visitor
+
+Handlers are looked up through a dispatch table. The opcodes handled by a
+visitor class are found once for each class, and the table of bound handlers
+is cached on the visitor on its first visit. Instance attributes named op_*
+are also picked up, but only those set before the first visit (or before
+clear_dispatch_table()).
 """
 
 from __future__ import print_function, division, absolute_import
 import inspect
 from functools import partial
 
-from pykit.utils import nestedmap
+from pykit.ir import ops
 from pykit.error import CompileError
 
 def _missing(visitor, op):
     raise CompileError(
                 "Opcode %r not implemented by %s" % (op.opcode, visitor))
 
+# ______________________________________________________________________
+# Dispatch
+
+_method_tables = {} # { visitor class : { opcode : method name } }
+
+def _method_table(cls):
+    """Map opcodes to the names of the op_* methods of `cls` (cached)"""
+    table = _method_tables.get(cls)
+    if table is None:
+        table = dict((attr[3:], attr) for attr in dir(cls)
+                                          if attr.startswith('op_'))
+        _method_tables[cls] = table
+    return table
+
+def dispatch_table(obj):
+    """Return the table { opcode : handler } for the visitor `obj` (cached)"""
+    attrs = getattr(obj, '__dict__', None)
+    if attrs is not None and '_dispatch_table' in attrs:
+        return attrs['_dispatch_table']
+
+    if isinstance(obj, Combinator):
+        table = obj.dispatch_table()
+    else:
+        methods = _method_table(obj.__class__)
+        table = dict((opcode, getattr(obj, attr))
+                         for opcode, attr in methods.iteritems())
+        for attr, value in (attrs or {}).iteritems():
+            if attr.startswith('op_'):
+                table[attr[3:]] = value
+
+    if attrs is not None:
+        attrs['_dispatch_table'] = table
+    return table
+
+def clear_dispatch_table(obj):
+    """Forget the cached dispatch table of `obj`, e.g. after adding handlers"""
+    getattr(obj, '__dict__', {}).pop('_dispatch_table', None)
+
+# ______________________________________________________________________
+
 def transform(obj, function, handlers=None, errmissing=False):
     """Transform a bunch of operations"""
     obj = combine(obj, handlers)
+    table = dispatch_table(obj)
     for op in function.ops:
-        fn = getattr(obj, 'op_' + op.opcode, None)
+        fn = table.get(op.opcode)
         if fn is not None:
             result = fn(op)
             if result is not None and result is not op:
@@ -43,8 +93,9 @@ def transform(obj, function, handlers=None, errmissing=False):
 def visit(obj, function, handlers=None, errmissing=False):
     """Visit a bunch of operations"""
     obj = combine(obj, handlers)
+    table = dispatch_table(obj)
     for op in function.ops:
-        fn = getattr(obj, 'op_' + op.opcode, None)
+        fn = table.get(op.opcode)
         if fn is not None:
             fn(op)
         elif errmissing:
@@ -63,10 +114,11 @@ def vvisit(obj, function, argloader=None, valuemap=None, errmissing=True):
     for arg in function.args:
         valuemap[arg.result] = obj.op_arg(arg)
 
+    table = dispatch_table(obj)
     for block in function.blocks:
         obj.blockswitch(argloader.load_Block(block))
         for op in block.ops:
-            fn = getattr(obj, 'op_' + op.opcode, None)
+            fn = table.get(op.opcode)
             if fn is not None:
                 args = argloader.load_args(op)
                 result = fn(op, *args)
@@ -100,7 +152,7 @@ class ArgLoader(object):
         if op.opcode == 'phi':
             # phis have cycles and values cannot be loaded in a single pass
             return ()
-        return nestedmap(self.load_op, op.args)
+        return ops.map_args(self.load_op, op.opcode, op.args)
 
     def load_Block(self, arg):
         return arg
@@ -145,6 +197,16 @@ class Combinator(object):
                 return getattr(self.visitors[0], attr)
             raise AttributeError(attr)
 
+    def dispatch_table(self):
+        """{ opcode : handler } for the combined visitors"""
+        table = {}
+        if len(self.visitors) == 1:
+            table.update(dispatch_table(self.visitors[0]))
+        for attr, method in self.index.iteritems():
+            if attr.startswith('op_'):
+                table[attr[3:]] = method
+        return table
+
 
 def _build_index(visitors, prefix):
     """Build a method table of method names starting with `prefix`"""
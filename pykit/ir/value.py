@@ -13,7 +13,7 @@ from pykit import error, types
 from pykit.adt import LinkedList
 from pykit.ir import ops
 from pykit.ir.pretty import pretty
-from pykit.utils import (flatten, nestedmap, match, Delegate, traits, listify,
+from pykit.utils import (flatten, match, Delegate, traits, listify,
                          make_temper)
 
 class Value(object):
@@ -88,6 +88,11 @@ class Function(Value):
 
     temp: function, name -> tempname
         allocate a temporary name
+
+    mutations: int
+        Counter bumped on every structural change (ops or blocks added,
+        removed or rewired). Passes compare it before and after running to
+        find out whether they changed anything.
     """
 
     def __init__(self, name, argnames, type, temper=None):
@@ -102,6 +107,7 @@ class Function(Value):
         self.argdict = {}
 
         self.uses = defaultdict(set)
+        self.mutations = 0
 
         # reserve names
         for argname in argnames:
@@ -121,13 +127,16 @@ class Function(Value):
 
     @property
     def ops(self):
-        """Get a flat iterable of all Ops in this function"""
+        """
+        Get a flat iterable of all Ops in this function. Ops are produced
+        lazily, see Block.__iter__ for mutation during iteration.
+        """
         return chain(*self.blocks)
 
     def new_block(self, label, ops=None, after=None):
         """Create a new block with name `label` and append it"""
-        assert label not in self.blockmap, label
         label = self.temp(label)
+        assert label not in self.blockmap, label
         return self.add_block(Block(label, self, ops), after)
 
     def add_block(self, block, after=None):
@@ -138,6 +147,7 @@ class Function(Value):
             assert block.parent is self
 
         self.blockmap[block.name] = block
+        self.mutations += 1
         if after is None:
             self.blocks.append(block)
         else:
@@ -151,6 +161,47 @@ class Function(Value):
     def del_block(self, block):
         self.blocks.remove(block)
         del self.blockmap[block.name]
+        self.mutations += 1
+
+    def merge_blocks(self, pred, succ):
+        """
+        Move all ops of `succ` to the end of `pred` and delete `succ`. Uses
+        are not re-registered, since the ops stay in this function.
+        """
+        self.move_ops(succ, pred)
+        self.del_block(succ)
+
+    def split_block(self, block, op, newblock):
+        """
+        Move the ops following `op` in `block` (all ops if `op` is None)
+        to the start of `newblock`
+        """
+        first = block.ops.head if op is None else op._next
+        if first is not None and first is not block.ops._tail:
+            self.move_ops(block, newblock, first, after=newblock.ops._head)
+
+    def move_ops(self, src, dst, first=None, after=None):
+        """
+        Move ops `first` through the end of block `src` (all ops by default)
+        into block `dst` after op `after` (at the end by default)
+        """
+        if first is None:
+            first = src.ops.head
+            if first is None:
+                return
+
+        count = 0
+        op = first
+        while op is not src.ops._tail:
+            op.parent = dst
+            op = op._next
+            count += 1
+
+        dst.ops.splice(src.ops, first, src.ops._tail._prev, after, count)
+        dst._ordered = False
+        src.mutations += 1
+        dst.mutations += 1
+        self.mutations += 1
 
     def get_arg(self, argname):
         """Get argument as a Value"""
@@ -178,6 +229,9 @@ class Function(Value):
         Does NOT insert the Op in any basic block
         """
         _add_args(self.uses, op, op.args)
+        self.mutations += 1
+        if op.parent is not None:
+            op.parent.mutations += 1
 
     def reset_uses(self):
         from pykit.analysis import defuse
@@ -215,15 +269,24 @@ class Block(Value):
 
         name:   Name of block (unique within function)
         parent: Function owning block
+
+    Ops carry order numbers for O(1) ordering queries (see comes_before).
+    Numbers are assigned lazily: an inserted op takes a number between its
+    neighbours if there is room, otherwise the block is renumbered on the
+    next query.
     """
 
     head, tail = Delegate('ops'), Delegate('ops')
     _prev, _next = None, None # LinkedList
 
+    order_spacing = 16 # Gap between order numbers after renumbering
+
     def __init__(self, name, parent=None, ops=None):
         self.name   = name
         self.parent = parent
         self.ops = LinkedList(ops or [])
+        self.mutations = 0
+        self._ordered = False # whether the order numbers are valid
 
     @property
     def opcodes(self):
@@ -238,14 +301,51 @@ class Block(Value):
             yield op.type
 
     def __iter__(self):
+        """
+        Iterate lazily over the ops. The loop body may delete or replace the
+        current op and insert new ops, but must iterate over a copy
+        (list(block)) to delete ops that have not been visited yet.
+        """
         return iter(self.ops)
 
     def append(self, op):
         """Append op to block"""
         self.ops.append(op)
         op.parent = self
+        self._number_inserted(op)
         self.parent.add_op(op)
 
+    # ______________________________________________________________________
+    # Ordering
+
+    def renumber(self):
+        """Assign order numbers to all ops"""
+        order = 0
+        for op in self.ops:
+            order += self.order_spacing
+            op._order = order
+        self._ordered = True
+
+    def _number_inserted(self, op):
+        """Number a newly inserted op, or invalidate the numbering"""
+        if not self._ordered:
+            return
+
+        lo = 0 if op._prev is self.ops._head else op._prev._order
+        if op._next is self.ops._tail:
+            op._order = lo + self.order_spacing
+        elif op._next._order - lo > 1:
+            op._order = (lo + op._next._order) // 2
+        else:
+            self._ordered = False
+
+    def comes_before(self, a, b):
+        """Return whether op `a` precedes op `b` in this block"""
+        assert a.parent is self and b.parent is self, (a, b)
+        if not self._ordered:
+            self.renumber()
+        return a._order < b._order
+
     def extend(self, ops):
         """Extend block with ops"""
         for op in ops:
@@ -309,7 +409,7 @@ class Local(Value):
                 if op == src:
                     return dst
                 return op
-            newargs = nestedmap(replace, use.args)
+            newargs = ops.map_args(replace, use.opcode, use.args)
             use.set_args(newargs)
 
 
@@ -371,6 +471,7 @@ class Operation(Local):
         self.metadata = None
         self._prev    = None
         self._next    = None
+        self._order   = None # see Block.comes_before
 
     @property
     def uses(self):
@@ -390,6 +491,7 @@ class Operation(Local):
         assert self.parent is None, op
         self.parent = op.parent
         self.parent.ops.insert_before(self, op)
+        self.parent._number_inserted(self)
         self.function.add_op(self)
 
     def insert_after(self, op):
@@ -397,6 +499,7 @@ class Operation(Local):
         assert self.parent is None, self
         self.parent = op.parent
         self.parent.ops.insert_after(self, op)
+        self.parent._number_inserted(self)
         self.function.add_op(self)
 
     # ______________________________________________________________________
@@ -405,8 +508,7 @@ class Operation(Local):
     def replace_op(self, opcode, args, type=None):
         """Replace this operation's opcode, args and optionally type"""
         # Replace ourselves inplace
-        self.opcode = opcode
-        self.set_args(args)
+        self.set_args(args, opcode)
         if type is not None:
             self.type = type
 
@@ -416,7 +518,8 @@ class Operation(Local):
         instructions must dominate this instruction.
         """
         if replacements:
-            newargs = nestedmap(lambda arg: replacements.get(arg, arg), self.args)
+            newargs = ops.map_args(lambda arg: replacements.get(arg, arg),
+                                   self.opcode, self.args)
             self.set_args(newargs)
 
     @match
@@ -465,11 +568,16 @@ class Operation(Local):
 
     # ______________________________________________________________________
 
-    def set_args(self, args):
-        """Set a new argslist"""
-        _del_args(self.function.uses, self, self.args)
-        _add_args(self.function.uses, self, args)
+    def set_args(self, args, opcode=None):
+        """Set a new argslist, and optionally a new opcode"""
+        func = self.function
+        _del_args(func.uses, self, self.args)
+        if opcode is not None:
+            self.opcode = opcode
+        _add_args(func.uses, self, args)
         self._args = args
+        func.mutations += 1
+        self.parent.mutations += 1
 
     # ______________________________________________________________________
 
@@ -486,6 +594,8 @@ class Operation(Local):
     def unlink(self):
         """Unlink from the basic block"""
         self.parent.ops.remove(self)
+        self.parent.mutations += 1
+        self.parent.parent.mutations += 1
         self.parent = None
 
     # ______________________________________________________________________
@@ -505,6 +615,10 @@ class Operation(Local):
         """Containing block"""
         return self.parent
 
+    def comes_before(self, other):
+        """Return whether this op precedes `other` in the same block"""
+        return self.parent.comes_before(self, other)
+
     @property
     def operands(self):
         """
@@ -516,7 +630,7 @@ class Operation(Local):
         """
         non_constants = (Block, Operation, FuncArg, GlobalValue)
         result = lambda x: x.result if isinstance(x, non_constants) else x
-        return nestedmap(result, self.args)
+        return ops.map_args(result, self.opcode, self.args)
 
     @property
     def symbols(self):
@@ -547,19 +661,17 @@ class Operation(Local):
 
 def _add_args(uses, newop, args):
     "Update uses when a new instruction is inserted"
-    def add(arg):
+    for arg in ops.flat_args(newop.opcode, args):
         if isinstance(arg, (Op, FuncArg, Block)):
             uses[arg].add(newop)
-    nestedmap(add, args)
 
 def _del_args(uses, oldop, args):
     "Delete uses when an instruction is removed"
     seen = set() # Guard against duplicates in 'args'
-    def remove(arg):
+    for arg in ops.flat_args(oldop.opcode, args):
         if isinstance(arg, Operation) and arg not in seen:
             uses[arg].remove(oldop)
             seen.add(arg)
-    nestedmap(remove, args)
 
 
 class Constant(Value):
@@ -2,16 +2,31 @@
 
 """
 Verify the validity of pykit IR.
+
+The amount of checking is set by config.verify_level:
+
+    "off":   no verification
+    "cheap": structural checks: op syntax, unique names and return types
+    "full":  additionally checks block order, def-use chains and semantics
+
+Function verification is incremental: blocks that have not been mutated
+since the last successful verification of the function (see
+Block.mutations) are not checked again. Register names of changed blocks
+are checked against the names recorded at that verification. Changing the
+signature of a function (func.type) verifies all of its blocks again.
 """
 
 from __future__ import print_function, division, absolute_import
+import weakref
 import functools
 
 from pykit.types import (Boolean, Integral, Real, Struct, Pointer, Function,
                          VoidT, resolve_typedef)
-from pykit.ir import Module, Function, Block, Value, Operation, Constant
+from pykit.ir import (Module, Function, Block, Value, Operation, Constant,
+                      FuncArg)
 from pykit.ir import ops, visit, findallops, combine
 from pykit.utils import match
+from pykit.configuration import config
 
 #===------------------------------------------------------------------===
 # Utils
@@ -28,6 +43,76 @@ def unique(items):
             raise VerifyError("Item not unique", item)
         seen.add(item)
 
+#===------------------------------------------------------------------===
+# Verification levels
+#===------------------------------------------------------------------===
+
+OFF, CHEAP, FULL = range(3)
+
+levels = {
+    "off":      OFF,
+    "cheap":    CHEAP,
+    "full":     FULL,
+}
+
+def verify_level(level=None):
+    """Return the numeric verification level (defaults to the config)"""
+    if level is None:
+        level = config.verify_level
+    if isinstance(level, basestring):
+        level = levels[level]
+    return level
+
+class VerifyState(object):
+    """
+    Summary of a function at its last successful verification.
+
+        level:      level at which the function was verified
+        signature:  func.type at verification
+        order:      [block] in function order
+        blocks:     { block : block.mutations }
+        succs:      { block : [successor block] }, to detect CFG changes
+        rets:       set of blocks containing a 'ret'
+        results:    { block : [op result name] }
+        owners:     { op result name : block }
+    """
+
+    def __init__(self, level, signature, order, blocks, succs, rets,
+                 results, owners):
+        self.level = level
+        self.signature = signature
+        self.order = order
+        self.blocks = blocks
+        self.succs = succs
+        self.rets = rets
+        self.results = results
+        self.owners = owners
+
+# { Function : VerifyState }
+_verified = weakref.WeakKeyDictionary()
+
+def invalidate(func):
+    """Forget previous verification of `func`, forcing a full re-check"""
+    _verified.pop(func, None)
+
+def changed_blocks(func, level):
+    """
+    Return the blocks of `func` mutated since the last verification at
+    `level` or higher, and the state of that verification (or None).
+    """
+    state = _verified.get(func)
+    if (state is None or state.level < level or
+            state.signature is not func.type):
+        return list(func.blocks), None
+    return [block for block in func.blocks
+                      if state.blocks.get(block) != block.mutations], state
+
+def successors(block):
+    """Successor blocks of `block`, including exception handlers"""
+    # NOTE: verify should be importable from any pass!
+    from pykit.analysis import regalloc
+    return regalloc.successors(block)
+
 #===------------------------------------------------------------------===
 # Entry points
 #===------------------------------------------------------------------===
@@ -37,7 +122,7 @@ def verify(value, env=None):
     if isinstance(value, Module):
         verify_module(value)
     if isinstance(value, Function):
-        verify_function(value)
+        verify_function(value, env=env)
     elif isinstance(value, Block):
         verify_operations(value)
     elif isinstance(value, Operation):
@@ -52,8 +137,9 @@ def op_verifier(func):
         op = func(*a, **kw)
         if not isinstance(op, list):
             op = [op]
-        for op in op:
-            verify_op_syntax(op)
+        if verify_level() > OFF:
+            for op in op:
+                verify_op_syntax(op)
         return op
 
     return wrapper
@@ -68,31 +154,89 @@ def verify_module(mod):
     for function in mod.functions.itervalues():
         verify_function(function)
 
-def verify_function(func):
-    """Verify a pykit function"""
+def verify_function(func, level=None, env=None):
+    """
+    Verify a pykit function. Only blocks that changed since the last
+    successful verification are checked again.
+    """
+    level = verify_level(level)
+    if level == OFF:
+        return
+
+    changed, state = changed_blocks(func, level)
+    order = list(func.blocks)
+    if state is not None and not changed and order == state.order:
+        return # Nothing changed
+
+    # The state is updated in place and recorded again on success
+    invalidate(func)
+
     # Verify arguments
     assert len(func.args) == len(func.type.argtypes)
 
     # Verify return presence and type
+    rets = set(block for block in func.blocks
+                         if state is not None and block in state.rets)
+    rets.difference_update(changed)
     restype = func.type.restype
-    if not restype.is_void:
-        rets = findallops(func, 'ret')
-        assert rets
-        for ret in rets:
-            arg, = ret.args
-            assert arg.type == restype, (arg.type, restype)
-
-    verify_uniqueness(func)
-    verify_block_order(func)
-    verify_operations(func)
-    verify_uses(func)
-    verify_semantics(func)
-
-def verify_uniqueness(func):
-    """Verify uniqueness of register names and labels"""
+    for block in changed:
+        for op in block.ops:
+            if op.opcode == 'ret':
+                rets.add(block)
+                if not restype.is_void:
+                    arg, = op.args
+                    assert arg.type == restype, (arg.type, restype)
+    assert rets or restype.is_void
+
+    results, owners = verify_uniqueness(func, changed, state)
+    for block in changed:
+        verify_operations(block)
+
+    succs = dict((block, state.succs[block]) for block in func.blocks
+                     if state is not None and block not in changed)
+    if level >= FULL:
+        for block in changed:
+            succs[block] = successors(block)
+        if state is None or order != state.order or succs != state.succs:
+            verify_block_order(func)
+        verify_uses(func, changed)
+        for block in changed:
+            verify_semantics(block, env)
+
+    blocks = dict((block, block.mutations) for block in func.blocks)
+    _verified[func] = VerifyState(level, func.type, order, blocks, succs,
+                                  rets, results, owners)
+
+def verify_uniqueness(func, changed=None, state=None):
+    """
+    Verify uniqueness of register names and labels. Given the state of a
+    previous verification, only the names in the `changed` blocks are
+    checked, against the names of the other blocks recorded in the state
+    (which is updated). Returns the ({ block : [name] }, { name : block })
+    of the function.
+    """
     unique(block.name for block in func.blocks)
-    unique(op for block in func.blocks for op in block)
-    unique(op.result for block in func.blocks for op in block)
+    if state is None:
+        changed = func.blocks
+        results, owners = {}, {}
+    else:
+        results, owners = state.results, state.owners
+        current, stale = set(func.blocks), set(changed)
+        for block in [block for block in results
+                                if block not in current or block in stale]:
+            for name in results.pop(block):
+                del owners[name]
+
+    unique(op for block in changed for op in block)
+    for block in changed:
+        names = [op.result for op in block]
+        for name in names:
+            if name in owners:
+                raise VerifyError("Item not unique", name)
+            owners[name] = block
+        results[block] = names
+
+    return results, owners
 
 def verify_block_order(func):
     """Verify block order according to dominator tree"""
@@ -103,11 +247,11 @@ def verify_block_order(func):
 
     visited = set()
     for block in func.blocks:
-        visited.add(block.name)
-        for dominator in dominators[block.name]:
+        visited.add(block)
+        for dominator in dominators[block]:
             if dominator not in visited:
                 raise VerifyError("Dominator %s does not precede block %s" % (
-                                                        dominator, block.name))
+                                                dominator.name, block.name))
 
 def verify_operations(func_or_block):
     """Verify all operations in the function or block"""
@@ -124,31 +268,65 @@ def verify_op_syntax(op):
     """
     Verify the syntactic structure of the Op (arity, List/Value/Const, etc)
     """
-    syntax = ops.op_syntax[op.opcode]
+    validators[op.opcode](op)
+
+# ______________________________________________________________________
+# Syntax validators, generated from ops.op_syntax
+
+checks = {
+    ops.List:   "isinstance(%s, list)",
+    ops.Const:  "isinstance(%s, Constant)",
+    ops.Value:  "isinstance(%s, Value)",
+    ops.Any:    "isinstance(%s, (Value, list))",
+    ops.Obj:    None,
+}
+
+def make_validator(opcode, syntax):
+    """
+    Generate a function verifying the arguments of an `opcode` Op against
+    `syntax`, e.g. for [List, Value, Star]:
+
+        def verify_opcode(op):
+            args = op.args
+            assert len(args) >= 2, (op, syntax)
+            assert isinstance(args[0], list), (op, args[0])
+            assert isinstance(args[1], Value), (op, args[1])
+    """
     vararg = syntax and syntax[-1] == ops.Star
-    args = op.args
     if vararg:
         syntax = syntax[:-1]
-        args = args[:len(syntax)]
-
-    assert len(syntax) == len(args), (op, syntax)
-    for arg, expected in zip(args, syntax):
-        msg = (op, arg)
-        if expected == ops.List:
-            assert isinstance(arg, list), msg
-        elif expected == ops.Const:
-            assert isinstance(arg, Constant), msg
-        elif expected == ops.Value:
-            assert isinstance(arg, Value), msg
-        elif expected == ops.Any:
-            assert isinstance(arg, (Value, list)), msg
-        elif expected == ops.Obj:
-            pass
-        else:
-            raise ValueError("Invalid meta-syntax?", msg, expected)
-
-def verify_uses(func):
-    """Verify the def-use chains"""
+
+    lines = ["def verify_%s(op):" % (opcode,),
+             "    args = op.args",
+             "    assert len(args) %s %d, (op, syntax)" % (
+                                    ">=" if vararg else "==", len(syntax))]
+    for i, expected in enumerate(syntax):
+        if expected not in checks:
+            raise ValueError("Invalid meta-syntax?", opcode, expected)
+        if checks[expected] is not None:
+            arg = "args[%d]" % i
+            lines.append("    assert %s, (op, %s)" % (
+                                    checks[expected] % arg, arg))
+
+    namespace = { 'syntax': syntax, 'Constant': Constant, 'Value': Value }
+    exec("\n".join(lines), namespace)
+    return namespace["verify_" + opcode]
+
+validators = dict((opcode, make_validator(opcode, syntax))
+                      for opcode, syntax in ops.op_syntax.iteritems())
+
+def verify_uses(func, blocks=None):
+    """
+    Verify the def-use chains, for the operations in `blocks` if given
+    """
+    if blocks is not None:
+        for block in blocks:
+            for op in block.ops:
+                for arg in ops.flat_args(op.opcode, op.args):
+                    if isinstance(arg, (Operation, FuncArg, Block)):
+                        assert op in func.uses.get(arg, ()), (op, arg)
+        return
+
     # NOTE: verify should be importable from any pass!
     from pykit.analysis import defuse
     uses = defuse.defuse(func)
@@ -162,6 +340,7 @@ class Verifier(object):
     """Semantic verification of all operations"""
 
 def verify_semantics(func, env=None):
+    """Verify the semantics of all operations in the function or block"""
     verifier = combine(Verifier(), env and env.get("verify.handlers"))
     visit(verifier, func)
 
@@ -2,10 +2,25 @@
 
 """
 Lower exception-related instructions.
+
+Two exception models are supported, selected through env["exceptions.model"]:
+
+    costful:    Check the result of every call for a bad value and branch
+                to the exception handlers, or return to propagate
+    zerocost:   Table-driven unwinding. Calls to pykit functions, which
+                raise by unwinding, are not checked at all. Instead they are
+                annotated with the handlers to unwind to ("exc.unwind"),
+                forming an invoke with landing pads. Only bad values
+                returned by external functions are checked, and turned into
+                a raise of the thread-local exception (load_tl_exc).
+
+The interpreter unwinds through a call to the handlers in its "exc.unwind"
+metadata. The LLVM backend supports only the costful model, and raises a
+CompileError for zerocost-lowered functions.
 """
 
 from pykit import types
-from pykit.ir import visit, FunctionPass
+from pykit.ir import visit, findop, Function, FunctionPass
 
 class LowerExceptionChecksCostful(FunctionPass):
     """
@@ -24,9 +39,66 @@ class LowerExceptionChecksCostful(FunctionPass):
 
         op.delete()
 
+class LowerExceptionChecksZeroCost(FunctionPass):
+    """
+    Lower exception checks (check_error) for table-driven unwinding:
+
+        result = call(f, args)      # exc.unwind: [handler blocks]
+
+    for pykit functions, and
+
+        if (result == bad)
+            raise load_tl_exc();
+
+    for external functions.
+    """
+
+    def __init__(self, func):
+        super(LowerExceptionChecksZeroCost, self).__init__(func)
+        # Raising splits blocks, so find the handlers of each check up front
+        self.handlers = {}
+        for block in func.blocks:
+            exc_setup = findop(block.leaders, 'exc_setup')
+            handlers = list(exc_setup.args[0]) if exc_setup else []
+            for op in block.ops:
+                if op.opcode == 'check_error':
+                    self.handlers[op] = handlers
+
+    def op_check_error(self, op):
+        result, badval = op.args
+        handlers = self.handlers[op]
+        if (result.opcode == 'call' and
+                isinstance(result.args[0], Function)):
+            result.add_metadata({"exc.unwind": handlers})
+        else:
+            self.builder.position_after(op)
+            cond = self.builder.eq(types.Bool, [result, badval])
+            with self.builder.if_(cond):
+                if handlers:
+                    self.builder.exc_setup(handlers)
+                exc = self.builder.load_tl_exc(types.Exception)
+                self.builder.exc_throw(exc)
+
+            if handlers:
+                # Code after the check still unwinds to the handlers
+                exit = op.block.terminator.args[2]
+                with self.builder.at_front(exit):
+                    self.builder.exc_setup(handlers)
+
+        op.delete()
+
 def lower_costful(func, env=None):
     visit(LowerExceptionChecksCostful(func), func)
 
+def lower_zerocost(func, env=None):
+    visit(LowerExceptionChecksZeroCost(func), func)
+
+exception_models = {
+    "costful":  lower_costful,
+    "zerocost": lower_zerocost,
+}
+
 def run(func, env):
-    """Generate runtime calls into thread library"""
-    lower_costful(func)
\ No newline at end of file
+    """Lower exception checks according to the exception model"""
+    model = env.get("exceptions.model", "costful") if env else "costful"
+    exception_models[model](func, env)
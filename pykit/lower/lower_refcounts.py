@@ -0,0 +1,181 @@
+# -*- coding: utf-8 -*-
+
+"""
+Insert reference counting operations for values of managed types
+(types.Type(..., managed=True)). Every managed value owns one reference
+for as long as it is live:
+
+    - Constructors (new_list, new_tuple, ...) and calls return new
+      references, which are acquired with gc_gotref
+    - Other operations return borrowed references, which are acquired
+      with gc_incref
+    - Function arguments are borrowed from the caller and are not released
+    - References are released with gc_decref after the last use of a value,
+      or on the CFG edges where the value stops being live
+    - Phis take over the references of their incoming values, and ret
+      hands its reference to the caller
+
+This runs on SSA form. Incoming constants of phis are not reference counted,
+and references that are live when an exception propagates are not released.
+Redundant pairs are removed by pykit.transform.refcounts.
+"""
+
+from __future__ import print_function, division, absolute_import
+from collections import defaultdict
+
+from pykit import types
+from pykit.ir import ops, Op, FuncArg, Builder
+from pykit.analysis import regalloc
+
+new_references = frozenset([
+    ops.new_list, ops.new_tuple, ops.new_dict, ops.new_set, ops.new_struct,
+    ops.new_data, ops.new_exc, ops.call,
+])
+
+def is_managed(value):
+    return regalloc.is_local(value) and value.type.managed
+
+def refop(func, opcode, value):
+    return Op(opcode, types.Void, [value], func.temp())
+
+class EdgePositions(object):
+    """
+    Insert operations on CFG edges, splitting critical edges when needed
+    """
+
+    def __init__(self, func, succs):
+        self.func = func
+        self.succs = succs
+        self.preds = defaultdict(list)
+        for block, targets in succs.items():
+            for target in targets:
+                self.preds[target].append(block)
+        self.split = {} # { (pred, succ) : edge block }
+
+    def insert(self, pred, succ, op):
+        """Insert `op` on the edge from `pred` to `succ`"""
+        if len(self.succs[pred]) == 1:
+            op.insert_before(pred.terminator)
+        elif len(self.preds[succ]) == 1:
+            insert_at_start(succ, op)
+        else:
+            block = self.split_edge(pred, succ)
+            op.insert_before(block.terminator)
+
+    def split_edge(self, pred, succ):
+        if (pred, succ) not in self.split:
+            b = Builder(self.func)
+            block = self.func.new_block('edge', after=pred)
+            b.position_at_end(block)
+            b.jump(succ)
+            pred.terminator.replace_args({succ: block})
+            for phi in succ.leaders:
+                if phi.opcode == 'phi':
+                    preds, values = phi.args
+                    phi.set_args([[block if p is pred else p for p in preds],
+                                  values])
+            self.split[pred, succ] = block
+        return self.split[pred, succ]
+
+def insert_at_start(block, op):
+    """Insert `op` after the leaders of `block`"""
+    leaders = block.leaders
+    if leaders:
+        op.insert_after(leaders[-1])
+    else:
+        op.insert_before(block.head)
+
+def insert_refcounts(func):
+    """Insert refcount operations for all managed values in `func`"""
+    values = [op for op in func.ops if is_managed(op)]
+    if not values and not any(is_managed(arg) for arg in func.args):
+        return
+
+    live_in, live_out = regalloc.liveness(func)
+    succs = dict((block, regalloc.successors(block)) for block in func.blocks)
+    blocks = list(func.blocks)
+    edges = EdgePositions(func, succs)
+
+    # Figure out where references are released before changing anything
+    consumed = set() # { (pred, succ, value) } consumed by phis
+    returned = set() # { (block, value) } returned to the caller
+    increfs_before = [] # [(op, value)]
+    increfs_on_edge = [] # [(pred, succ, value)]
+
+    for block in blocks:
+        for op in block.leaders:
+            if op.opcode != 'phi' or not is_managed(op):
+                continue
+            for pred, value in zip(*op.args):
+                if not is_managed(value):
+                    continue
+                if (isinstance(value, FuncArg) or value in live_in[block] or
+                        (pred, block, value) in consumed):
+                    # The value keeps its reference, the phi needs a new one
+                    increfs_on_edge.append((pred, block, value))
+                consumed.add((pred, block, value))
+
+        ret = block.terminator
+        if ret.opcode == 'ret' and is_managed(ret.args[0]):
+            if isinstance(ret.args[0], FuncArg):
+                increfs_before.append((ret, ret.args[0]))
+            returned.add((block, ret.args[0]))
+
+    releases_after = [] # [(op, value)]
+    releases_before = [] # [(op, value)]
+    releases_on_edge = [] # [(pred, succ, value)]
+
+    for block in blocks:
+        last_use = {}
+        for op in block:
+            if op.opcode != 'phi':
+                for arg in ops.flat_args(op.opcode, op.args):
+                    if is_managed(arg):
+                        last_use[arg] = op
+
+        for value in values:
+            if value.block is not block and value not in live_in[block]:
+                continue
+            if value in live_out[block]:
+                for succ in succs[block]:
+                    if (value not in live_in[succ] and
+                            (block, succ, value) not in consumed):
+                        releases_on_edge.append((block, succ, value))
+            elif (block, value) not in returned:
+                op = last_use.get(value, value)
+                if ops.is_terminator(op.opcode):
+                    releases_before.append((op, value))
+                else:
+                    releases_after.append((op, value))
+
+    # Acquire references
+    acquired = {}
+    for value in values:
+        if value.opcode == 'phi':
+            continue
+        if value.opcode in new_references:
+            op = refop(func, ops.gc_gotref, value)
+        else:
+            op = refop(func, ops.gc_incref, value)
+        op.insert_after(value)
+        acquired[value] = op
+
+    for op, value in increfs_before:
+        refop(func, ops.gc_incref, value).insert_before(op)
+    for pred, succ, value in increfs_on_edge:
+        edges.insert(pred, succ, refop(func, ops.gc_incref, value))
+
+    # Release references
+    for op, value in releases_after:
+        decref = refop(func, ops.gc_decref, value)
+        if op.opcode == 'phi':
+            insert_at_start(op.block, decref)
+        else:
+            decref.insert_after(acquired.get(op, op))
+    for op, value in releases_before:
+        refop(func, ops.gc_decref, value).insert_before(op)
+    for pred, succ, value in releases_on_edge:
+        edges.insert(pred, succ, refop(func, ops.gc_decref, value))
+
+def run(func, env=None):
+    insert_refcounts(func)
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 from __future__ import print_function, division, absolute_import
 from pykit.tests import *
+from pykit.ir import interp
 from pykit.lower import lower_errcheck
 
 class TestExcCheckLowering(SourceTestCase):
@@ -18,4 +19,81 @@ class TestExcCheckLowering(SourceTestCase):
         lower_errcheck.lower_costful(self.f)
         self.eq(findop(self.f, 'ret').args[0], Undef(types.Float32))
         self.eq(opcodes(self.f)[:3], ['eq', 'cbranch', 'ret'])
-        assert not findop(self.f, 'check_error')
\ No newline at end of file
+        assert not findop(self.f, 'check_error')
+
+class TestZeroCostLowering(unittest.TestCase):
+
+    def setUp(self):
+        signature = types.Function(types.Int32, [types.Int32])
+        self.callee = Function("callee", ["x"], signature)
+        b = Builder(self.callee)
+        b.position_at_end(self.callee.new_block("entry"))
+        b.ret(self.callee.args[0])
+
+        self.f = Function("f", ["x"], signature)
+        self.b = Builder(self.f)
+        self.b.position_at_end(self.f.new_block("entry"))
+
+    def checked_call(self, callee):
+        call = self.b.call(types.Int32, [callee, self.f.args])
+        self.b.check_error(call, Const(-1, types.Int32))
+        self.b.ret(call)
+        return call
+
+    def test_pykit_call(self):
+        call = self.checked_call(self.callee)
+        lower_errcheck.run(self.f, {"exceptions.model": "zerocost"})
+        self.assertEqual(opcodes(self.f), ['call', 'ret'])
+        self.assertEqual(call.metadata["exc.unwind"], [])
+        self.assertEqual(interp.run(self.f, args=[3]), 3)
+
+    def test_pykit_call_handlers(self):
+        handler = self.f.new_block("handler")
+        self.b.exc_setup([handler])
+        call = self.checked_call(self.callee)
+        with self.b.at_end(handler):
+            self.b.exc_catch([Const(Exception, types.Exception)])
+            self.b.ret(Const(0, types.Int32))
+
+        lower_errcheck.lower_zerocost(self.f)
+        self.assertEqual(call.metadata["exc.unwind"], [handler])
+
+    def test_unwind(self):
+        raiser = Function("raiser", ["x"], self.callee.type)
+        b = Builder(raiser)
+        b.position_at_end(raiser.new_block("entry"))
+        b.exc_throw(Const(TypeError(), types.Exception))
+
+        handler = self.f.new_block("handler")
+        self.b.exc_setup([handler])
+        call = self.checked_call(raiser)
+        with self.b.at_end(handler):
+            self.b.exc_catch([Const(Exception, types.Exception)])
+            self.b.ret(Const(0, types.Int32))
+
+        lower_errcheck.lower_zerocost(self.f)
+        self.assertEqual(interp.run(self.f, args=[3]), 0)
+
+        # Unwinding follows the handlers of the call
+        call.metadata["exc.unwind"] = []
+        self.assertRaises(interp.UncaughtException, interp.run, self.f,
+                          args=[3])
+
+    def test_external_raise(self):
+        handler = self.f.new_block("handler")
+        self.b.exc_setup([handler])
+        self.b.store_tl_exc(Const(TypeError(), types.Exception))
+        self.checked_call(Const(lambda x: x - 1, types.Opaque))
+        with self.b.at_end(handler):
+            self.b.exc_catch([Const(TypeError, types.Exception)])
+            self.b.ret(Const(-2, types.Int32))
+
+        lower_errcheck.lower_zerocost(self.f)
+        self.assertEqual(interp.run(self.f, args=[3]), 2)
+        self.assertEqual(interp.run(self.f, args=[0]), -2)
+
+    def test_external_call(self):
+        self.checked_call(Const("external", types.Opaque))
+        lower_errcheck.lower_zerocost(self.f)
+        self.assertEqual(opcodes(self.f), ['call', 'eq', 'cbranch',
+                                           'load_tl_exc', 'exc_throw', 'ret'])
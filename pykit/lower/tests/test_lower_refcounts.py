@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+from __future__ import print_function, division, absolute_import
+
+import unittest
+
+from pykit import types
+from pykit.ir import Const, interp, opcodes, verify
+from pykit.lower import lower_refcounts
+from pykit.tests import make_function
+
+ManagedList = types.List(types.Int32, -1, managed=True)
+
+def diamond(borrow):
+    """
+    Return a new list, or a list created before branching (or the argument
+    if `borrow` is set) through a phi
+    """
+    f, b = make_function([ManagedList, types.Int32], ManagedList,
+                         name="diamond", argnames=["lst", "flag"])
+    then, else_, exit = [f.new_block(name)
+                         for name in ("then", "else", "exit")]
+    if borrow:
+        value = f.get_arg("lst")
+    else:
+        value = b.new_list(ManagedList, [[]])
+    test = b.gt(types.Bool, [f.get_arg("flag"), Const(0, types.Int32)])
+    b.cbranch(test, then, else_)
+
+    b.position_at_end(then)
+    new = b.new_list(ManagedList, [[]])
+    b.jump(exit)
+
+    b.position_at_end(else_)
+    b.jump(exit)
+
+    b.position_at_end(exit)
+    phi = b.phi(ManagedList, [[then, else_], [new, value]])
+    b.ret(phi)
+    return f
+
+def run(f, *args):
+    counts = interp.Refcounts()
+    result = interp.run(f, args=[[1]] + list(args), refcounts=counts)
+    return result, counts.leaks()
+
+class TestRefcountLowering(unittest.TestCase):
+
+    def test_owned(self):
+        f = diamond(borrow=False)
+        lower_refcounts.run(f)
+        verify(f)
+        self.assertEqual(opcodes(f.get_block("entry"))[:2],
+                         ['new_list', 'gc_gotref'])
+        # The list created before branching dies on the edge to 'then'
+        self.assertEqual(opcodes(f.get_block("then"))[0], 'gc_decref')
+        self.assertEqual(run(f, 1), ([], []))
+        self.assertEqual(run(f, 0), ([], []))
+
+    def test_borrowed(self):
+        f = diamond(borrow=True)
+        lower_refcounts.run(f)
+        verify(f)
+        # The phi takes a new reference to the argument
+        self.assertEqual(opcodes(f.get_block("else")), ['gc_incref', 'jump'])
+        self.assertEqual(run(f, 1), ([], []))
+        self.assertEqual(run(f, 0), ([1], []))
+
+    def test_unused(self):
+        f, b = make_function([ManagedList])
+        b.new_list(ManagedList, [[]])
+        b.ret(Const(0, types.Int32))
+        lower_refcounts.run(f)
+        self.assertEqual(opcodes(f),
+                         ['new_list', 'gc_gotref', 'gc_decref', 'ret'])
+        self.assertEqual(run(f), (0, []))
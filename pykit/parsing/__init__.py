@@ -1 +1,12 @@
-from .cirparser import from_c
+# -*- coding: utf-8 -*-
+from __future__ import print_function, division, absolute_import
+
+def from_c(source, filename="<string>", system_cpp=False):
+    """Parse pykit IR in the form of C, see pykit.parsing.cirparser.from_c"""
+    from pykit.parsing import cirparser
+    return cirparser.from_c(source, filename, system_cpp)
+
+def from_pretty(text):
+    """Parse pretty-printed pykit IR, see pykit.parsing.irparser.parse"""
+    from pykit.parsing import irparser
+    return irparser.parse(text)
@@ -6,8 +6,9 @@ Parse pykit IR in the form of C.
 
 from __future__ import print_function, division, absolute_import
 
+import os
 from io import StringIO
-from os.path import dirname, abspath, join
+from os.path import dirname, abspath, join, exists
 import tempfile
 import json
 import tokenize
@@ -16,11 +17,15 @@ from collections import defaultdict, namedtuple
 
 from pykit import types
 from pykit.ir import defs, Module, Function, Builder, Const, GlobalValue, ops
+from pykit.utils import cached
+from pykit.parsing import preprocessor
 
+from pykit.deps import pycparser
 from pykit.deps.pycparser import preprocess_file, c_ast, CParser
 
 root = dirname(abspath(__file__))
 ir_root = join(dirname(root), 'ir')
+tab_root = dirname(abspath(pycparser.__file__))
 
 #===------------------------------------------------------------------===
 # Metadata and comment preprocessing
@@ -145,7 +150,6 @@ class PykitIRVisitor(c_ast.NodeVisitor):
 
     def leave_func(self):
         self.in_function = False
-        self.mod.add_function(self.func)
         self.local_vars = None
         self.allocas = None
         self.func = None
@@ -274,6 +278,7 @@ class PykitIRVisitor(c_ast.NodeVisitor):
         else:
             argnames = []
         self.func = Function(name, argnames, type)
+        self.mod.add_function(self.func) # visible to recursive calls
         self.func.new_block('entry')
         self.builder = Builder(self.func)
         self.builder.position_at_end(self.func.startblock)
@@ -420,25 +425,80 @@ class PykitIRVisitor(c_ast.NodeVisitor):
 
 debug_args = dict(lex_optimize=False, yacc_optimize=False, yacc_debug=True)
 
-def parse(source, filename):
-    return CParser().parse(source, filename)
+# Lexer and parser tables are pre-generated and shipped in pykit.deps.pycparser
+# (see build_tables()). PLY checks the table version when loading them, and
+# rebuilds them into tab_root if they were written by an incompatible PLY.
+table_args = dict(lex_optimize=True,  lextab='pykit.deps.pycparser.lextab',
+                  yacc_optimize=True, yacctab='pykit.deps.pycparser.yacctab',
+                  taboutputdir=tab_root)
 
-def from_c(source, filename="<string>"):
-    # TODO: process metadata
-    # metadata = preprocess(source)
+@cached
+def get_parser():
+    """Return the CParser shared by all parse() calls"""
+    return CParser(**table_args)
 
-    # Preprocess...
+def build_tables():
+    """
+    Regenerate the lexer and parser tables. This needs to be done after
+    changing the pycparser grammar:
+
+        $ python -m pykit.parsing.cirparser
+    """
+    for tabname in ('lextab', 'yacctab'):
+        for ext in ('.py', '.pyc'):
+            fn = join(tab_root, tabname + ext)
+            if exists(fn):
+                os.remove(fn)
+
+    CParser(**dict(table_args, yacc_optimize=False))
+    strip_paths(join(tab_root, 'yacctab.py'))
+
+def strip_paths(fn):
+    """
+    Remove the absolute paths PLY writes into the parser table, so the
+    shipped table does not depend on the machine it was built on
+    """
+    with open(fn) as f:
+        table = f.read()
+    table = table.replace(tab_root + os.sep, '')
+    with open(fn, 'w') as f:
+        f.write(table)
+
+def parse(source, filename):
+    return get_parser().parse(source, filename)
+
+def preprocess_system_cpp(source):
+    """Preprocess source with the system C preprocessor"""
     f = tempfile.NamedTemporaryFile('w+t')
     try:
         f.write(source)
         f.flush()
-        source = preprocess_file(f.name, cpp_args=['-I' + ir_root])
+        return preprocess_file(f.name, cpp_args=['-I' + ir_root])
     finally:
         f.close()
 
+def from_c(source, filename="<string>", system_cpp=False):
+    """
+    Parse pykit IR in the form of C into a Module.
+
+    :param system_cpp: use the system C preprocessor instead of
+                       pykit.parsing.preprocessor
+    """
+    # TODO: process metadata
+    # metadata = preprocess(source)
+
+    # Preprocess...
+    if system_cpp:
+        source = preprocess_system_cpp(source)
+    else:
+        source = preprocessor.preprocess(source, filename, [ir_root])
+
     # Parse
     ast = parse(source, filename)
     # ast.show()
     visitor = PykitIRVisitor(dict(type_env))
     visitor.visit(ast)
     return visitor.mod
+
+if __name__ == '__main__':
+    build_tables()
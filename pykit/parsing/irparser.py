@@ -0,0 +1,367 @@
+# -*- coding: utf-8 -*-
+
+"""
+Parse pykit IR in the textual form produced by pykit.ir.pretty:
+
+    global %g = Int32
+
+    function Int32 f(Int32 %a, Int32 %b) {
+    entry:
+        %0 = (Int32) add(%a, %b)
+        %1 = (Bool) lt(%0, const(Int32, 10))
+        %2 = (Void) cbranch(%1, %then, %exit)
+    ...
+        %5 = (Int32) call(%g, [%0]) !{'exc.unwind': [%handler]}
+    ...
+    }
+
+Op metadata follows the operands after a '!'. Exception classes and
+instances are written by name, e.g. const(Exception, TypeError) and
+TypeError('message'), and are looked up among the builtin exceptions.
+
+This is a hand-written, line-oriented parser: op lines are split by a single
+regular expression and only types and operands are tokenized. Parsed types
+are cached, since the same few types appear over and over. Names referring
+to ops, blocks, arguments, functions and globals are resolved after the
+whole module has been read, so forward references (phis, branches, calls)
+are fine.
+
+    parse(text) -> Module
+    parse_function(text, module=None) -> Function
+    parse_type(text) -> Type
+
+The result pretty-prints to the same text: pretty(parse(pretty(mod))).
+"""
+
+from __future__ import print_function, division, absolute_import
+
+import re
+import ast
+try:
+    import exceptions
+except ImportError:
+    import builtins as exceptions
+
+from pykit import types
+from pykit.ir import Module, Function, GlobalValue, Block, Operation, Const
+from pykit.ir import Undef
+
+#===------------------------------------------------------------------===
+# Lexical structure
+#===------------------------------------------------------------------===
+
+_line = re.compile(r"""\s*(?:
+      %(?P<result>[\w.]+)\ =\ \((?P<type>.+?)\)\ (?P<opcode>\w+)\((?P<args>.*?)\)
+      (?:\ !(?P<metadata>\{.*\}))?
+    | (?P<label>[\w.]+):
+    | global\ %(?P<gname>[\w.]+)\ =\ (?P<gtype>.+)
+    | function\ (?P<restype>.+?)\ (?P<fname>[\w.]+)\((?P<params>.*)\)\ \{
+    | (?P<end>\})
+    )\s*$""", re.VERBOSE)
+
+_tokens = re.compile(r"""\s*(?:
+      (?P<name>%[\w.]+)
+    | (?P<string>[uUbB]?[rR]?(?:'(?:\\.|[^'\\])*'|"(?:\\.|[^"\\])*"))
+    | (?P<number>-?(?:inf\b|(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?[lLjJ]?))
+    | (?P<ident>[A-Za-z_]\w*)
+    | (?P<punct>[()\[\]{},=:])
+    )""", re.VERBOSE)
+
+class Name(str):
+    """An unresolved %name operand"""
+
+def error(lineno, msg):
+    raise SyntaxError("line %s: %s" % (lineno, msg))
+
+def tokenize(text, lineno=None):
+    """Tokenize `text` into a list of (kind, value) pairs"""
+    result = []
+    pos, end = 0, len(text.rstrip())
+    while pos < end:
+        m = _tokens.match(text, pos)
+        if m is None:
+            error(lineno, "Unexpected input: %r" % (text[pos:],))
+        result.append((m.lastgroup, m.group(m.lastgroup)))
+        pos = m.end()
+    result.append((None, None))
+    return result
+
+#===------------------------------------------------------------------===
+# Recursive descent over tokens
+#===------------------------------------------------------------------===
+
+typeclasses = dict((cls.__name__, cls) for cls in types.alltypes)
+typeclasses['Typedef'] = types.Typedef
+
+specials = {
+    'None': None, 'True': True, 'False': False,
+    'inf': float('inf'), 'nan': float('nan'),
+}
+
+def is_exception(value):
+    return isinstance(value, type) and issubclass(value, BaseException)
+
+class TokenStream(object):
+    """Recursive descent parser for types, literals and operands"""
+
+    def __init__(self, text, lineno=None):
+        self.tokens = tokenize(text, lineno)
+        self.pos = 0
+        self.lineno = lineno
+
+    def peek(self):
+        return self.tokens[self.pos]
+
+    def next(self):
+        tok = self.tokens[self.pos]
+        self.pos += 1
+        return tok
+
+    def expect(self, value):
+        kind, tok = self.next()
+        if tok != value:
+            error(self.lineno, "Expected %r, got %r" % (value, tok))
+
+    def accept(self, value):
+        if self.tokens[self.pos][1] == value:
+            self.pos += 1
+            return True
+        return False
+
+    def at_end(self):
+        return self.tokens[self.pos][0] is None
+
+    def sequence(self, parse, close):
+        """Parse a comma-separated sequence up to token `close`"""
+        result = []
+        if not self.accept(close):
+            result.append(parse())
+            while self.accept(','):
+                result.append(parse())
+            self.expect(close)
+        return result
+
+    # ______________________________________________________________________
+
+    def parse_type(self):
+        kind, tok = self.next()
+        if kind != 'ident':
+            error(self.lineno, "Expected a type, got %r" % (tok,))
+        if tok in specials:
+            return specials[tok]
+        if not self.accept('('):
+            if not isinstance(getattr(types, tok, None), types.Type):
+                error(self.lineno, "Unknown type: %s" % (tok,))
+            return getattr(types, tok)
+
+        if tok not in typeclasses:
+            error(self.lineno, "Unknown type constructor: %s" % (tok,))
+        fields = self.sequence(self.parse_field, ')')
+        values = [value for name, value in fields if name is None]
+        kwds = dict((name, value) for name, value in fields if name)
+        return typeclasses[tok](*values, **kwds)
+
+    def parse_field(self):
+        """Parse a type field, returns (name or None, value)"""
+        kind, tok = self.peek()
+        name = None
+        if kind == 'ident' and self.tokens[self.pos + 1][1] == '=':
+            name = tok
+            self.pos += 2
+        return name, self.parse_typearg()
+
+    def parse_typearg(self):
+        kind, tok = self.peek()
+        if kind == 'ident':
+            return self.parse_type()
+        return self.parse_literal()
+
+    def parse_literal(self):
+        kind, tok = self.next()
+        if kind == 'number':
+            if tok.isdigit():
+                return int(tok)
+            if tok.endswith('inf'):
+                return -specials['inf'] if tok[0] == '-' else specials['inf']
+            return ast.literal_eval(tok)
+        elif kind == 'string':
+            return ast.literal_eval(tok)
+        elif kind == 'ident' and tok in specials:
+            return specials[tok]
+        elif kind == 'ident' and is_exception(getattr(exceptions, tok, None)):
+            cls = getattr(exceptions, tok)
+            if self.accept('('):
+                return cls(*self.sequence(self.parse_literal, ')'))
+            return cls
+        elif tok == '[':
+            return self.sequence(self.parse_typearg, ']')
+        elif tok == '(':
+            return tuple(self.sequence(self.parse_typearg, ')'))
+        error(self.lineno, "Unexpected token: %r" % (tok,))
+
+    def parse_arg(self):
+        kind, tok = self.peek()
+        if kind == 'name':
+            self.pos += 1
+            return Name(tok[1:])
+        elif tok == '[':
+            self.pos += 1
+            return self.sequence(self.parse_arg, ']')
+        elif tok == '{':
+            self.pos += 1
+            return dict(self.sequence(self.parse_item, '}'))
+        elif tok == 'const':
+            self.pos += 1
+            self.expect('(')
+            type = self.parse_type()
+            self.expect(',')
+            value = self.parse_literal()
+            self.expect(')')
+            return Const(value, type)
+        elif tok == 'Undef':
+            self.pos += 1
+            self.expect('(')
+            type = self.parse_type()
+            self.expect(')')
+            return Undef(type)
+        return self.parse_literal()
+
+    def parse_item(self):
+        key = self.parse_arg()
+        self.expect(':')
+        return key, self.parse_arg()
+
+    def parse_param(self):
+        type = self.parse_type()
+        kind, tok = self.next()
+        if kind != 'name':
+            error(self.lineno, "Expected an argument name, got %r" % (tok,))
+        return type, tok[1:]
+
+#===------------------------------------------------------------------===
+# Module construction
+#===------------------------------------------------------------------===
+
+_typecache = {}
+
+def parse_type(text, lineno=None):
+    """Parse a type, e.g. 'Pointer(base=Int32)'"""
+    if text not in _typecache:
+        stream = TokenStream(text, lineno)
+        type = stream.parse_type()
+        if not stream.at_end():
+            error(lineno, "Trailing input after type: %r" % (text,))
+        _typecache[text] = type
+    return _typecache[text]
+
+def parse_args(text, lineno=None):
+    stream = TokenStream(text, lineno)
+    args = stream.sequence(stream.parse_arg, None)
+    return args
+
+def parse_metadata(text, lineno=None):
+    stream = TokenStream(text, lineno)
+    metadata = stream.parse_arg()
+    if not stream.at_end():
+        error(lineno, "Trailing input after metadata: %r" % (text,))
+    return metadata
+
+def resolve(arg, values, module):
+    if isinstance(arg, list):
+        return [resolve(x, values, module) for x in arg]
+    elif isinstance(arg, dict):
+        return dict((resolve(key, values, module), resolve(x, values, module))
+                        for key, x in arg.iteritems())
+    elif isinstance(arg, Name):
+        if arg in values:
+            return values[arg]
+        value = module.get_function(arg) or module.get_global(arg)
+        if value is None:
+            raise NameError("Undefined name in IR: %%%s" % (arg,))
+        return value
+    return arg
+
+def build(module, pending):
+    """Resolve operands and populate the blocks of parsed functions"""
+    for func, blocks in pending:
+        values = dict(func.blockmap)
+        values.update((arg.result, arg) for arg in func.args)
+        for block, ops in blocks:
+            values.update((op.result, op) for op, args, metadata in ops)
+
+        for block, ops in blocks:
+            for op, args, metadata in ops:
+                op._args = resolve(args, values, module)
+                if metadata is not None:
+                    op.add_metadata(resolve(metadata, values, module))
+                block.append(op)
+
+def parse(text, module=None):
+    """Parse pretty-printed IR, returning a Module"""
+    module = module or Module()
+    pending = []   # [(func, [(block, [(op, args, metadata)])])]
+    func = block = None
+
+    for lineno, line in enumerate(text.splitlines(), 1):
+        if not line or line.isspace():
+            continue
+        m = _line.match(line)
+        if m is None:
+            error(lineno, "Invalid syntax: %r" % (line,))
+
+        if m.group('result') is not None:
+            if block is None:
+                error(lineno, "Operation outside of a block")
+            type = parse_type(m.group('type'), lineno)
+            args = parse_args(m.group('args'), lineno)
+            metadata = m.group('metadata')
+            if metadata is not None:
+                metadata = parse_metadata(metadata, lineno)
+            result = m.group('result')
+            func.temp.reserve(result)
+            blocks[-1][1].append((Operation(m.group('opcode'), type, None,
+                                            result), args, metadata))
+        elif m.group('label') is not None:
+            if func is None:
+                error(lineno, "Block outside of a function")
+            label = m.group('label')
+            if label in func.blockmap:
+                error(lineno, "Duplicate block: %s" % (label,))
+            func.temp.reserve(label)
+            block = func.add_block(Block(label, func))
+            blocks.append((block, []))
+        elif m.group('fname') is not None:
+            if func is not None:
+                error(lineno, "Nested function definition")
+            restype = parse_type(m.group('restype'), lineno)
+            stream = TokenStream(m.group('params'), lineno)
+            params = stream.sequence(stream.parse_param, None)
+            argtypes = [type for type, name in params]
+            argnames = [name for type, name in params]
+            name = m.group('fname')
+            func = Function(name, argnames, types.Function(restype, argtypes))
+            module.temp.reserve(name)
+            module.add_function(func)
+            blocks = []
+            pending.append((func, blocks))
+        elif m.group('end') is not None:
+            if func is None:
+                error(lineno, "Unmatched '}'")
+            func = block = None
+        else:
+            name = m.group('gname')
+            module.temp.reserve(name)
+            module.add_global(GlobalValue(name, parse_type(m.group('gtype'))))
+
+    if func is not None:
+        error(lineno, "Unterminated function %s" % (func.name,))
+
+    build(module, pending)
+    return module
+
+def parse_function(text, module=None):
+    """Parse a single pretty-printed function"""
+    before = set(module.functions) if module else set()
+    module = parse(text, module)
+    [name] = set(module.functions) - before
+    return module.get_function(name)
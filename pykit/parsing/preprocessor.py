@@ -0,0 +1,168 @@
+# -*- coding: utf-8 -*-
+
+"""
+Minimal in-process C preprocessor for pykit IR in the form of C. This avoids
+spawning the system preprocessor for every parsed module. Supported are:
+
+    #include <file> and #include "file"
+    #define NAME [replacement] (object-like macros) and #undef NAME
+    #ifdef NAME, #ifndef NAME, #else and #endif
+
+Comments are stripped (preserving line numbers), macros are substituted
+outside of string literals and included files are delimited by line markers.
+Expanded headers are cached until they or any header they include change.
+Anything else (function-like macros, #if expressions) raises a SyntaxError;
+use the system preprocessor for such sources instead
+(from_c(..., system_cpp=True)).
+"""
+
+from __future__ import print_function, division, absolute_import
+
+import os
+import re
+from os.path import join, dirname, exists, abspath
+
+#===------------------------------------------------------------------===
+# Lexical helpers
+#===------------------------------------------------------------------===
+
+_string = r'"(?:\\.|[^"\\\n])*"|\'(?:\\.|[^\'\\\n])*\''
+_comments = re.compile(_string + r'|//[^\n]*|/\*.*?\*/', re.DOTALL)
+_words = re.compile(_string + r'|[A-Za-z_]\w*')
+_directive = re.compile(r'\s*#\s*(\w+)\s*(.*?)\s*$')
+_include = re.compile(r'[<"]([^>"]+)[>"]$')
+_define = re.compile(r'([A-Za-z_]\w*)(\(?)\s*(.*)$')
+
+def error(filename, lineno, msg):
+    raise SyntaxError("%s:%d: %s" % (filename, lineno, msg))
+
+def strip_comments(text):
+    """Replace comments by whitespace, keeping newlines"""
+    def repl(m):
+        s = m.group(0)
+        if s[0] == '/':
+            return ' ' + '\n' * s.count('\n')
+        return s
+    return _comments.sub(repl, text)
+
+def substitute(line, defines, expanding=frozenset()):
+    """Substitute object-like macros in `line`"""
+    def repl(m):
+        word = m.group(0)
+        if word in defines and word not in expanding:
+            return substitute(defines[word], defines, expanding | set([word]))
+        return word
+    return _words.sub(repl, line)
+
+def linemarker(lineno, filename):
+    return '# %d "%s"' % (lineno, filename)
+
+#===------------------------------------------------------------------===
+# Preprocessor
+#===------------------------------------------------------------------===
+
+# { (path, include_dirs, defines_in) : (text, defines_out, [(path, mtime)]) }
+_header_cache = {}
+
+def find_include(name, filename, include_dirs, quoted):
+    """Resolve an #include name to a path, or return None"""
+    dirs = list(include_dirs)
+    if quoted and exists(filename):
+        dirs.insert(0, dirname(abspath(filename)))
+    for dir in dirs:
+        path = join(dir, name)
+        if exists(path):
+            return path
+
+def uptodate(dependencies):
+    """Check whether the recorded mtimes of the given files still hold"""
+    return all(exists(path) and os.path.getmtime(path) == mtime
+               for path, mtime in dependencies)
+
+def include(path, include_dirs, defines, dependencies=None):
+    """
+    Preprocess a header file, returning (text, defines). The header and all
+    headers it includes are appended to `dependencies` as (path, mtime).
+    """
+    key = (path, tuple(include_dirs), frozenset(defines.items()))
+    entry = _header_cache.get(key)
+    if entry is None or not uptodate(entry[2]):
+        deps = [(path, os.path.getmtime(path))]
+        with open(path) as f:
+            text = f.read()
+        defines = dict(defines)
+        text = _preprocess(text, path, include_dirs, defines, deps)
+        entry = _header_cache[key] = (text, defines, deps)
+
+    text, defines, deps = entry
+    if dependencies is not None:
+        dependencies.extend(deps)
+    return text, defines
+
+def _preprocess(source, filename, include_dirs, defines, dependencies=None):
+    lines = strip_comments(source).split('\n')
+    result = []
+    active = [] # stack of booleans, one for each #if[n]def
+    skipping = lambda: not all(active)
+
+    for lineno, line in enumerate(lines, 1):
+        m = _directive.match(line)
+        if not m:
+            result.append('' if skipping() else substitute(line, defines))
+            continue
+
+        directive, rest = m.groups()
+        result.append('')
+
+        if directive in ('ifdef', 'ifndef'):
+            active.append((rest in defines) == (directive == 'ifdef'))
+        elif directive == 'else':
+            if not active:
+                error(filename, lineno, "#else without #ifdef")
+            active[-1] = not active[-1]
+        elif directive == 'endif':
+            if not active:
+                error(filename, lineno, "#endif without #ifdef")
+            active.pop()
+        elif skipping():
+            pass
+        elif directive == 'include':
+            m = _include.match(rest)
+            if not m:
+                error(filename, lineno, "Invalid #include: %s" % (rest,))
+            name = m.group(1)
+            path = find_include(name, filename, include_dirs, rest[0] == '"')
+            if path is None:
+                error(filename, lineno, "Include file not found: %s" % (name,))
+            text, newdefines = include(path, include_dirs, defines,
+                                       dependencies)
+            defines.clear()
+            defines.update(newdefines)
+            result[-1] = "\n".join([linemarker(1, path), text,
+                                    linemarker(lineno + 1, filename)])
+        elif directive == 'define':
+            m = _define.match(rest)
+            if not m or m.group(2):
+                error(filename, lineno, "Unsupported #define: %s" % (rest,))
+            name, _, value = m.groups()
+            defines[name] = value
+        elif directive == 'undef':
+            defines.pop(rest, None)
+        elif directive == 'pragma':
+            result[-1] = line
+        else:
+            error(filename, lineno, "Unsupported directive: #%s" % directive)
+
+    if active:
+        error(filename, len(lines), "Unterminated #ifdef")
+
+    return "\n".join(result)
+
+def preprocess(source, filename="<string>", include_dirs=(), defines=None):
+    """
+    Preprocess C source code. Returns the preprocessed source.
+
+    :param include_dirs: directories to search for #include files
+    :param defines: initial { name : replacement } macro definitions
+    """
+    return _preprocess(source, filename, include_dirs, dict(defines or {}))
@@ -1,8 +1,14 @@
 # -*- coding: utf-8 -*-
 from __future__ import print_function, division, absolute_import
 
+import os
+import shutil
+import tempfile
 import unittest
+
+from ply import yacc
 from pykit.parsing import cirparser
+from pykit.deps.pycparser import CParser, yacctab
 from pykit.ir import verify, interp
 
 source = """
@@ -28,4 +34,25 @@ class TestParser(unittest.TestCase):
         verify(mod)
         func = mod.get_function('myfunc')
         result = interp.run(func, args=[10.0])
-        self.assertEqual(result, 12)
\ No newline at end of file
+        self.assertEqual(result, 12)
+
+    def test_shared_parser(self):
+        ast1 = cirparser.parse("int f(int x) { return x; }", "a")
+        ast2 = cirparser.parse("int g(int x) { return x; }", "b")
+        self.assertIs(cirparser.get_parser(), cirparser.get_parser())
+        self.assertEqual(ast1.ext[0].decl.name, 'f')
+        self.assertEqual(ast2.ext[0].decl.name, 'g')
+
+    @unittest.skipIf(yacctab._tabversion != yacc.__tabversion__,
+                     "Tables were generated with a different PLY version")
+    def test_tables_up_to_date(self):
+        # PLY compares the grammar signature when not optimizing, and writes
+        # new tables to the output directory if they are stale
+        tmpdir = tempfile.mkdtemp()
+        try:
+            CParser(**dict(cirparser.table_args, yacc_optimize=False,
+                           taboutputdir=tmpdir))
+            self.assertEqual(os.listdir(tmpdir), [],
+                             "Stale tables, run python -m pykit.parsing.cirparser")
+        finally:
+            shutil.rmtree(tmpdir)
@@ -0,0 +1,126 @@
+# -*- coding: utf-8 -*-
+from __future__ import print_function, division, absolute_import
+
+import unittest
+
+from pykit import types
+from pykit.ir import Function, Builder, Const, verify, interp
+from pykit.ir import Module, findallops, opcodes
+from pykit.ir.pretty import pretty
+from pykit.parsing import from_c, irparser
+from pykit.lower import lower_errcheck, lower_refcounts
+from pykit.tests import make_function
+
+source = """
+#include <pykit_ir.h>
+
+float square(float x) {
+    return x * x;
+}
+
+int loop(int n) {
+    int i, sum = 0;
+    for (i = 0; i < n; i = i + 1) {
+        sum = sum + i;
+    }
+    return sum;
+}
+
+int call() {
+    int result = loop(10);
+    return result;
+}
+"""
+
+def roundtrip(value):
+    text = pretty(value)
+    mod = irparser.parse(text)
+    return text, mod
+
+class TestIRParser(unittest.TestCase):
+
+    def test_roundtrip(self):
+        text, mod = roundtrip(from_c(source))
+        verify(mod)
+        self.assertEqual(pretty(mod), text)
+
+    def test_interp(self):
+        text, mod = roundtrip(from_c(source))
+        self.assertEqual(interp.run(mod.get_function('square'), args=[3.0]), 9.0)
+        self.assertEqual(interp.run(mod.get_function('call')), 45)
+
+    def test_phi(self):
+        f = Function("f", ["x"], types.Function(types.Float64, [types.Bool]))
+        b = Builder(f)
+        entry, then, exit = [f.new_block(n) for n in ('entry', 'then', 'exit')]
+        b.position_at_end(entry)
+        b.cbranch(f.get_arg("x"), then, exit)
+        b.position_at_end(then)
+        b.jump(exit)
+        b.position_at_end(exit)
+        phi = b.phi(types.Float64, [[entry, then],
+                                    [Const(1.5, types.Float64),
+                                     Const(float('-inf'), types.Float64)]])
+        b.ret(phi)
+
+        text, mod = roundtrip(f)
+        g = mod.get_function("f")
+        self.assertEqual(pretty(g), text)
+        self.assertEqual(interp.run(g, args=[True]), float('-inf'))
+        self.assertEqual(g.temp('exit'), 'exit1')
+
+    def test_exceptions(self):
+        # Zero-cost lowered exception handling, see lower_errcheck
+        raiser, b = make_function([types.Int32], name="raiser")
+        b.exc_throw(Const(TypeError("bad", 2), types.Exception))
+
+        f, b = make_function([types.Int32])
+        module = Module()
+        module.add_function(raiser)
+        module.add_function(f)
+        handler = f.new_block("handler")
+        b.exc_setup([handler])
+        call = b.call(types.Int32, [raiser, f.args])
+        b.check_error(call, Const(-1, types.Int32))
+        b.ret(call)
+        b.position_at_end(handler)
+        b.exc_catch([Const(TypeError, types.Exception)])
+        b.ret(Const(0, types.Int32))
+        lower_errcheck.lower_zerocost(f)
+
+        text, mod = roundtrip(module)
+        self.assertEqual(pretty(mod), text)
+        g = mod.get_function("f")
+        [call] = findallops(g, 'call')
+        self.assertEqual(call.metadata, {"exc.unwind": [g.get_block("handler")]})
+        self.assertEqual(interp.run(g, args=[1]), 0)
+
+    def test_refcounts(self):
+        lst = types.List(types.Int32, -1, managed=True)
+        f, b = make_function([lst], lst)
+        b.ret(b.new_list(lst, [[]]))
+        lower_refcounts.run(f)
+
+        text, mod = roundtrip(f)
+        g = mod.get_function("f")
+        self.assertEqual(pretty(g), text)
+        self.assertIs(g.type, f.type)
+        self.assertTrue(g.type.restype.managed)
+        self.assertEqual(opcodes(g), opcodes(f))
+
+    def test_parse_type(self):
+        ty = types.Struct(['a', 'b'], [types.Pointer(types.Int32), types.Int])
+        self.assertEqual(types.parse_type(str(ty)), ty)
+        self.assertEqual(types.parse_type("Float64"), types.Float64)
+
+    def test_errors(self):
+        self.assertRaises(SyntaxError, irparser.parse, "entry:")
+        self.assertRaises(SyntaxError, irparser.parse,
+                          "function Void f() {\nentry:\n    %0 = (Void) ret(")
+        self.assertRaises(NameError, irparser.parse,
+                          "function Void f() {\nentry:\n"
+                          "    %0 = (Void) ret(%x)\n}")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+from __future__ import print_function, division, absolute_import
+
+import os
+import shutil
+import tempfile
+import unittest
+from os.path import join
+from pykit.parsing import preprocessor, cirparser
+
+pp = lambda source, **kwds: preprocessor.preprocess(source, "t.c", **kwds)
+
+class TestPreprocessor(unittest.TestCase):
+
+    def test_comments(self):
+        source = 'int x; /* a\nb */ int y; // c\nchar *s = "/* d */";'
+        self.assertEqual(pp(source).splitlines(),
+                         ['int x;  ', ' int y;  ', 'char *s = "/* d */";'])
+
+    def test_defines(self):
+        source = "#define N 10\n#define M N\nint x = M;\n#undef N\nint y = N;"
+        self.assertEqual(pp(source).splitlines()[2:],
+                         ['int x = 10;', '', 'int y = N;'])
+
+    def test_ifdef(self):
+        source = "#ifdef A\nint x;\n#else\nint y;\n#endif"
+        self.assertEqual(pp(source).split(), ['int', 'y;'])
+        self.assertEqual(pp(source, defines={'A': ''}).split(), ['int', 'x;'])
+
+    def test_include(self):
+        source = "#include <pykit_ir.h>\nint x;"
+        result = pp(source, include_dirs=[cirparser.ir_root])
+        self.assertIn("typedef Type Int32;", result)
+        self.assertTrue(result.endswith('# 2 "t.c"\nint x;'))
+
+    def test_include_cache(self):
+        tmpdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmpdir)
+        def write(name, text):
+            path = join(tmpdir, name)
+            if not os.path.exists(os.path.dirname(path)):
+                os.mkdir(os.path.dirname(path))
+            with open(path, "w") as f:
+                f.write(text)
+            return path
+
+        write("outer/outer.h", "#include <inner.h>")
+        write("a/inner.h", "int a;")
+        inner = write("b/inner.h", "int b;")
+        source = "#include <outer.h>"
+        dirs = lambda name: [join(tmpdir, "outer"), join(tmpdir, name)]
+
+        # The include path is part of the cache key
+        self.assertIn("int a;", pp(source, include_dirs=dirs("a")))
+        self.assertIn("int b;", pp(source, include_dirs=dirs("b")))
+
+        # Changing a nested header invalidates the cached outer header
+        write("b/inner.h", "int c;")
+        mtime = os.path.getmtime(inner) + 10
+        os.utime(inner, (mtime, mtime))
+        self.assertIn("int c;", pp(source, include_dirs=dirs("b")))
+
+    def test_errors(self):
+        self.assertRaises(SyntaxError, pp, "#include <nonexistent.h>")
+        self.assertRaises(SyntaxError, pp, "#define F(x) x")
+        self.assertRaises(SyntaxError, pp, "#ifdef A\n")
@@ -39,6 +39,25 @@ def run(func, env, transforms):
         func, env = result
     return func, env
 
+def fixpoint(transforms, maxiter=10):
+    """
+    Build a transform that runs `transforms` (given as strings) repeatedly
+    until the function no longer changes, or `maxiter` iterations have run.
+    Change is detected through `Function.mutations`:
+
+        env["passes.simplify"] = fixpoint(["passes.sccp", "passes.dce"])
+    """
+    def transform(func, env):
+        for i in range(maxiter):
+            before = (func, func.mutations)
+            func, env = run(func, env, transforms)
+            if (func, func.mutations) == before:
+                break
+        return func, env
+
+    transform.__name__ = 'fixpoint(%s)' % ", ".join(transforms)
+    return transform
+
 analyze  = lambda func, env: run(func, env, env["pipeline.analyze"])
 optimize = lambda func, env: run(func, env, env["pipeline.optimize"])
 lower    = lambda func, env: run(func, env, env["pipeline.lower"])
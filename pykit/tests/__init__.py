@@ -35,6 +35,18 @@ def pykitcompile(source, funcname=None, cfanalyze=True):
     env = environment.fresh_env()
     return State(m, f, b, entry, env)
 
+def make_function(argtypes, restype=types.Int32, name="f", argnames=None):
+    """
+    Build a function with an empty entry block, to be filled in by a test.
+    Returns the function and a Builder positioned in the entry block.
+    """
+    if argnames is None:
+        argnames = ["arg%d" % i for i in range(len(argtypes))]
+    f = Function(name, argnames, types.Function(restype, list(argtypes)))
+    b = Builder(f)
+    b.position_at_end(f.new_block("entry"))
+    return f, b
+
 # ______________________________________________________________________
 
 class SourceTestCase(unittest.TestCase):
@@ -0,0 +1,37 @@
+# -*- coding: utf-8 -*-
+from __future__ import print_function, division, absolute_import
+
+import sys
+import unittest
+import subprocess
+from os.path import dirname, abspath
+
+import pykit
+
+root = dirname(dirname(abspath(pykit.__file__)))
+
+heavy = ['numpy', 'networkx', 'llvm', 'llvmmath', 'ply']
+
+def imported_heavy(module, heavy=heavy):
+    """Import `module` in a fresh interpreter, return heavy modules loaded"""
+    code = ("import sys; import %s; "
+            "print(' '.join(m for m in %r if sys.modules.get(m)))")
+    out = subprocess.check_output([sys.executable, "-c", code % (module, heavy)],
+                                  cwd=root)
+    return out.decode('ascii').split()
+
+class TestImports(unittest.TestCase):
+
+    def test_lazy_imports(self):
+        for module in ['pykit', 'pykit.ir', 'pykit.environment']:
+            self.assertEqual(imported_heavy(module), [], module)
+
+    def test_optin_passes(self):
+        passes = ['pykit.transform.sroa', 'pykit.transform.tailcall',
+                  'pykit.transform.stackalloc', 'pykit.transform.refcounts',
+                  'pykit.lower.lower_refcounts']
+        self.assertEqual(imported_heavy('pykit.environment', passes), [])
+
+    def test_from_c(self):
+        mod = pykit.from_c("int f(int x) { return x; }")
+        assert mod.get_function('f')
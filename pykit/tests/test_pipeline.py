@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+from __future__ import print_function, division, absolute_import
+
+import unittest
+
+from pykit import types, pipeline
+from pykit.ir import Function, Builder, opcodes
+from pykit.transform import dce
+
+class TestFixpoint(unittest.TestCase):
+
+    def setUp(self):
+        self.f = Function("f", ['a'], types.Function(types.Int32, [types.Int32]))
+        self.b = Builder(self.f)
+        self.b.position_at_end(self.f.new_block('entry'))
+        a = self.f.get_arg('a')
+
+        # Chain of dead operations, dce removes one link per iteration
+        x = self.b.add(types.Int32, [a, a])
+        y = self.b.mul(types.Int32, [x, x])
+        self.b.sub(types.Int32, [y, a])
+        self.b.ret(a)
+
+        self.runs = 0
+        def count(func, env):
+            self.runs += 1
+        self.env = {"passes.dce": dce, "passes.count": count}
+
+    def test_fixpoint(self):
+        transform = pipeline.fixpoint(["passes.count", "passes.dce"])
+        transform(self.f, self.env)
+        self.assertEqual(opcodes(self.f), ['ret'])
+        # three deleting iterations, one to find nothing changed
+        self.assertEqual(self.runs, 4)
+
+    def test_maxiter(self):
+        transform = pipeline.fixpoint(["passes.count", "passes.dce"], maxiter=2)
+        transform(self.f, self.env)
+        self.assertEqual(opcodes(self.f), ['add', 'ret'])
+        self.assertEqual(self.runs, 2)
+
+    def test_unchanged(self):
+        mutations = self.f.mutations
+        pipeline.run(self.f, self.env, ["passes.count"])
+        self.assertEqual(self.f.mutations, mutations)
+
+
+if __name__ == '__main__':
+    unittest.main()
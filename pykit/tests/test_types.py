@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+from __future__ import print_function, division, absolute_import
+
+import copy
+import unittest
+
+from pykit import types
+
+class TestTypes(unittest.TestCase):
+
+    def test_interning(self):
+        s1 = types.Struct(['x', 'y'], [types.Int32, types.Float64])
+        s2 = types.Struct(['x', 'y'], [types.Int32, types.Float64])
+        self.assertIs(s1, s2)
+        self.assertIs(types.Pointer(s1), types.Pointer(s2))
+        self.assertIs(types.Integral(32, False), types.Int32)
+        self.assertEqual(hash(s1), hash(s2))
+
+    def test_keywords(self):
+        self.assertIs(types.Integral(bits=32, unsigned=False), types.Int32)
+        self.assertIs(types.Integral(32, unsigned=False), types.Int32)
+        self.assertIs(types.Struct(names=['x'], types=[types.Int32]),
+                      types.Struct(['x'], [types.Int32]))
+        self.assertIs(types.Typedef(name="Int", type=types.Int32), types.Int)
+        self.assertIs(types.List(base=types.Int32, count=-1, managed=True),
+                      types.List(types.Int32, -1, managed=True))
+        self.assertRaises(TypeError, types.Integral, 32)
+        self.assertRaises(TypeError, types.Integral, 32, False, signed=True)
+
+    def test_equality(self):
+        self.assertEqual(types.Pointer(types.Int32), types.Pointer(types.Int32))
+        self.assertNotEqual(types.Int32, types.UInt32)
+        self.assertNotEqual(types.Int, types.Int32) # typedef
+        self.assertNotEqual(types.Int32, (32, False))
+
+    def test_managed(self):
+        managed = types.List(types.Int32, -1, managed=True)
+        unmanaged = types.List(types.Int32, -1)
+        self.assertIsNot(managed, unmanaged)
+        self.assertTrue(managed.managed)
+        self.assertFalse(unmanaged.managed)
+
+    def test_replace(self):
+        managed = types.Pointer(types.Int32, managed=True)
+        self.assertIs(managed._replace(base=types.Int64),
+                      types.Pointer(types.Int64, managed=True))
+        self.assertIs(managed._replace(managed=False), types.Pointer(types.Int32))
+
+    def test_copy(self):
+        managed = types.List(types.Int32, -1, managed=True)
+        for ty in (types.Int, managed):
+            self.assertIs(copy.deepcopy(ty), ty)
@@ -4,6 +4,8 @@
 Function inlining.
 """
 
+from __future__ import print_function, division, absolute_import
+
 from pykit.error import CompileError
 from pykit.analysis import loop_detection
 from pykit.ir import Function, Builder, findallops, copy_function, verify
@@ -60,6 +62,114 @@ def inline(func, call, uses=None):
     func.reset_uses()
     verify(func)
 
+#===------------------------------------------------------------------===
+# Module-level inlining
+#===------------------------------------------------------------------===
+
+def size(func):
+    """Size of a function in number of operations"""
+    return sum(len(block.ops) for block in func.blocks)
+
+def profile_count(op):
+    """Execution count of `op` from interpreter profile data, or None"""
+    return (op.metadata or {}).get('profile.count')
+
+def module_callgraph(module):
+    """Call graph of the functions in `module` calling each other"""
+    import networkx as nx
+
+    graph = nx.DiGraph()
+    for func in module.functions.values():
+        graph.add_node(func)
+        for call in findallops(func, 'call'):
+            callee = call.args[0]
+            if isinstance(callee, Function) and callee.module is module:
+                graph.add_edge(func, callee)
+
+    return graph
+
+def bottom_up(graph):
+    """Order the functions in a call graph, callees before callers"""
+    order, seen = [], set()
+    byname = lambda funcs: sorted(funcs, key=lambda f: f.name)
+
+    def visit(func):
+        if func not in seen:
+            seen.add(func)
+            for callee in byname(graph.successors(func)):
+                visit(callee)
+            order.append(func)
+
+    for func in byname(graph.nodes()):
+        visit(func)
+    return order
+
+def inline_module(module, threshold=20, hot_threshold=100, hot_count=100,
+                  growth=2.0):
+    """
+    Inline calls between functions of a module. The call graph is visited
+    bottom-up, so callees have been inlined into before their callers are
+    considered. Recursive functions (calling themselves, directly or through
+    other functions) are never inlined.
+
+    A call site is inlined if the callee is at most `threshold` operations
+    large. Call sites with interpreter profile data (see
+    interp.Profile.annotate()) are treated according to their execution
+    count: sites executed at least `hot_count` times accept callees of up to
+    `hot_threshold` operations, sites that never executed are left alone.
+    Each caller may grow to at most `growth` times its original size (or by
+    `threshold` operations); the hottest and smallest calls go first.
+
+    :return: [(caller, callee, count)] for every inlined call, where count is
+             the profile count of the call site or None
+    """
+    import networkx as nx
+
+    graph = module_callgraph(module)
+    recursive = set(func for func in graph if graph.has_edge(func, func))
+    for funcs in nx.strongly_connected_components(graph):
+        if len(funcs) > 1:
+            recursive.update(funcs)
+
+    def inlinable(call):
+        callee = call.args[0]
+        return (callee in graph and
+                callee not in recursive and
+                callee.startblock is not None and
+                not findallops(callee, 'yield'))
+
+    inlined = []
+    for func in bottom_up(graph):
+        profiled = any(profile_count(op) is not None for op in func.ops)
+        original = size(func)
+        budget = max(original * growth, original + threshold)
+
+        calls = [call for call in findallops(func, 'call')
+                      if inlinable(call)]
+        calls.sort(key=lambda call: (-(profile_count(call) or 0),
+                                     size(call.args[0])))
+
+        for call in calls:
+            callee = call.args[0]
+            count = profile_count(call)
+            if profiled and count is None:
+                count = 0 # never executed
+
+            if count is not None and count >= hot_count:
+                limit = hot_threshold
+            elif count == 0:
+                continue
+            else:
+                limit = threshold
+
+            if size(callee) <= limit and size(func) + size(callee) <= budget:
+                inline(func, call)
+                inlined.append((func, callee, count))
+
+    return inlined
+
+# ______________________________________________________________________
+
 def assert_inlinable(func, call, callee, uses):
     """
     Verify that a function call can be inlined.
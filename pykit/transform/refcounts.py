@@ -0,0 +1,122 @@
+# -*- coding: utf-8 -*-
+
+"""
+Remove redundant reference counting: a gc_incref(x) followed by a
+gc_decref(x) cancel out if nothing in between can release a reference,
+since then no object can die while x is borrowed.
+
+Pairs are matched within a block, and across blocks when the decref block
+B is entered only through the incref block A, every path from A leads to B,
+and the paths in between do not loop back to A:
+
+    A:  gc_incref(%x)           A:  ...
+        cbranch(...)                cbranch(...)
+    ...                   =>    ...
+    B:  gc_decref(%x)           B:  ...
+"""
+
+from __future__ import print_function, division, absolute_import
+from itertools import islice
+from collections import defaultdict
+
+from pykit.ir import ops
+from pykit.analysis import regalloc
+
+# Operations that may release references (and hence free objects). Stores
+# release the value they overwrite, removals the value they remove.
+releasing = frozenset([
+    ops.gc_decref, ops.gc_giveref, ops.gc_dealloc, ops.call,
+    ops.thread_start, ops.thread_join,
+    ops.threadpool_submit, ops.threadpool_join,
+    ops.store, ops.ptrstore, ops.setfield, ops.setindex, ops.setslice,
+    ops.list_pop, ops.set_remove, ops.dict_remove,
+])
+
+def find_decref(oplist, value):
+    """
+    Find the first gc_decref(value) in `oplist`. Returns (decref, clean),
+    where clean indicates whether no releasing operation precedes it.
+    """
+    for op in oplist:
+        if op.opcode == 'gc_decref' and op.args[0] is value:
+            return op, True
+        elif op.opcode in releasing:
+            return None, False
+    return None, True
+
+def region(succs, start, end):
+    """Blocks reachable from `start` without passing through `end`"""
+    seen = set()
+    worklist = list(succs[start])
+    while worklist:
+        block = worklist.pop()
+        if block is not end and block not in seen:
+            seen.add(block)
+            worklist.extend(succs[block])
+    return seen
+
+def match_across(succs, preds, incref, decref):
+    """
+    See whether the incref and decref (in a different block) cancel on all
+    paths between them
+    """
+    start, end = incref.block, decref.block
+    blocks = region(succs, start, end)
+    if start in blocks:
+        return False # Loops back to the incref
+
+    allowed = blocks | set([start])
+    for block in blocks:
+        if not succs[block] or not set(preds[block]) <= allowed:
+            return False # Path to the exit or entry from outside
+        if any(op.opcode in releasing for op in block):
+            return False
+    if not set(preds[end]) <= allowed:
+        return False
+
+    found, clean = find_decref(end.ops, incref.args[0])
+    return found is decref
+
+def eliminate_pairs(func):
+    """
+    Remove matching gc_incref/gc_decref pairs. Returns the number of removed
+    pairs.
+    """
+    decrefs = defaultdict(list) # { value : [decref] }
+    for op in func.ops:
+        if op.opcode == 'gc_decref':
+            decrefs[op.args[0]].append(op)
+    if not decrefs:
+        return 0
+
+    succs = dict((block, regalloc.successors(block)) for block in func.blocks)
+    preds = defaultdict(list)
+    for block, targets in succs.items():
+        for target in targets:
+            preds[target].append(block)
+
+    removed = 0
+    for op in list(func.ops):
+        if op.opcode != 'gc_incref':
+            continue
+
+        value = op.args[0]
+        following = islice(op.block.ops.iter_from(op), 1, None)
+        decref, clean = find_decref(following, value)
+        if decref is None and clean:
+            for candidate in decrefs[value]:
+                if (candidate.block is not op.block and
+                        match_across(succs, preds, op, candidate)):
+                    decref = candidate
+                    break
+
+        if decref is not None:
+            decrefs[value].remove(decref)
+            op.delete()
+            decref.delete()
+            removed += 1
+
+    return removed
+
+def run(func, env=None):
+    eliminate_pairs(func)
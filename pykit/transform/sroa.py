@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+
+"""
+Scalar replacement of aggregates: split allocas of Struct type into an
+alloca per field, which cfa.ssa() can then promote to registers:
+
+    %p = (Pointer(Struct([x, y], [Int32, Int32]))) alloca()
+    %0 = (Void) store(%s, %p)
+    %1 = (Struct(...)) load(%p)
+    %2 = (Int32) getfield(%1, 'x')
+    %5 = (Int32) getfield(%p, 'y')
+
+becomes
+
+    %p.x = (Pointer(Int32)) alloca()
+    %p.y = (Pointer(Int32)) alloca()
+    %3 = (Int32) getfield(%s, 'x')
+    %4 = (Void) store(%3, %p.x)
+    ...
+    %6 = (Int32) load(%p.x)
+    %5 = (Int32) load(%p.y)
+
+Getfields of a loaded struct read the fields at the position of the load,
+getfields of the alloca itself load the field in place.
+
+An alloca is split only if its address does not escape: it must only be
+loaded from, stored to, or have its fields accessed through getfield and
+setfield, and loaded structs must only be used by getfield.
+"""
+
+from __future__ import print_function, division, absolute_import
+
+from pykit import types
+from pykit.ir import Op, Operation
+
+def is_struct_alloca(op):
+    return op.opcode == 'alloca' and op.type.base.is_struct
+
+def splittable(func, alloca):
+    """See whether the address of `alloca` escapes"""
+    for use in func.uses[alloca]:
+        if use.opcode == 'load':
+            for fielduse in func.uses[use]:
+                if fielduse.opcode != 'getfield' or fielduse.args[0] is not use:
+                    return False
+        elif use.opcode == 'store':
+            value, ptr = use.args
+            if value is alloca:
+                return False
+        elif use.opcode == 'getfield':
+            pass
+        elif use.opcode == 'setfield':
+            if use.args[2] is alloca or func.uses[use]:
+                return False
+        else:
+            return False
+    return True
+
+def store_fields(func, store, fields, struct):
+    """Store the fields of a struct value into the field allocas"""
+    value, ptr = store.args
+    for name, type in zip(struct.names, struct.types):
+        if isinstance(value, Operation) and value.opcode == 'new_struct':
+            field = value.args[0][struct.names.index(name)]
+        else:
+            field = Op('getfield', type, [value, name], func.temp())
+            field.insert_before(store)
+        newstore = Op('store', types.Void, [field, fields[name]], func.temp())
+        newstore.insert_before(store)
+    store.delete()
+
+def split(func, alloca):
+    """Split `alloca` into allocas for each field. Returns the new allocas."""
+    struct = alloca.type.base
+    fields = {}
+    for name, type in zip(struct.names, struct.types):
+        field = Op('alloca', types.Pointer(type), [],
+                   func.temp(alloca.result + '.' + name))
+        field.insert_before(alloca)
+        fields[name] = field
+
+    for use in list(func.uses[alloca]):
+        if use.opcode == 'load':
+            # Load the fields where the struct was loaded, a store between
+            # the load and a getfield must not be observed
+            loads = {}
+            for getfield in list(func.uses[use]):
+                name = getfield.args[1]
+                if name not in loads:
+                    loads[name] = Op('load', getfield.type, [fields[name]],
+                                     func.temp())
+                    loads[name].insert_before(use)
+                getfield.replace_uses(loads[name])
+                getfield.delete()
+            use.delete()
+        elif use.opcode == 'store':
+            store_fields(func, use, fields, struct)
+        elif use.opcode == 'getfield':
+            use.replace_op('load', [fields[use.args[1]]])
+        else:
+            ptr, name, value = use.args
+            use.replace_op('store', [value, fields[name]])
+
+    alloca.delete()
+    return [fields[name] for name in struct.names]
+
+def sroa(func):
+    """Split all struct allocas in `func`. Returns the number of splits."""
+    func.reset_uses()
+    worklist = [op for op in func.ops if is_struct_alloca(op)]
+    count = 0
+    while worklist:
+        alloca = worklist.pop()
+        if splittable(func, alloca):
+            # Nested structs are split in turn
+            fields = split(func, alloca)
+            worklist.extend(field for field in fields
+                                      if is_struct_alloca(field))
+            count += 1
+    return count
+
+def run(func, env=None):
+    sroa(func)
@@ -0,0 +1,155 @@
+# -*- coding: utf-8 -*-
+
+"""
+Replace aggregate allocations that do not escape (see
+pykit.analysis.escape) by their elements:
+
+    %t = (Tuple) new_tuple([%x, %y])
+    %a = (Int32) getindex(%t, [const(0)])
+
+becomes
+
+    %a = %x
+
+Elements that are written (setindex, setfield) live in a stack slot:
+
+    %p = (Pointer(Int32)) alloca()
+    ...
+    store(%y, %p)
+
+which is promoted to SSA form by cfa.ssa(). Allocations are only replaced
+if all their elements are accessed by constant index or field name.
+new_data allocations of a single element become an alloca.
+"""
+
+from __future__ import print_function, division, absolute_import
+import ctypes
+
+from pykit import types
+from pykit.ir import Op, Constant
+from pykit.analysis import escape, cfa
+
+def element(alloc, op):
+    """
+    Return the element index of `alloc` accessed by `op`, or None if
+    `op` does not access a statically known element
+    """
+    inits, = alloc.args
+    if op.opcode in ('getfield', 'setfield'):
+        if alloc.opcode == 'new_struct' and op.args[1] in alloc.type.names:
+            return alloc.type.names.index(op.args[1])
+    elif op.opcode in ('getindex', 'setindex'):
+        indices = op.args[1]
+        if (alloc.opcode in ('new_tuple', 'new_list') and len(indices) == 1
+                and isinstance(indices[0], Constant)):
+            index = indices[0].const
+            if isinstance(index, (int, long)) and 0 <= index < len(inits):
+                return index
+    return None
+
+def element_type(alloc, index):
+    type = alloc.type
+    if type.is_struct:
+        return type.types[index]
+    elif type.is_tuple:
+        return type.bases[index]
+    else:
+        return type.base
+
+def replaceable(alloc, uses):
+    """See whether all uses of `alloc` access a statically known element"""
+    for use in uses:
+        if use.opcode in escape.refcounting:
+            continue
+        if element(alloc, use) is None:
+            return False
+    return True
+
+def new_alloca(func, type):
+    alloca = Op('alloca', types.Pointer(type), [], func.temp())
+    entry = func.startblock
+    leaders = entry.leaders
+    if leaders:
+        alloca.insert_after(leaders[-1])
+    else:
+        alloca.insert_before(entry.head)
+    return alloca
+
+def scalar_replace(func, alloc):
+    """
+    Replace an aggregate allocation by its elements. Returns the number of
+    created allocas.
+    """
+    inits, = alloc.args
+    uses = list(func.uses[alloc])
+    written = set(element(alloc, use) for use in uses
+                      if use.opcode in ('setfield', 'setindex'))
+
+    slots = {}
+    for index in sorted(written):
+        slots[index] = new_alloca(func, element_type(alloc, index))
+        store = Op('store', types.Void, [inits[index], slots[index]],
+                   func.temp())
+        store.insert_before(alloc)
+
+    for use in uses:
+        if use.opcode in escape.refcounting:
+            use.delete()
+            continue
+
+        index = element(alloc, use)
+        if use.opcode in ('setfield', 'setindex'):
+            use.replace_op('store', [use.args[2], slots[index]])
+        elif index in slots:
+            use.replace_op('load', [slots[index]])
+        else:
+            use.replace_uses(inits[index])
+            use.delete()
+
+    alloc.delete()
+    return len(slots)
+
+def sizeof(type):
+    """Size of scalar types in bytes, or None"""
+    if type.is_int or type.is_real:
+        return type.bits // 8
+    elif type.is_bool:
+        return 1
+    elif type.is_pointer:
+        return ctypes.sizeof(ctypes.c_void_p)
+    return None
+
+def stack_allocate(func, alloc):
+    """Replace new_data of a single element by an alloca"""
+    size = alloc.args[0]
+    base = alloc.type.base
+    if not isinstance(size, Constant) or size.const != sizeof(base):
+        return False
+
+    alloca = new_alloca(func, base)
+    alloc.replace_uses(alloca)
+    for use in list(func.uses[alloca]):
+        if use.opcode in escape.refcounting:
+            use.delete()
+    alloc.delete()
+    return True
+
+def replace_allocations(func, interprocedural=True, cache=None):
+    """
+    Replace non-escaping allocations. Returns the number of created allocas,
+    which need to be promoted by cfa.ssa().
+    """
+    func.reset_uses()
+    nallocas = 0
+    for alloc in escape.nonescaping(func, interprocedural, cache):
+        if alloc.opcode == 'new_data':
+            if alloc.type.is_pointer and stack_allocate(func, alloc):
+                nallocas += 1
+        elif replaceable(alloc, func.uses[alloc]):
+            nallocas += scalar_replace(func, alloc)
+
+    return nallocas
+
+def run(func, env=None):
+    if replace_allocations(func):
+        cfa.run(func)
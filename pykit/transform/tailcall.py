@@ -0,0 +1,136 @@
+# -*- coding: utf-8 -*-
+
+"""
+Turn self-recursive tail calls into loops:
+
+    function Int32 f(Int32 %n) {
+    entry:
+        ...
+        %r = (Int32) call(%f, [%m])
+        %0 = (Void) ret(%r)
+    }
+
+becomes
+
+    function Int32 f(Int32 %n) {
+    entry:
+        %0 = (Void) jump(%tailrec)
+
+    tailrec:
+        %n1 = (Int32) phi([%entry, ...], [%n, %m])
+        ...
+        %1 = (Void) jump(%tailrec)
+    }
+
+Allocas at the start of the entry block stay there, so the loop does not
+allocate stack space on each iteration. Since the iterations then share
+these stack slots, functions where a pointer to a slot may escape (e.g.
+when it is passed to the recursive call) are left alone.
+"""
+
+from __future__ import print_function, division, absolute_import
+
+from pykit.ir import Builder, findop
+
+# Operations deriving a pointer into the same stack slot
+derived = frozenset(['ptradd', 'ptrcast', 'phi'])
+
+def find_tailcalls(func):
+    """Find [(call, ret)] pairs of self tail calls in `func`"""
+    tailcalls = []
+    for block in func.blocks:
+        if findop(block.leaders, 'exc_setup'):
+            continue # exceptions must propagate through the caller's handlers
+
+        ops = list(block.ops)
+        for call, ret in zip(ops, ops[1:]):
+            if (call.opcode == 'call' and call.args[0] is func and
+                    ret.opcode == 'ret' and
+                    ret.args[0] in (call, None)):
+                tailcalls.append((call, ret))
+
+    return tailcalls
+
+def entry_allocas(func):
+    """Allocas at the start of the entry block"""
+    allocas = []
+    for op in func.startblock.ops:
+        if op.opcode != 'alloca':
+            break
+        allocas.append(op)
+    return allocas
+
+def slots_escape(func, allocas):
+    """
+    See whether a pointer to any of the stack slots `allocas` (or a pointer
+    derived from one) is used for anything but loading and storing
+    """
+    worklist = list(allocas)
+    seen = set(worklist)
+    while worklist:
+        value = worklist.pop()
+        for use in func.uses[value]:
+            if use.opcode in ('load', 'ptrload'):
+                continue
+            elif use.opcode == 'store' and use.args[0] is not value:
+                continue
+            elif use.opcode == 'ptrstore' and use.args[1] is not value:
+                continue
+            elif use.opcode in derived:
+                if use not in seen:
+                    seen.add(use)
+                    worklist.append(use)
+            else:
+                return True
+    return False
+
+def tailcall_to_loop(func):
+    """
+    Rewrite self tail calls in `func` to jumps to the function start.
+    Returns the number of rewritten calls.
+    """
+    tailcalls = find_tailcalls(func)
+    if not tailcalls:
+        return 0
+
+    func.reset_uses()
+    allocas = entry_allocas(func)
+    if slots_escape(func, allocas):
+        return 0
+
+    b = Builder(func)
+    entry = func.startblock
+
+    # Split the entry block after its allocas
+    if allocas:
+        b.position_after(allocas[-1])
+    else:
+        b.position_at_beginning(entry)
+    _, header = b.splitblock('tailrec', terminate=True)
+
+    # Arguments become phis in the loop header
+    phis = []
+    with b.at_front(header):
+        for arg in func.args:
+            phi = b.phi(arg.type, [[], []])
+            arg.replace_uses(phi)
+            phis.append(phi)
+
+    # Replace the tail calls by jumps, passing the arguments to the phis
+    incoming = [(entry, func.args)]
+    for call, ret in tailcalls:
+        block = call.block
+        incoming.append((block, call.args[1]))
+        ret.delete()
+        call.delete()
+        b.position_at_end(block)
+        b.jump(header)
+
+    for i, phi in enumerate(phis):
+        phi.set_args([[block for block, args in incoming],
+                      [args[i] for block, args in incoming]])
+
+    return len(tailcalls)
+
+def run(func, env=None):
+    tailcall_to_loop(func)
@@ -67,3 +67,89 @@ class TestInlining(unittest.TestCase):
         # TODO: update phi when splitting blocks
         # result2 = interp.run(func)
         # assert result == result2
+
+    def test_inline_module(self):
+        source = textwrap.dedent("""
+        #include <pykit_ir.h>
+
+        int square(int i) {
+            return i * i;
+        }
+
+        int sumsquares(int n) {
+            int i, sum = 0;
+            for (i = 0; i < n; i = i + 1) {
+                int x = call(square, list(i));
+                sum = sum + x;
+            }
+            return sum;
+        }
+
+        Int32 fact(Int32 n) {
+            if (n < 2) {
+                return 1;
+            }
+            Int32 m = n - 1;
+            Int32 x = call(fact, list(m));
+            return n * x;
+        }
+
+        Int32 main() {
+            Int32 x = call(sumsquares, list(4));
+            Int32 y = call(fact, list(5));
+            return x + y;
+        }
+        """)
+        mod = from_c(source)
+        main = mod.get_function("main")
+        expected = interp.run(main)
+
+        inlined = inline.inline_module(mod, threshold=60)
+        names = [(caller.name, callee.name) for caller, callee, _ in inlined]
+        self.assertEqual(names, [("sumsquares", "square"),
+                                 ("main", "sumsquares")])
+
+        self.assertEqual(interp.run(main), expected)
+        # recursive calls are left alone
+        [call] = findallops(mod.get_function("fact"), 'call')
+        self.assertIs(call.args[0], mod.get_function("fact"))
+        [call] = findallops(main, 'call')
+        self.assertIs(call.args[0], mod.get_function("fact"))
+
+    def test_inline_profile(self):
+        source = textwrap.dedent("""
+        #include <pykit_ir.h>
+
+        int square(int i) {
+            return i * i;
+        }
+
+        int cube(int i) {
+            return i * i * i;
+        }
+
+        int f(int i) {
+            int x = 0;
+            if (i < 10) {
+                x = call(square, list(i));
+            } else {
+                x = call(cube, list(i));
+            }
+            return x;
+        }
+        """)
+        mod = from_c(source)
+        f = mod.get_function("f")
+        profile = interp.Profile()
+        for i in range(5):
+            interp.run(f, args=[i], profile=profile)
+        profile.annotate()
+
+        inlined = inline.inline_module(mod, threshold=0, hot_threshold=100,
+                                       hot_count=5)
+        self.assertEqual([(callee.name, n) for _, callee, n in inlined],
+                         [("square", 5)])
+        [call] = findallops(f, 'call')
+        self.assertEqual(call.args[0].name, "cube")
+        self.assertEqual(interp.run(f, args=[3]), 9)
+        self.assertEqual(interp.run(f, args=[11]), 1331)
@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+from __future__ import print_function, division, absolute_import
+
+import unittest
+
+from pykit import types
+from pykit.ir import Const, opcodes
+from pykit.transform import refcounts
+from pykit.tests import make_function
+
+ManagedList = types.List(types.Int32, -1, managed=True)
+
+def make_borrow(between=None, branch=False):
+    """
+    Build a function that increfs its argument, executes `between` (either
+    in the same block, or in one arm of a diamond if `branch` is set) and
+    decrefs the argument again.
+    """
+    f, b = make_function([ManagedList, ManagedList])
+    lst, other = f.args
+    b.gc_incref(types.Void, [lst])
+    if branch:
+        then, else_, exit = [f.new_block(name)
+                             for name in ("then", "else", "exit")]
+        b.cbranch(Const(True, types.Bool), then, else_)
+        b.position_at_end(then)
+        if between:
+            between(b, other)
+        b.jump(exit)
+        b.position_at_end(else_)
+        b.jump(exit)
+        b.position_at_end(exit)
+    elif between:
+        between(b, other)
+
+    b.gc_decref(types.Void, [lst])
+    b.ret(Const(0, types.Int32))
+    return f
+
+def release(b, value):
+    b.gc_decref(types.Void, [value])
+
+def incref(b, value):
+    b.gc_incref(types.Void, [value])
+
+def setindex(b, value):
+    b.setindex(types.Void, [value, [Const(0, types.Int32)],
+                            Const(1, types.Int32)])
+
+def pop(b, value):
+    b.list_pop(types.Int32, [value])
+
+class TestRefcountElimination(unittest.TestCase):
+
+    def test_block(self):
+        f = make_borrow(incref)
+        self.assertEqual(refcounts.eliminate_pairs(f), 1)
+        self.assertEqual(opcodes(f), ['gc_incref', 'ret'])
+
+    def test_block_release(self):
+        f = make_borrow(release)
+        self.assertEqual(refcounts.eliminate_pairs(f), 0)
+
+    def test_block_store(self):
+        for between in (setindex, pop):
+            f = make_borrow(between)
+            self.assertEqual(refcounts.eliminate_pairs(f), 0)
+
+    def test_diamond(self):
+        f = make_borrow(incref, branch=True)
+        self.assertEqual(refcounts.eliminate_pairs(f), 1)
+        self.assertEqual(opcodes(f.startblock), ['cbranch'])
+        self.assertEqual(opcodes(f.get_block("then")), ['gc_incref', 'jump'])
+        self.assertEqual(opcodes(f.get_block("exit")), ['ret'])
+
+    def test_diamond_release(self):
+        f = make_borrow(release, branch=True)
+        self.assertEqual(refcounts.eliminate_pairs(f), 0)
+
+    def test_loop(self):
+        # incref in a loop, decref after it
+        f, b = make_function([ManagedList])
+        loop, exit = f.startblock, f.new_block("exit")
+        b.gc_incref(types.Void, [f.args[0]])
+        b.cbranch(Const(True, types.Bool), loop, exit)
+        b.position_at_end(exit)
+        b.gc_decref(types.Void, [f.args[0]])
+        b.ret(Const(0, types.Int32))
+        self.assertEqual(refcounts.eliminate_pairs(f), 0)
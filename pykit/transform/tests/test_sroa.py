@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+from __future__ import print_function, division, absolute_import
+
+import unittest
+
+from pykit import types
+from pykit.ir import opcodes, verify
+from pykit.analysis import cfa
+from pykit.transform import sroa
+from pykit.tests import make_function
+
+Point = types.Struct(['x', 'y'], [types.Int32, types.Int32])
+Line = types.Struct(['start', 'stop'], [Point, Point])
+
+class TestSROA(unittest.TestCase):
+
+    def test_split(self):
+        f, b = make_function([types.Int32, types.Int32])
+        a, c = f.args
+        p = b.alloca(types.Pointer(Point), [])
+        b.store(b.new_struct(Point, [[a, a]]), p)
+        b.setfield(types.Void, [p, 'y', c])
+        s = b.load(Point, [p])
+        x = b.getfield(types.Int32, [s, 'x'])
+        y = b.getfield(types.Int32, [p, 'y'])
+        b.ret(b.add(types.Int32, [x, y]))
+
+        self.assertEqual(sroa.sroa(f), 1)
+        verify(f)
+        self.assertNotIn('getfield', opcodes(f))
+        cfa.run(f)
+        self.assertEqual(opcodes(f), ['new_struct', 'add', 'ret'])
+        self.assertEqual(f.startblock.terminator.args[0].args, [a, c])
+
+    def test_nested(self):
+        f, b = make_function([types.Int32, types.Int32])
+        a, c = f.args
+        p = b.alloca(types.Pointer(Line), [])
+        b.store(b.new_struct(Line, [[b.new_struct(Point, [[a, c]]),
+                                     b.new_struct(Point, [[c, a]])]]), p)
+        line = b.load(Line, [p])
+        stop = b.getfield(Point, [line, 'stop'])
+        b.ret(b.getfield(types.Int32, [stop, 'x']))
+
+        self.assertEqual(sroa.sroa(f), 3) # line, start and stop
+        cfa.run(f)
+        self.assertEqual(f.startblock.terminator.args[0], c)
+
+    def test_store_after_load(self):
+        f, b = make_function([types.Int32, types.Int32])
+        a, c = f.args
+        p = b.alloca(types.Pointer(Point), [])
+        b.store(b.new_struct(Point, [[a, a]]), p)
+        s = b.load(Point, [p])
+        b.setfield(types.Void, [p, 'x', c])
+        b.ret(b.getfield(types.Int32, [s, 'x']))
+
+        self.assertEqual(sroa.sroa(f), 1)
+        verify(f)
+        cfa.run(f)
+        self.assertEqual(f.startblock.terminator.args[0], a)
+
+    def test_escaping(self):
+        f, b = make_function([types.Int32, types.Int32])
+        p = b.alloca(types.Pointer(Point), [])
+        b.ptrstore(types.Void, [p, b.new_struct(Point, [list(f.args)])])
+        b.ret(b.getfield(types.Int32, [p, 'x']))
+        self.assertEqual(sroa.sroa(f), 0)
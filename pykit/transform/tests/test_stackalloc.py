@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+from __future__ import print_function, division, absolute_import
+
+import unittest
+
+from pykit import types
+from pykit.ir import Const, opcodes, verify
+from pykit.transform import stackalloc
+from pykit.tests import make_function
+
+Pair = types.Tuple([types.Int32, types.Int32])
+Point = types.Struct(['x', 'y'], [types.Int32, types.Int32])
+
+class TestStackAllocation(unittest.TestCase):
+
+    def test_tuple(self):
+        f, b = make_function([types.Int32, types.Int32])
+        t = b.new_tuple(Pair, [list(f.args)])
+        b.gc_gotref(types.Void, [t])
+        x = b.getindex(types.Int32, [t, [Const(1, types.Int32)]])
+        b.ret(x)
+        stackalloc.run(f)
+        verify(f)
+        self.assertEqual(opcodes(f), ['ret'])
+        self.assertEqual(f.startblock.terminator.args[0], f.args[1])
+
+    def test_struct(self):
+        f, b = make_function([types.Int32, types.Int32])
+        a, c = f.args
+        s = b.new_struct(Point, [[a, a]])
+        b.setfield(types.Void, [s, 'y', c])
+        x = b.getfield(types.Int32, [s, 'x'])
+        y = b.getfield(types.Int32, [s, 'y'])
+        b.ret(b.add(types.Int32, [x, y]))
+        stackalloc.run(f)
+        verify(f)
+        self.assertEqual(opcodes(f), ['add', 'ret'])
+        self.assertEqual(f.startblock.head.args, [a, c])
+
+    def test_escaping(self):
+        f, b = make_function([types.Int32, types.Int32], Pair)
+        t = b.new_tuple(Pair, [list(f.args)])
+        b.ret(t)
+        stackalloc.run(f)
+        self.assertEqual(opcodes(f), ['new_tuple', 'ret'])
+
+    def test_dynamic_index(self):
+        f, b = make_function([types.Int32, types.Int32])
+        t = b.new_tuple(Pair, [list(f.args)])
+        b.ret(b.getindex(types.Int32, [t, [f.args[0]]]))
+        stackalloc.run(f)
+        self.assertEqual(opcodes(f), ['new_tuple', 'getindex', 'ret'])
@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+from __future__ import print_function, division, absolute_import
+
+import unittest
+import textwrap
+
+from pykit.analysis import cfa
+from pykit.parsing import from_c
+from pykit.transform import tailcall
+from pykit import types
+from pykit.ir import Const, findallops, verify, interp
+from pykit.tests import make_function
+
+source = textwrap.dedent("""
+#include <pykit_ir.h>
+
+Int32 sum(Int32 n, Int32 acc) {
+    if (n < 1) {
+        return acc;
+    }
+    Int32 m = n - 1;
+    Int32 a = acc + n;
+    Int32 x = call(sum, list(m, a));
+    return x;
+}
+
+Int32 fact(Int32 n) {
+    if (n < 2) {
+        return 1;
+    }
+    Int32 m = n - 1;
+    Int32 x = call(fact, list(m));
+    return n * x;
+}
+""")
+
+class TestTailCall(unittest.TestCase):
+
+    def setUp(self):
+        self.mod = from_c(source)
+        for func in self.mod.functions.values():
+            cfa.run(func)
+
+    def test_tailcall(self):
+        f = self.mod.get_function("sum")
+        self.assertEqual(tailcall.tailcall_to_loop(f), 1)
+        verify(f)
+        self.assertEqual(findallops(f, 'call'), [])
+        self.assertEqual(len(findallops(f.get_block('tailrec'), 'phi')), 2)
+        # deeper than the Python stack would allow for recursive calls
+        self.assertEqual(interp.run(f, args=[5000, 0]), 5000 * 5001 // 2)
+
+    def test_not_tailcall(self):
+        f = self.mod.get_function("fact")
+        self.assertEqual(tailcall.tailcall_to_loop(f), 0)
+        self.assertEqual(len(findallops(f, 'call')), 1)
+        self.assertEqual(interp.run(f, args=[5]), 120)
+
+    def test_escaping_alloca(self):
+        # Int32 f(Int32 *p, Int32 n) {
+        #     Int32 slot = n;
+        #     if (n < 1) return *p;
+        #     return f(&slot, n - 1);
+        # }
+        ptr = types.Pointer(types.Int32)
+        f, b = make_function([ptr, types.Int32], argnames=["p", "n"])
+        base, rec = f.new_block("base"), f.new_block("rec")
+        p, n = f.args
+        slot = b.alloca(ptr, [])
+        b.store(n, slot)
+        b.cbranch(b.lt(types.Bool, [n, Const(1, types.Int32)]), base, rec)
+        b.position_at_end(base)
+        b.ret(b.load(types.Int32, [p]))
+        b.position_at_end(rec)
+        m = b.sub(types.Int32, [n, Const(1, types.Int32)])
+        b.ret(b.call(types.Int32, [f, [slot, m]]))
+
+        self.assertEqual(tailcall.tailcall_to_loop(f), 0)
+        self.assertEqual(len(findallops(f, 'call')), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -2,26 +2,91 @@ from collections import namedtuple
 from pykit.utils import invert, hashable
 
 alltypes = set()
+interned = {} # { (cls, values, managed) : Type }
 
 class Type(object):
-    """Base of types"""
+    """
+    Base of types. Types are interned: constructing a type equal to an
+    existing one returns the existing instance, so types compare by
+    identity and hash in constant time. Types must not be mutated.
+    """
+
+    managed = False
+
+    def __new__(cls, *values, **kwds):
+        managed = kwds.pop('managed', False) # Managed by GC
+        if kwds:
+            values = _fieldvalues(cls, values, kwds)
+        key = values
+        if list in map(type, values):
+            # Lists of names or types
+            key = tuple([tuple(v) if type(v) is list else v for v in values])
+        key = (cls, key, managed)
+        self = interned.get(key)
+        if self is not None:
+            return self
+
+        self = super(Type, cls).__new__(cls, *values)
+        self.managed = managed
+        self._hash = hash(key)
+        interned[key] = self
+        return self
 
     def __init__(self, *values, **kwds):
-        self.managed = kwds.get('managed', False) # Managed by GC
+        pass
+
+    @classmethod
+    def _make(cls, iterable, *args):
+        return cls(*iterable)
+
+    def _replace(self, **kwds):
+        fields = dict(zip(self._fields, self))
+        fields.update(kwds)
+        fields.setdefault('managed', self.managed)
+        return type(self)(**fields)
 
     def __eq__(self, other):
-        return isinstance(other, type(self)) and super(Type, self).__eq__(other)
+        return self is other
 
     def __ne__(self, other):
-        return not isinstance(other, type(self)) or super(Type, self).__ne__(other)
+        return self is not other
 
     def __nonzero__(self):
         return True
 
     def __hash__(self):
-        obj = tuple(tuple(c) if isinstance(c, list) else c for c in self)
-        return hash(obj)
-
+        return self._hash
+
+    def __repr__(self):
+        result = super(Type, self).__repr__()
+        if self.managed:
+            sep = ", " if result[-2] != "(" else ""
+            result = result[:-1] + sep + "managed=True)"
+        return result
+
+    def __reduce__(self):
+        return (_construct, (type(self), tuple(self), self.managed))
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+def _fieldvalues(cls, values, kwds):
+    """Build the tuple of field values from positional and keyword values"""
+    values = list(values)
+    for name in cls._fields[len(values):]:
+        if name not in kwds:
+            raise TypeError("%s() missing argument %r" % (cls.__name__, name))
+        values.append(kwds.pop(name))
+    if kwds:
+        raise TypeError("%s() got unexpected keyword arguments: %s" % (
+            cls.__name__, ", ".join(sorted(kwds))))
+    return tuple(values)
+
+def _construct(cls, values, managed):
+    return cls(*values, managed=managed)
 
 def typetuple(name, elems):
     ty = type(name, (Type, namedtuple(name, elems)), {})
@@ -48,8 +113,8 @@ OpaqueT    = typetuple('Opaque',   []) # Some type we make zero assumptions abou
 # ObjectT    = typetuple('Object',   [])
 
 class Typedef(typetuple('Typedef',  ['name', 'type'])):
-    def __init__(self, name, ty):
-        setattr(self, 'is_' + type(ty).__name__.lower(), True)
+    def __init__(self, *values, **kwds):
+        setattr(self, 'is_' + type(self.type).__name__.lower(), True)
 
 for ty in alltypes:
     for ty2 in alltypes:
@@ -117,8 +182,8 @@ VirtualMethod = typetuple('VirtualMethod', ['obj_type'])
 # Parsing
 
 def parse_type(s):
-    from pykit.parsing import parser
-    return parser.build(parser.parse(s, parser.type_parser))
+    from pykit.parsing import irparser
+    return irparser.parse_type(s)
 
 # ______________________________________________________________________
 # Typeof
@@ -120,6 +120,14 @@ def make_temper():
             return varname
         return varname + str(count)
 
+    def reserve(name):
+        """Make sure `name` is never handed out"""
+        varname = name.rstrip(string.digits)
+        suffix = name[len(varname):]
+        count = int(suffix) + 1 if suffix else 1
+        temps[varname] = max(temps[varname], count)
+
+    temper.reserve = reserve
     return temper
 
 # ______________________________________________________________________
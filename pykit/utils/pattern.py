@@ -6,8 +6,9 @@ Taken and slightly adapted from lair/backend/pattern.py
 
 from __future__ import print_function, division, absolute_import
 
+import types
 import inspect
-from functools import partial
+import functools
 from collections import namedtuple
 
 Case = namedtuple('Case', ['pattern', 'function', 'argspec'])
@@ -18,11 +19,17 @@ class match(object):
     Pattern value of type `type` is matched using the builtin `isinstance`.
     Pattern value of type `Matcher` is used directly.
     Pattern value of other types is matched using `==`.
+
+    If all patterns are types, the case selected for the types of the
+    positional arguments is cached.
     '''
     def __init__(self, func):
+        functools.update_wrapper(self, func)
         self._generic = func
         self._cases = []
         self._argspec = inspect.getargspec(func)
+        self._cache = {} # { (type(arg), ...) : function }
+        self._cacheable = True
 
         assert not self._argspec.varargs, 'Thou shall not use *args'
         assert not self._argspec.keywords, 'Thou shall not use **kws'
@@ -36,13 +43,30 @@ class match(object):
                 patkws[arg] = pat
             case = Case(_prepare_pattern(patkws.items()), fn, argspec)
             self._cases.append(case)
+            self._cacheable = self._cacheable and all(
+                type(matcher) is InstanceOf for k, matcher in case.pattern)
+            self._cache.clear()
             return self
         return wrap
 
     def __get__(self, inst, type=None):
-        return partial(self, inst)
+        if inst is None:
+            return self
+        return types.MethodType(self, inst)
 
     def __call__(self, *args, **kwds):
+        if self._cacheable and not kwds:
+            key = tuple(map(type, args))
+            fn = self._cache.get(key)
+            if fn is None:
+                fn = self._dispatch(args, kwds)
+                if types.InstanceType not in key: # old-style classes
+                    self._cache[key] = fn
+            return fn(*args)
+        return self._dispatch(args, kwds)(*args, **kwds)
+
+    def _dispatch(self, args, kwds):
+        """Find the function of the last matching case"""
         for case in reversed(self._cases):
             kws = dict(kwds)
             _pack_args(case.argspec, args, kws)
@@ -50,9 +74,8 @@ class match(object):
                 if not matcher(kws[k]):
                     break
             else:
-                return case.function(*args, **kwds)
-        else:
-            return self._generic(*args, **kwds)
+                return case.function
+        return self._generic
 
 def _pack_args(argspec, args, kws):
     args = list(args)
@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+
+from __future__ import print_function, division, absolute_import
+import unittest
+
+from pykit.utils.pattern import match, custom
+
+@match
+def describe(x, y):
+    return "generic"
+
+@describe.case(x=int)
+def describe_int(x, y):
+    return "int"
+
+@describe.case(x=int, y=str)
+def describe_int_str(x, y):
+    return "int, str"
+
+class Obj(object):
+
+    @match
+    def get(self, x):
+        return "generic"
+
+    @get.case(x=list)
+    def get_list(self, x):
+        return "list"
+
+class TestMatch(unittest.TestCase):
+
+    def test_dispatch(self):
+        for i in range(2):
+            self.assertEqual(describe(1, 2), "int")
+            self.assertEqual(describe(1, "a"), "int, str")
+            self.assertEqual(describe(1.0, "a"), "generic")
+            self.assertEqual(describe(1, y="a"), "int, str")
+
+    def test_cache(self):
+        describe(1, 2)
+        self.assertEqual(describe._cache[int, int].__name__, 'describe_int')
+
+        @match
+        def f(x):
+            return "generic"
+
+        @f.case(x=custom(lambda x: x > 0))
+        def f_positive(x):
+            return "positive"
+
+        self.assertEqual(f(1), "positive")
+        self.assertEqual(f(-1), "generic")
+        self.assertEqual(f._cache, {})
+
+    def test_method(self):
+        obj = Obj()
+        self.assertEqual(obj.get(1), "generic")
+        self.assertEqual(obj.get([]), "list")
+        self.assertIs(Obj.get, Obj.__dict__['get'])
+
+
+if __name__ == '__main__':
+    unittest.main()